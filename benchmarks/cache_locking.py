@@ -0,0 +1,75 @@
+"""Multi-threaded cache stress benchmark.
+
+Compares striped locking (current implementation) with legacy per-key lock dictionary
+on high-cardinality workload: throughput and count of allocated locks.
+
+Usage:
+    python -m benchmarks.cache_locking
+"""
+
+import random
+import threading
+import time
+from threading import Lock
+
+from hiero_did_sdk_python.utils.cache import MemoryCache
+
+THREADS_COUNT = 8
+OPERATIONS_PER_THREAD = 100_000
+KEYS_CARDINALITY = 1_000_000
+
+
+class PerKeyLockMemoryCache[K, V](MemoryCache[K, V]):
+    """Legacy locking strategy - lock per key, never released"""
+
+    def __init__(self):
+        super().__init__()
+        self._key_locks = {}
+
+    def _get_lock(self, key: K) -> Lock:
+        if key not in self._key_locks:
+            self._key_locks[key] = Lock()
+
+        return self._key_locks[key]
+
+    def locks_count(self) -> int:
+        return len(self._key_locks)
+
+
+def _run_workload(cache: MemoryCache[int, int]) -> float:
+    def worker(seed: int):
+        rng = random.Random(seed)  # noqa: S311
+        for _ in range(OPERATIONS_PER_THREAD):
+            key = rng.randrange(KEYS_CARDINALITY)
+            if cache.get(key) is None:
+                cache.set(key, key, 60)
+            elif rng.random() < 0.1:
+                cache.remove(key)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS_COUNT)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return time.perf_counter() - start
+
+
+def main():
+    total_operations = THREADS_COUNT * OPERATIONS_PER_THREAD
+
+    striped_cache = MemoryCache[int, int]()
+    striped_duration = _run_workload(striped_cache)
+
+    per_key_cache = PerKeyLockMemoryCache[int, int]()
+    per_key_duration = _run_workload(per_key_cache)
+
+    print(f"{'strategy':>10} | {'ops/s':>12} | {'locks':>10}")
+    print(f"{'striped':>10} | {total_operations / striped_duration:>12.0f} | {len(striped_cache._locks):>10}")
+    print(f"{'per-key':>10} | {total_operations / per_key_duration:>12.0f} | {per_key_cache.locks_count():>10}")
+
+
+if __name__ == "__main__":
+    main()
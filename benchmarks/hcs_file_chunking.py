@@ -0,0 +1,102 @@
+"""HCS-1 file chunking benchmark.
+
+Compares chunk counts of current chunking (each message filled up to 1024 bytes with exact JSON envelope size)
+with legacy chunking (960 bytes of content per message) on synthetic credential definitions with realistic sizes:
+2048-bit CL-RSA numbers for primary value and BLS12-381 points for revocation value.
+
+Usage:
+    python -m benchmarks.hcs_file_chunking
+"""
+
+import math
+import secrets
+
+from hiero_did_sdk_python.anoncreds.models import (
+    AnonCredsCredDef,
+    CredDefValue,
+    CredDefValuePrimary,
+    CredDefValueRevocation,
+)
+from hiero_did_sdk_python.hcs.hcs_file import HcsFileChunkMessage, get_file_chunk_messages
+
+ATTRIBUTE_COUNTS = [3, 10, 25, 50]
+LEGACY_MAX_CHUNK_CONTENT_SIZE_IN_BYTES = 960
+ISSUER_ID = "did:hedera:testnet:zFAeKMsqnNc2bwEsC8oqENBvGqjpGu9tpUi3VWaFEBXBo_0.0.5896419"
+
+
+def _cl_number() -> str:
+    return str(secrets.randbits(2048))
+
+
+def _g1_point() -> str:
+    return " ".join(f"{index} {secrets.token_hex(32).upper()}" for index in (1, 1, 2))
+
+
+def _g2_point() -> str:
+    return " ".join(f"{index} {secrets.token_hex(32).upper()}" for index in (1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2))
+
+
+def _build_cred_def(attributes_count: int, with_revocation: bool) -> bytes:
+    attribute_names = ["master_secret", *(f"attribute_{index}" for index in range(attributes_count))]
+    primary = CredDefValuePrimary(
+        n=_cl_number(),
+        s=_cl_number(),
+        r={name: _cl_number() for name in attribute_names},
+        rctxt=_cl_number(),
+        z=_cl_number(),
+    )
+    revocation = (
+        CredDefValueRevocation(
+            g=_g1_point(),
+            g_dash=_g2_point(),
+            h=_g1_point(),
+            h0=_g1_point(),
+            h1=_g1_point(),
+            h2=_g1_point(),
+            htilde=_g1_point(),
+            h_cap=_g2_point(),
+            u=_g2_point(),
+            pk=_g1_point(),
+            y=_g2_point(),
+        )
+        if with_revocation
+        else None
+    )
+
+    cred_def = AnonCredsCredDef(
+        issuer_id=ISSUER_ID,
+        schema_id=f"{ISSUER_ID}/anoncreds/v0/SCHEMA/0.0.5896422",
+        tag="default",
+        value=CredDefValue(primary, revocation),
+    )
+    return cred_def.to_json().encode()
+
+
+def main():
+    print(
+        f"{'attributes':>10} | {'revocation':>10} | {'payload (B)':>11} | {'content (B)':>11} | "
+        f"{'legacy chunks':>13} | {'current chunks':>14} | {'saved':>6}"
+    )
+    for attributes_count in ATTRIBUTE_COUNTS:
+        for with_revocation in (False, True):
+            payload = _build_cred_def(attributes_count, with_revocation)
+            chunk_messages = get_file_chunk_messages(payload)
+
+            content_size = sum(len(message.content) for message in chunk_messages)
+            legacy_chunks_count = math.ceil(content_size / LEGACY_MAX_CHUNK_CONTENT_SIZE_IN_BYTES)
+            saved = 1 - len(chunk_messages) / legacy_chunks_count
+
+            if any(
+                len(message.to_json().encode()) > HcsFileChunkMessage.MAX_MESSAGE_SIZE_IN_BYTES
+                for message in chunk_messages
+            ):
+                raise Exception("Chunk message exceeds HCS message size")
+
+            print(
+                f"{attributes_count:>10} | {with_revocation!s:>10} | {len(payload):>11} | {content_size:>11} | "
+                f"{legacy_chunks_count:>13} | {len(chunk_messages):>14} | {saved:>6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""HCS-1 file reassembly benchmark.
+
+Compares current reassembly (preallocated content buffer, block-wise base64 decoding and streaming zstd decompression
+with on-the-fly hashing) with legacy implementation (string concatenation, one-shot decoding and decompression,
+separate hashing pass) on multi-megabyte files. Peak memory is measured with 'tracemalloc' (chunk messages excluded).
+
+Usage:
+    python -m benchmarks.hcs_file_reassembly
+"""
+
+import os
+import time
+import tracemalloc
+from hashlib import sha256
+
+from zstandard import ZstdDecompressor
+
+from hiero_did_sdk_python.hcs.constants import BASE64_JSON_CONTENT_PREFIX
+from hiero_did_sdk_python.hcs.hcs_file import (
+    HcsFileChunkMessage,
+    build_file_from_chunk_messages,
+    get_file_chunk_messages,
+)
+from hiero_did_sdk_python.utils.encoding import b64_to_bytes
+
+FILE_SIZES_MB = [1, 4, 16]
+REPEATS = 3
+
+
+def _build_payload(size_mb: int) -> bytes:
+    # Hex-encoded random bytes are compressed roughly twice, similarly to JSON documents with keys and signatures
+    return os.urandom(size_mb * 1024 * 1024 // 2).hex().encode()
+
+
+def _build_file_legacy(chunk_messages: list[HcsFileChunkMessage]) -> tuple[bytes, str]:
+    message_content: str = ""
+    for chunk_message in sorted(chunk_messages, key=lambda message: message.ordering_index):
+        message_content += chunk_message.content
+
+    compressed_payload = b64_to_bytes(message_content.removeprefix(BASE64_JSON_CONTENT_PREFIX))
+    payload = ZstdDecompressor().decompress(compressed_payload)
+    return payload, sha256(payload).hexdigest()
+
+
+def _build_file_current(chunk_messages: list[HcsFileChunkMessage]) -> tuple[bytes, str]:
+    payload_hash = sha256()
+    payload = build_file_from_chunk_messages(chunk_messages, payload_hash)
+    return payload, payload_hash.hexdigest()
+
+
+def _measure(build_file, chunk_messages: list[HcsFileChunkMessage], expected_hash: str) -> tuple[float, int]:
+    durations = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        _, payload_hash = build_file(chunk_messages)
+        durations.append(time.perf_counter() - start)
+        if payload_hash != expected_hash:
+            raise Exception("Reassembled payload is invalid")
+
+    tracemalloc.start()
+    build_file(chunk_messages)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(durations), peak_memory
+
+
+def main():
+    print(
+        f"{'size (MB)':>9} | {'chunks':>6} | {'legacy (s)':>10} | {'current (s)':>11} | {'legacy peak (MB)':>16} | {'current peak (MB)':>17}"
+    )
+    for size_mb in FILE_SIZES_MB:
+        payload = _build_payload(size_mb)
+        expected_hash = sha256(payload).hexdigest()
+        chunk_messages = get_file_chunk_messages(payload)
+
+        legacy_duration, legacy_peak = _measure(_build_file_legacy, chunk_messages, expected_hash)
+        current_duration, current_peak = _measure(_build_file_current, chunk_messages, expected_hash)
+
+        print(
+            f"{size_mb:>9} | {len(chunk_messages):>6} | {legacy_duration:>10.3f} | {current_duration:>11.3f} | "
+            f"{legacy_peak / 2**20:>16.1f} | {current_peak / 2**20:>17.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
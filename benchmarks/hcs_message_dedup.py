@@ -0,0 +1,79 @@
+"""HcsMessageResolver message handling benchmark.
+
+Compares current duplicate detection (set of hashes of raw message payloads) with legacy implementation
+(list of hashes of re-serialized messages) on synthetic revocation registry entry messages.
+Legacy implementation has quadratic complexity, so it's measured on smaller message counts only.
+
+Usage:
+    python -m benchmarks.hcs_message_dedup
+"""
+
+import logging
+import time
+from hashlib import sha256
+
+from hiero_did_sdk_python.anoncreds.models.revocation import HcsRevRegEntryMessage, RevRegEntryValue
+from hiero_did_sdk_python.hcs import HcsMessageResolver
+
+MESSAGE_COUNTS = [10_000, 100_000]
+LEGACY_MAX_MESSAGE_COUNT = 20_000
+MOCK_TOPIC_ID = "0.0.1"
+
+
+def _build_payloads(messages_count: int) -> list[bytes]:
+    return [
+        HcsRevRegEntryMessage(value=RevRegEntryValue(accum=f"accum-{n}", prev_accum=f"accum-{n - 1}", revoked=[n]))
+        .to_json()
+        .encode()
+        for n in range(messages_count)
+    ]
+
+
+def _measure_legacy(payloads: list[bytes]) -> float:
+    start = time.perf_counter()
+
+    received_message_hashes: list[str] = []
+    messages = []
+    for payload in payloads:
+        message = HcsRevRegEntryMessage.from_json(payload.decode())
+        message_hash = sha256(message.to_json().encode()).hexdigest()
+
+        if message_hash in received_message_hashes:
+            continue
+
+        received_message_hashes.append(message_hash)
+        messages.append(message)
+
+    return time.perf_counter() - start
+
+
+def _measure_current(payloads: list[bytes]) -> float:
+    resolver = HcsMessageResolver(MOCK_TOPIC_ID, HcsRevRegEntryMessage)
+
+    start = time.perf_counter()
+
+    for payload in payloads:
+        resolver._handle_message(HcsRevRegEntryMessage.from_payload_bytes(payload))
+
+    return time.perf_counter() - start
+
+
+def main():
+    # Duplicate warnings would dominate the measurement
+    logging.disable(logging.WARNING)
+
+    print(f"{'messages':>10} | {'legacy (s)':>10} | {'current (s)':>11}")
+    for messages_count in MESSAGE_COUNTS:
+        # Half of the messages are duplicates (replayed on stream reconnection)
+        unique_payloads = _build_payloads(messages_count // 2)
+        payloads = unique_payloads + unique_payloads
+
+        legacy_duration = _measure_legacy(payloads) if messages_count <= LEGACY_MAX_MESSAGE_COUNT else None
+        current_duration = _measure_current(payloads)
+
+        legacy_column = f"{legacy_duration:>10.3f}" if legacy_duration is not None else f"{'-':>10}"
+        print(f"{messages_count:>10} | {legacy_column} | {current_duration:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
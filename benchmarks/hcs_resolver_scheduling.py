@@ -0,0 +1,183 @@
+"""HcsMessageResolver idle timeout scheduling benchmark.
+
+Runs concurrent resolutions of silent topic streams (completed by idle timeout) and compares current event loop
+scheduling ('loop.call_later') with legacy implementation (re-armed 'threading.Timer' per resolution).
+Messages are delivered by a single feeder thread that simulates mirror node subscription callbacks,
+so measured thread count reflects idle timeout scheduling only.
+
+Usage:
+    python -m benchmarks.hcs_resolver_scheduling
+"""
+
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from datetime import UTC, datetime
+from threading import Timer
+from types import SimpleNamespace
+from typing import Self, cast
+
+from hiero_sdk_python import Client
+
+from hiero_did_sdk_python.anoncreds.models.revocation import HcsRevRegEntryMessage, RevRegEntryValue
+from hiero_did_sdk_python.hcs import HcsMessageResolver, HcsTopicTransport
+
+RESOLUTIONS_COUNT = 1_000
+MESSAGES_COUNT = 3
+MESSAGE_INTERVAL_SECONDS = 0.2
+TIMEOUT_SECONDS = 1.0
+THREAD_SAMPLING_INTERVAL_SECONDS = 0.01
+MOCK_TOPIC_ID = "0.0.1"
+
+
+class _Feeder:
+    """Delivers messages to all active subscriptions from a single thread."""
+
+    def __init__(self):
+        self._handlers = []
+        self._lock = threading.Lock()
+
+    def add(self, on_message):
+        with self._lock:
+            self._handlers.append(on_message)
+
+    def run(self):
+        for sequence_number in range(1, MESSAGES_COUNT + 1):
+            time.sleep(MESSAGE_INTERVAL_SECONDS)
+
+            payload = (
+                HcsRevRegEntryMessage(
+                    value=RevRegEntryValue(accum=f"accum-{sequence_number}", revoked=[sequence_number])
+                )
+                .to_json()
+                .encode()
+            )
+            response = SimpleNamespace(
+                contents=payload,
+                sequence_number=sequence_number,
+                consensus_timestamp=datetime.fromtimestamp(sequence_number, tz=UTC),
+            )
+
+            with self._lock:
+                handlers = list(self._handlers)
+
+            for on_message in handlers:
+                on_message(response)
+
+
+class _SilentTopicQuery:
+    def __init__(self, feeder: _Feeder):
+        self._feeder = feeder
+
+    def set_start_time(self, dt) -> Self:
+        return self
+
+    def set_end_time(self, dt) -> Self:
+        return self
+
+    def set_limit(self, limit) -> Self:
+        return self
+
+    def set_completion_handler(self, handler) -> Self:
+        # Stream is never closed, resolution completes by idle timeout
+        return self
+
+    def subscribe(self, client, on_message, on_error=None):
+        self._feeder.add(on_message)
+        return SimpleNamespace(cancel=lambda: None)
+
+
+class _FeederTransport(HcsTopicTransport):
+    def __init__(self, feeder: _Feeder):
+        self._feeder = feeder
+
+    def create_query(self, topic_id: str):
+        return _SilentTopicQuery(self._feeder)
+
+
+class _LegacyTimerResolver(HcsMessageResolver):
+    """Resolver with legacy idle timeout scheduling (new timer thread on each re-arm)."""
+
+    _legacy_timer: Timer | None = None
+
+    def _stop(self):
+        if self._legacy_timer:
+            self._legacy_timer.cancel()
+
+        self._topic_listener.unsubscribe()
+
+    def _wait_or_complete(self):
+        if self._is_completed:
+            return
+
+        time_diff = time.time() - self._last_message_arrival_time
+
+        if time_diff <= self._message_waiting_timeout:
+            if self._legacy_timer:
+                self._legacy_timer.cancel()
+            self._legacy_timer = Timer(self._message_waiting_timeout - time_diff, self._wait_or_complete)
+            self._legacy_timer.start()
+        else:
+            self._complete()
+
+
+async def _measure(resolver_class: type[HcsMessageResolver]) -> tuple[float, float, float, int]:
+    feeder = _Feeder()
+    transport = _FeederTransport(feeder)
+    client = cast(Client, None)
+
+    peak_threads_count = threading.active_count()
+    is_running = True
+
+    def sample_threads():
+        nonlocal peak_threads_count
+        while is_running:
+            peak_threads_count = max(peak_threads_count, threading.active_count())
+            time.sleep(THREAD_SAMPLING_INTERVAL_SECONDS)
+
+    sampler = threading.Thread(target=sample_threads, daemon=True)
+    sampler.start()
+
+    async def resolve() -> float:
+        start = time.perf_counter()
+        await resolver_class(
+            MOCK_TOPIC_ID, HcsRevRegEntryMessage, timeout_seconds=TIMEOUT_SECONDS, transport=transport
+        ).execute(client)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolutions = [asyncio.create_task(resolve()) for _ in range(RESOLUTIONS_COUNT)]
+
+    feeder_thread = threading.Thread(target=feeder.run, daemon=True)
+    feeder_thread.start()
+
+    latencies = sorted(await asyncio.gather(*resolutions))
+    total_duration = time.perf_counter() - start
+
+    is_running = False
+    sampler.join()
+
+    p99_latency = latencies[int(len(latencies) * 0.99) - 1]
+    return total_duration, statistics.median(latencies), p99_latency, peak_threads_count
+
+
+def main():
+    # Resolution logs are not relevant for the measurement
+    logging.disable(logging.WARNING)
+
+    # Expected latency: last message arrival + idle timeout
+    expected_latency = MESSAGES_COUNT * MESSAGE_INTERVAL_SECONDS + TIMEOUT_SECONDS
+
+    print(f"{RESOLUTIONS_COUNT} concurrent resolutions, expected latency {expected_latency:.2f}s")
+    print(f"{'scheduling':>12} | {'total (s)':>9} | {'p50 (s)':>7} | {'p99 (s)':>7} | {'peak threads':>12}")
+    for name, resolver_class in [("legacy", _LegacyTimerResolver), ("current", HcsMessageResolver)]:
+        total_duration, p50_latency, p99_latency, peak_threads_count = asyncio.run(_measure(resolver_class))
+        print(
+            f"{name:>12} | {total_duration:>9.3f} | {p50_latency:>7.3f} | {p99_latency:>7.3f} | {peak_threads_count:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
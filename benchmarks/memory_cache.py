@@ -0,0 +1,46 @@
+"""MemoryCache hit latency microbenchmark.
+
+Usage:
+    python -m benchmarks.memory_cache
+"""
+
+import random
+import time
+
+from hiero_did_sdk_python.utils.cache import MemoryCache
+
+ENTRY_COUNTS = [1_000, 100_000, 1_000_000]
+LOOKUPS_COUNT = 100_000
+
+
+def _measure_hit_latency(entries_count: int) -> tuple[float, float]:
+    cache = MemoryCache[int, str]()
+
+    for n in range(entries_count):
+        # Spread expiration timestamps, so the expiration index is not trivially ordered
+        cache.set(n, str(n), 3600 + random.random() * 3600)  # noqa: S311
+
+    keys = [random.randrange(entries_count) for _ in range(LOOKUPS_COUNT)]  # noqa: S311
+
+    start = time.perf_counter()
+    for key in keys:
+        cache.get(key)
+    get_latency = (time.perf_counter() - start) / LOOKUPS_COUNT
+
+    start = time.perf_counter()
+    for key in keys:
+        cache.set(key, str(key))
+    set_latency = (time.perf_counter() - start) / LOOKUPS_COUNT
+
+    return get_latency, set_latency
+
+
+def main():
+    print(f"{'entries':>10} | {'get (us)':>10} | {'set (us)':>10}")
+    for entries_count in ENTRY_COUNTS:
+        get_latency, set_latency = _measure_hit_latency(entries_count)
+        print(f"{entries_count:>10} | {get_latency * 1e6:>10.3f} | {set_latency * 1e6:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,11 @@ from .anoncreds import (
     RevRegDefValue,
 )
 from .did import DidDocument, DidErrorCode, DidException, HederaDid, HederaDidResolver
+from .utils.async_cache import AsyncCache
 from .utils.cache import Cache, MemoryCache
 from .utils.logger import LogLevel, configure_logger
+from .utils.sqlite_cache import SqliteCache
+from .utils.tiered_cache import TieredCache
 
 LOG_LEVEL = os.environ.get("HEDERA_DID_SDK_LOG_LEVEL", None)
 LOG_FORMAT = os.environ.get("HEDERA_DID_SDK_LOG_FORMAT", None)
@@ -41,5 +44,8 @@ __all__ = [
     "RevRegDefValue",
     "AnonCredsRevList",
     "Cache",
+    "AsyncCache",
     "MemoryCache",
+    "SqliteCache",
+    "TieredCache",
 ]
@@ -1,21 +1,27 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from itertools import chain
-from typing import cast
+from typing import Protocol, cast
 
 from hiero_sdk_python import Client, PrivateKey, Timestamp, TopicMessageSubmitTransaction
 from hiero_sdk_python.transaction.transaction import Transaction
 
 from ..hcs import (
+    HcsFileCompression,
     HcsFileService,
     HcsMessageResolver,
     HcsMessageTransaction,
     HcsMessageWithResponseMetadata,
+    HcsTopicCursor,
     HcsTopicOptions,
     HcsTopicService,
+    HcsTopicTransport,
 )
 from ..hcs.constants import MAX_TRANSACTION_FEE
-from ..utils.cache import Cache, MemoryCache
+from ..utils.async_cache import AnyCache, cache_get, cache_set
+from ..utils.cache import MemoryCache
+from ..utils.cache_stats import CacheEvent, CacheStats, CacheStatsCollector, CacheStatsListener
+from ..utils.negative_cache import NegativeCache
 from .models import (
     AnonCredsCredDef,
     AnonCredsRevList,
@@ -44,32 +50,79 @@ from .utils import AnonCredsObjectType, build_anoncreds_identifier, parse_anoncr
 
 LOGGER = logging.getLogger(__name__)
 
+# Object types of resolved AnonCreds objects with tracked cache stats
+STATS_OBJECT_TYPES = (
+    AnonCredsObjectType.SCHEMA,
+    AnonCredsObjectType.PUBLIC_CRED_DEF,
+    AnonCredsObjectType.REV_REG,
+    AnonCredsObjectType.REV_REG_ENTRY,
+)
+
+
+class _ResolutionResult(Protocol):
+    resolution_metadata: dict
+
+
+def _is_identifier_valid(identifier: str, object_type: AnonCredsObjectType) -> bool:
+    try:
+        return parse_anoncreds_identifier(identifier).object_type == object_type
+    except Exception:
+        return False
+
 
 class HederaAnonCredsRegistry:
     """Anoncreds objects registry (resolver + registrar) implementation that leverage Hedera HCS as VDR.
 
     Args:
         client: Hedera Client
-        cache_instance: Custom cache instance. If not provided, in-memory cache is used
+        cache_instance: Custom cache instance (synchronous or asynchronous). If not provided, in-memory cache is used
+        negative_cache_instance: Custom cache instance for failed resolutions. If not provided, default negative cache is used
+        cache_stats_listener: Callback invoked on cache events (hits, misses and loads) of resolved objects
+        transport: Mirror node transport for revocation registry entries reads. gRPC streaming is used by default,
+            'HcsTopicSubscriptionManager' can be used to share subscriptions between concurrent resolutions
+        file_compression: Compression options of HCS-1 files (schemas, credential and revocation registry definitions)
     """
 
     def __init__(
         self,
         client: Client,
-        cache_instance: Cache[str, object] | None = None,
+        cache_instance: AnyCache[str, object] | None = None,
+        negative_cache_instance: NegativeCache[str, object] | None = None,
+        cache_stats_listener: CacheStatsListener | None = None,
+        transport: HcsTopicTransport | None = None,
+        file_compression: HcsFileCompression | None = None,
     ):
         self._client = client
-        self._hcs_file_service = HcsFileService(client)
+        self._transport = transport
+        self._hcs_file_service = HcsFileService(client, compression=file_compression)
         self._hcs_topic_service = HcsTopicService(client)
 
         cache_instance = cache_instance or MemoryCache[str, object]()
 
-        self._schema_cache: Cache[str, AnonCredsSchema] = cast(Cache[str, AnonCredsSchema], cache_instance)
-        self._cred_def_cache: Cache[str, AnonCredsCredDef] = cast(Cache[str, AnonCredsCredDef], cache_instance)
-        self._rev_reg_def_cache: Cache[str, RevRegDefWithHcsMetadata] = cast(
-            Cache[str, RevRegDefWithHcsMetadata], cache_instance
-        )
-        self._rev_reg_entries_messages_cache = cast(Cache[str, list[HcsMessageWithResponseMetadata]], cache_instance)
+        self._schema_cache = cast(AnyCache[str, AnonCredsSchema], cache_instance)
+        self._cred_def_cache = cast(AnyCache[str, AnonCredsCredDef], cache_instance)
+        self._rev_reg_def_cache = cast(AnyCache[str, RevRegDefWithHcsMetadata], cache_instance)
+        self._rev_reg_entries_messages_cache = cast(AnyCache[str, list[HcsMessageWithResponseMetadata]], cache_instance)
+
+        # Failed resolutions are cached separately, keyed by object type and identifier
+        self._negative_cache: NegativeCache[str, object] = negative_cache_instance or NegativeCache[str, object]()
+
+        # Objects of different types share cache instance, so stats are tracked per object type
+        self._stats = {
+            object_type: CacheStatsCollector(object_type, [cache_stats_listener] if cache_stats_listener else None)
+            for object_type in STATS_OBJECT_TYPES
+        }
+
+    def get_cache_stats(self) -> dict[str, CacheStats]:
+        """Get cache stats of resolved objects.
+
+        Lookup is considered a hit if object is returned without network requests.
+        Revocation list lookups are tracked under revocation registry entry type.
+
+        Returns:
+            object: Dictionary with cache stats per object type
+        """
+        return {object_type: stats.snapshot() for object_type, stats in self._stats.items()}
 
     async def get_schema(self, schema_id: str) -> GetSchemaResult:
         """Get a schema from the registry.
@@ -80,6 +133,9 @@ class HederaAnonCredsRegistry:
         Returns:
             object: Schema resolution result
         """
+        return await self._resolve_with_negative_cache(AnonCredsObjectType.SCHEMA, schema_id, self._get_schema)
+
+    async def _get_schema(self, schema_id: str) -> GetSchemaResult:
         try:
             parsed_identifier = parse_anoncreds_identifier(schema_id)
 
@@ -95,12 +151,16 @@ class HederaAnonCredsRegistry:
 
             schema_topic_id = parsed_identifier.topic_id
 
-            cached_schema = self._schema_cache.get(schema_topic_id)
+            cached_schema = await cache_get(self._schema_cache, schema_topic_id)
 
             if cached_schema:
+                self._stats[AnonCredsObjectType.SCHEMA].record(CacheEvent.HIT)
                 schema = cached_schema
             else:
-                schema_payload = await self._hcs_file_service.resolve_file(parsed_identifier.topic_id)
+                self._stats[AnonCredsObjectType.SCHEMA].record(CacheEvent.MISS)
+
+                with self._stats[AnonCredsObjectType.SCHEMA].measure_load():
+                    schema_payload = await self._hcs_file_service.resolve_file(parsed_identifier.topic_id)
                 schema = AnonCredsSchema.from_json(schema_payload.decode()) if schema_payload else None
 
                 if not schema:
@@ -113,7 +173,7 @@ class HederaAnonCredsRegistry:
                         schema_metadata={},
                     )
 
-                self._schema_cache.set(schema_topic_id, schema)
+                await cache_set(self._schema_cache, schema_topic_id, schema)
 
             return GetSchemaResult(schema=schema, schema_id=schema_id, resolution_metadata={}, schema_metadata={})
         except Exception as error:
@@ -167,6 +227,11 @@ class HederaAnonCredsRegistry:
         Returns:
             object: Credential definition resolution result
         """
+        return await self._resolve_with_negative_cache(
+            AnonCredsObjectType.PUBLIC_CRED_DEF, cred_def_id, self._get_cred_def
+        )
+
+    async def _get_cred_def(self, cred_def_id: str) -> GetCredDefResult:
         try:
             parsed_identifier = parse_anoncreds_identifier(cred_def_id)
 
@@ -182,12 +247,16 @@ class HederaAnonCredsRegistry:
 
             cred_def_topic_id = parsed_identifier.topic_id
 
-            cached_cred_def = self._cred_def_cache.get(cred_def_topic_id)
+            cached_cred_def = await cache_get(self._cred_def_cache, cred_def_topic_id)
 
             if cached_cred_def:
+                self._stats[AnonCredsObjectType.PUBLIC_CRED_DEF].record(CacheEvent.HIT)
                 cred_def = cached_cred_def
             else:
-                cred_def_payload = await self._hcs_file_service.resolve_file(cred_def_topic_id)
+                self._stats[AnonCredsObjectType.PUBLIC_CRED_DEF].record(CacheEvent.MISS)
+
+                with self._stats[AnonCredsObjectType.PUBLIC_CRED_DEF].measure_load():
+                    cred_def_payload = await self._hcs_file_service.resolve_file(cred_def_topic_id)
                 cred_def = AnonCredsCredDef.from_json(cred_def_payload.decode()) if cred_def_payload else None
 
                 if not cred_def:
@@ -200,7 +269,7 @@ class HederaAnonCredsRegistry:
                         credential_definition_metadata={},
                     )
 
-                self._cred_def_cache.set(cred_def_topic_id, cred_def)
+                await cache_set(self._cred_def_cache, cred_def_topic_id, cred_def)
 
             return GetCredDefResult(
                 credential_definition=cred_def,
@@ -263,6 +332,11 @@ class HederaAnonCredsRegistry:
         Returns:
             object: Revocation registry definition resolution result
         """
+        return await self._resolve_with_negative_cache(
+            AnonCredsObjectType.REV_REG, revocation_registry_definition_id, self._get_rev_reg_def
+        )
+
+    async def _get_rev_reg_def(self, revocation_registry_definition_id: str) -> GetRevRegDefResult:
         try:
             parsed_identifier = parse_anoncreds_identifier(revocation_registry_definition_id)
 
@@ -278,12 +352,16 @@ class HederaAnonCredsRegistry:
 
             rev_reg_def_topic_id = parsed_identifier.topic_id
 
-            cached_rev_reg_def_with_metadata = self._rev_reg_def_cache.get(rev_reg_def_topic_id)
+            cached_rev_reg_def_with_metadata = await cache_get(self._rev_reg_def_cache, rev_reg_def_topic_id)
 
             if cached_rev_reg_def_with_metadata:
+                self._stats[AnonCredsObjectType.REV_REG].record(CacheEvent.HIT)
                 rev_reg_def_with_metadata = cached_rev_reg_def_with_metadata
             else:
-                rev_reg_def_payload = await self._hcs_file_service.resolve_file(rev_reg_def_topic_id)
+                self._stats[AnonCredsObjectType.REV_REG].record(CacheEvent.MISS)
+
+                with self._stats[AnonCredsObjectType.REV_REG].measure_load():
+                    rev_reg_def_payload = await self._hcs_file_service.resolve_file(rev_reg_def_topic_id)
                 rev_reg_def_with_metadata = (
                     RevRegDefWithHcsMetadata.from_json(rev_reg_def_payload.decode()) if rev_reg_def_payload else None
                 )
@@ -298,7 +376,7 @@ class HederaAnonCredsRegistry:
                         revocation_registry_definition_metadata={},
                     )
 
-                self._rev_reg_def_cache.set(rev_reg_def_topic_id, rev_reg_def_with_metadata)
+                await cache_set(self._rev_reg_def_cache, rev_reg_def_topic_id, rev_reg_def_with_metadata)
 
             return GetRevRegDefResult(
                 revocation_registry_definition=rev_reg_def_with_metadata.rev_reg_def,
@@ -344,7 +422,7 @@ class HederaAnonCredsRegistry:
 
             # We want to cache registry definition right away
             # Helps to avoid potential cases where issuer pushes rev entries immediately but registry definition data (HCS-1 messages) is not propagated to mirror nodes yet
-            self._rev_reg_def_cache.set(rev_reg_def_topic_id, rev_reg_def_with_metadata)
+            await cache_set(self._rev_reg_def_cache, rev_reg_def_topic_id, rev_reg_def_with_metadata)
 
             return RegisterRevRegDefResult(
                 revocation_registry_definition_state=RevRegDefState(
@@ -403,11 +481,14 @@ class HederaAnonCredsRegistry:
                     revocation_list_metadata={},
                 )
 
-            cached_messages = self._rev_reg_entries_messages_cache.get(entries_topic_id)
+            stats = self._stats[AnonCredsObjectType.REV_REG_ENTRY]
+
+            cached_messages = await cache_get(self._rev_reg_entries_messages_cache, entries_topic_id)
             if cached_messages:
                 last_cached_message_timestamp = cached_messages[-1].consensus_timestamp
 
                 if last_cached_message_timestamp.seconds >= timestamp:
+                    stats.record(CacheEvent.HIT)
                     borderline_timestamp = Timestamp(seconds=timestamp, nanos=0)
                     entries_messages = filter(
                         lambda message: message.consensus_timestamp.seconds < timestamp
@@ -430,13 +511,17 @@ class HederaAnonCredsRegistry:
                         revocation_list_metadata={},
                     )
                 else:
-                    new_messages = await HcsMessageResolver(
-                        topic_id=entries_topic_id,
-                        message_type=HcsRevRegEntryMessage,
-                        timestamp_from=last_cached_message_timestamp,
-                        timestamp_to=Timestamp(seconds=timestamp, nanos=0),
-                        include_response_metadata=True,
-                    ).execute(self._client)
+                    stats.record(CacheEvent.MISS)
+
+                    with stats.measure_load():
+                        new_messages = await HcsMessageResolver(
+                            topic_id=entries_topic_id,
+                            message_type=HcsRevRegEntryMessage,
+                            resume_after=HcsTopicCursor.from_message(cached_messages[-1]),
+                            timestamp_to=Timestamp(seconds=timestamp, nanos=0),
+                            include_response_metadata=True,
+                            transport=self._transport,
+                        ).execute(self._client)
 
                     # Note: 'chain' function is used instead of lists sum due to significantly better performance on large lists
                     # See: https://docs.python.org/3/library/itertools.html, https://stackoverflow.com/a/41772165
@@ -446,7 +531,7 @@ class HederaAnonCredsRegistry:
                         else cached_messages
                     )
 
-                    self._rev_reg_entries_messages_cache.set(entries_topic_id, entries_messages)
+                    await cache_set(self._rev_reg_entries_messages_cache, entries_topic_id, entries_messages)
 
                     entries = [cast(AnonCredsRevRegEntry, message.message) for message in entries_messages]
 
@@ -459,37 +544,42 @@ class HederaAnonCredsRegistry:
                         revocation_list_metadata={},
                     )
 
-            entries_messages = await HcsMessageResolver(
-                topic_id=entries_topic_id,
-                message_type=HcsRevRegEntryMessage,
-                timestamp_to=Timestamp(seconds=timestamp, nanos=0),
-                include_response_metadata=True,
-            ).execute(self._client)
+            stats.record(CacheEvent.MISS)
 
-            if len(entries_messages) == 0:
-                # If returned entries list is empty, we need to fetch the first message and check if list is registered
-                # It's possible that requested timestamp is before the actual registration of rev list -> we want to return initial state for the list (by adding first message to entries)
-
-                # The second request looks redundant here, but it should be the rare case that will be subsequently handled by cache
+            with stats.measure_load():
                 entries_messages = await HcsMessageResolver(
                     topic_id=entries_topic_id,
                     message_type=HcsRevRegEntryMessage,
-                    limit=1,
+                    timestamp_to=Timestamp(seconds=timestamp, nanos=0),
                     include_response_metadata=True,
+                    transport=self._transport,
                 ).execute(self._client)
 
                 if len(entries_messages) == 0:
-                    return GetRevListResult(
-                        revocation_registry_id=rev_reg_id,
-                        resolution_metadata={
-                            "error": "notFound",
-                            "message": f"Registered revocation list for registry id '{rev_reg_id}' is not found",
-                        },
-                        revocation_list_metadata={},
-                    )
+                    # If returned entries list is empty, we need to fetch the first message and check if list is registered
+                    # It's possible that requested timestamp is before the actual registration of rev list -> we want to return initial state for the list (by adding first message to entries)
+
+                    # The second request looks redundant here, but it should be the rare case that will be subsequently handled by cache
+                    entries_messages = await HcsMessageResolver(
+                        topic_id=entries_topic_id,
+                        message_type=HcsRevRegEntryMessage,
+                        limit=1,
+                        include_response_metadata=True,
+                        transport=self._transport,
+                    ).execute(self._client)
+
+            if len(entries_messages) == 0:
+                return GetRevListResult(
+                    revocation_registry_id=rev_reg_id,
+                    resolution_metadata={
+                        "error": "notFound",
+                        "message": f"Registered revocation list for registry id '{rev_reg_id}' is not found",
+                    },
+                    revocation_list_metadata={},
+                )
 
             entries_messages = cast(list[HcsMessageWithResponseMetadata], entries_messages)
-            self._rev_reg_entries_messages_cache.set(entries_topic_id, entries_messages)
+            await cache_set(self._rev_reg_entries_messages_cache, entries_topic_id, entries_messages)
 
             entries = [cast(AnonCredsRevRegEntry, message.message) for message in entries_messages]
 
@@ -557,6 +647,26 @@ class HederaAnonCredsRegistry:
                 revocation_list_metadata={},
             )
 
+    async def _resolve_with_negative_cache[R: _ResolutionResult](
+        self, object_type: AnonCredsObjectType, identifier: str, resolve: Callable[[str], Awaitable[R]]
+    ) -> R:
+        cache_key = f"{object_type}:{identifier}"
+        cached_result = self._negative_cache.get(cache_key)
+
+        if cached_result:
+            return cast(R, cached_result)
+
+        result = await resolve(identifier)
+        error = result.resolution_metadata.get("error", None)
+
+        # Other errors can be transient (network issues, timeouts, etc.), so they are not cached
+        if error and not _is_identifier_valid(identifier, object_type):
+            self._negative_cache.set_invalid(cache_key, result)
+        elif error == "notFound":
+            self._negative_cache.set_not_found(cache_key, result)
+
+        return result
+
     async def _submit_rev_list_entry(
         self,
         rev_list: AnonCredsRevList,
@@ -106,7 +106,70 @@ class DidDocument(Serializable):
 
     @classmethod
     def from_json_payload(cls, payload: dict):
-        raise Exception("DidDocument deserialization is not implemented")
+        match payload:
+            case {"id": id_, **document}:
+                did_document = cls(id_)
+                did_document.context = document.get(DidDocumentJsonProperties.CONTEXT, DID_DOCUMENT_CONTEXT)
+
+                verification_methods = list(document.get(DidDocumentJsonProperties.VERIFICATION_METHOD, []))
+                assertion_methods = list(document.get(DidDocumentJsonProperties.ASSERTION_METHOD, []))
+                authentication_methods = list(document.get(DidDocumentJsonProperties.AUTHENTICATION, []))
+
+                # Controller verification method is always inserted as the first item of document verification methods,
+                # along with its reference in assertion and authentication relationships (see 'get_json_payload')
+                if verification_methods and "#did-root-key" in verification_methods[0]["id"]:
+                    controller = verification_methods.pop(0)
+                    controller_id = controller["id"]
+
+                    if assertion_methods and assertion_methods[0] == controller_id:
+                        assertion_methods.pop(0)
+                    if authentication_methods and authentication_methods[0] == controller_id:
+                        authentication_methods.pop(0)
+
+                    did_document.controller = controller
+                    did_document._public_key = PublicKey.from_bytes(b58_to_bytes(controller["publicKeyBase58"]))
+
+                did_document.verification_methods = {
+                    verification_method["id"]: verification_method for verification_method in verification_methods
+                }
+                did_document.services = {
+                    service["id"]: service for service in document.get(DidDocumentJsonProperties.SERVICE, [])
+                }
+
+                did_document.verification_relationships[DidDocumentJsonProperties.ASSERTION_METHOD] = assertion_methods
+                did_document.verification_relationships[DidDocumentJsonProperties.AUTHENTICATION] = (
+                    authentication_methods
+                )
+                for relationship_type in (
+                    DidDocumentJsonProperties.KEY_AGREEMENT,
+                    DidDocumentJsonProperties.CAPABILITY_INVOCATION,
+                    DidDocumentJsonProperties.CAPABILITY_DELEGATION,
+                ):
+                    did_document.verification_relationships[relationship_type] = list(
+                        document.get(relationship_type, [])
+                    )
+
+                return did_document
+            case _:
+                raise Exception(f"{cls.__name__} JSON parsing failed: Invalid JSON structure")
+
+    def __getstate__(self) -> dict:
+        # Stable serialized form used by persistent caches (and pickle)
+        # Document metadata is not a part of JSON payload, so it's stored separately
+        return {
+            "document": self.get_json_payload(),
+            "created": self.created.isoformat() if self.created else None,
+            "updated": self.updated.isoformat() if self.updated else None,
+            "deactivated": self.deactivated,
+        }
+
+    def __setstate__(self, state: dict):
+        restored_document = DidDocument.from_json_payload(state["document"])
+        self.__dict__.update(vars(restored_document))
+
+        self.created = datetime.fromisoformat(state["created"]) if state["created"] else None
+        self.updated = datetime.fromisoformat(state["updated"]) if state["updated"] else None
+        self.deactivated = state["deactivated"]
 
     def get_json_payload(self):
         root_object: dict = {
@@ -4,13 +4,21 @@ from typing import cast
 from hiero_sdk_python import Client, PrivateKey, PublicKey, TopicMessageSubmitTransaction
 from hiero_sdk_python.transaction.transaction import Transaction
 
-from ..hcs import HcsMessageResolver, HcsMessageTransaction, HcsTopicOptions, HcsTopicService
+from ..hcs import (
+    HcsMessageResolver,
+    HcsMessageTransaction,
+    HcsMessageWithResponseMetadata,
+    HcsTopicCursor,
+    HcsTopicOptions,
+    HcsTopicService,
+)
 from ..hcs.constants import MAX_TRANSACTION_FEE
+from ..hcs.utils import is_topic_not_found_error
 from ..utils.encoding import multibase_encode
 from ..utils.keys import get_key_type
 from .did_document import DidDocument
 from .did_document_operation import DidDocumentOperation
-from .did_error import DidException
+from .did_error import DidErrorCode, DidException
 from .hcs import HcsDidMessageEnvelope
 from .hcs.events import HcsDidEvent
 from .hcs.events.document import HcsDidDeleteEvent
@@ -63,6 +71,8 @@ class HederaDid:
             self.topic_id = None
 
         self.document: DidDocument | None = None
+        # Position of the last processed DID topic message, allows to resume resolution from it
+        self.topic_cursor: HcsTopicCursor | None = None
 
     async def register(self):
         """Register (create) DID instance in Hedera network"""
@@ -70,9 +80,14 @@ class HederaDid:
             raise DidException("Private key is required to register new DID")
 
         if self.identifier:
-            document = await self.resolve()
-            if document.controller:
-                raise DidException("DID is already registered")
+            try:
+                document = await self.resolve()
+                if document.controller:
+                    raise DidException("DID is already registered")
+            except DidException as error:
+                # DID document can be created in existing topic
+                if error.code != DidErrorCode.DID_NOT_FOUND:
+                    raise
         else:
             topic_options = HcsTopicOptions(
                 admin_key=self._private_key.public_key(), submit_key=self._private_key.public_key()
@@ -136,16 +151,35 @@ class HederaDid:
         """
         Resolve DID document for registered instance.
 
+        Raises 'DidException' with 'DID_NOT_FOUND' code if DID topic does not exist or DID document is not created in it.
+
         Returns:
             object: DID document
         """
         if not self.topic_id or not self.identifier:
             raise DidException("DID is not registered")
 
-        result = await HcsMessageResolver(self.topic_id, HcsDidMessageEnvelope).execute(self._client)
-        await self._handle_resolution_result(cast(list[HcsDidMessageEnvelope], result))
+        try:
+            result = await HcsMessageResolver(
+                self.topic_id, HcsDidMessageEnvelope, include_response_metadata=True
+            ).execute(self._client)
+        except Exception as error:
+            if is_topic_not_found_error(error):
+                raise DidException(f"DID topic is not found: {self.topic_id}", DidErrorCode.DID_NOT_FOUND) from error
+            raise
+
+        messages = cast(list[HcsMessageWithResponseMetadata], result)
+
+        await self._handle_resolution_result([cast(HcsDidMessageEnvelope, message.message) for message in messages])
+        self.topic_cursor = HcsTopicCursor.from_messages(messages)
+
+        document = cast(DidDocument, self.document)
+
+        # Deactivated documents have no controller, but they were created
+        if not document.controller and not document.deactivated:
+            raise DidException(f"DID document is not found: {self.identifier}", DidErrorCode.DID_NOT_FOUND)
 
-        return cast(DidDocument, self.document)
+        return document
 
     async def delete(self):
         """Delete (deactivate) registered DID instance."""
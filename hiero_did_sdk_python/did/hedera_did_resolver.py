@@ -1,20 +1,52 @@
+import asyncio
+import logging
 import time
+from dataclasses import dataclass
 from enum import StrEnum
+from functools import partial
 from typing import cast
 
 from hiero_sdk_python import Client, Timestamp
 
 from ..did.utils import parse_identifier
+from ..hcs.hcs_message import HcsMessageWithResponseMetadata
 from ..hcs.hcs_message_resolver import HcsMessageResolver
-from ..utils.cache import Cache, MemoryCache, TimestampedRecord
+from ..hcs.hcs_topic_cursor import HcsTopicCursor
+from ..hcs.hcs_topic_transport import HcsTopicTransport
+from ..utils.async_cache import AnyCache, cache_get, cache_set
+from ..utils.cache import MemoryCache, TimestampedRecord, seconds
+from ..utils.cache_stats import CacheEvent, CacheStats, CacheStatsCollector, CacheStatsListener
+from ..utils.negative_cache import NegativeCache
 from .did_document import DidDocument
 from .did_error import DidErrorCode, DidException
 from .hcs.hcs_did_message import HcsDidMessageEnvelope
 from .hedera_did import HederaDid
 from .types import DIDDocument, DIDDocumentMetadata, DIDResolutionResult
 
+LOGGER = logging.getLogger(__name__)
+
 INSERTION_THRESHOLD_SECONDS = float(10)
 
+DEFAULT_MAX_CONCURRENT_REFRESHES = 16
+
+DID_DOCUMENT_STATS_NAME = "didDocument"
+
+
+@dataclass
+class DidDocumentRecord(TimestampedRecord[DidDocument]):
+    """Cached DID document with position of the last processed DID topic message.
+
+    Attributes:
+        topic_cursor: Position of the last processed message. Refreshes resolve only subsequent messages
+    """
+
+    topic_cursor: HcsTopicCursor | None = None
+
+
+def _get_topic_cursor(record: TimestampedRecord[DidDocument]) -> HcsTopicCursor | None:
+    # Records cached by previous SDK versions (for example, in persistent cache) do not track topic position
+    return record.topic_cursor if isinstance(record, DidDocumentRecord) else None
+
 
 class DidResolutionError(StrEnum):
     """Enum for DID resolution errors"""
@@ -57,73 +89,91 @@ def _get_error_description(error: Exception):
             return DidResolutionError.UNKNOWN.value
 
 
+def _get_error_result(error: Exception) -> DIDResolutionResult:
+    return {
+        "didResolutionMetadata": {
+            "error": _get_error_description(error),
+            "message": str(error),  # pyright: ignore - this is not in spec, but may be helpful
+        },
+        "didDocumentMetadata": {},
+        "didDocument": None,
+    }
+
+
 class HederaDidResolver:
     """Hedera DID Resolver implementation.
 
+    Cached DID documents are refreshed (with topic messages submitted since the last known update) once they are older than
+    'INSERTION_THRESHOLD_SECONDS'. By default, caller waits for the refresh to complete.
+
+    In stale-while-revalidate mode, cached DID document is returned immediately and refreshed in background,
+    unless it's older than 'max_staleness' (in that case, caller waits for the refresh as usual).
+
     Args:
         client: Hedera Client
-        cache_instance: Custom cache instance. If not provided, in-memory cache is used
+        cache_instance: Custom cache instance (synchronous or asynchronous). If not provided, in-memory cache is used
+        stale_while_revalidate: Return cached DID documents immediately and refresh them in background
+        max_staleness: Max age (in seconds) of cached DID document that can be returned without waiting for refresh.
+            Unlimited if not set. Used only in stale-while-revalidate mode
+        max_concurrent_refreshes: Max count of concurrent background refreshes. Used only in stale-while-revalidate mode
+        negative_cache_instance: Custom cache instance for failed resolutions. If not provided, default negative cache is used
+        cache_stats_listener: Callback invoked on DID document cache events (hits, misses and loads)
+        transport: Mirror node transport for refreshes of cached DID documents. gRPC streaming is used by default,
+            'HcsTopicSubscriptionManager' can be used to share subscriptions between concurrent resolutions
     """
 
     def __init__(
         self,
         client: Client,
-        cache_instance: Cache[str, TimestampedRecord[DidDocument]] | None = None,
+        cache_instance: AnyCache[str, TimestampedRecord[DidDocument]] | None = None,
+        stale_while_revalidate: bool = False,
+        max_staleness: seconds | None = None,
+        max_concurrent_refreshes: int = DEFAULT_MAX_CONCURRENT_REFRESHES,
+        negative_cache_instance: NegativeCache[str, Exception] | None = None,
+        cache_stats_listener: CacheStatsListener | None = None,
+        transport: HcsTopicTransport | None = None,
     ):
         self._client = client
-        self._cache = cache_instance or MemoryCache[str, TimestampedRecord[DidDocument]]()
+        self._transport = transport
+        self._cache: AnyCache[str, TimestampedRecord[DidDocument]] = (
+            cache_instance or MemoryCache[str, TimestampedRecord[DidDocument]]()
+        )
+
+        # Failed resolutions are cached separately, keyed by DID identifier
+        self._negative_cache: NegativeCache[str, Exception] = negative_cache_instance or NegativeCache[str, Exception]()
+
+        self._stats = CacheStatsCollector(
+            DID_DOCUMENT_STATS_NAME, [cache_stats_listener] if cache_stats_listener else None
+        )
+
+        self._stale_while_revalidate = stale_while_revalidate
+        self._max_staleness = max_staleness
+        self._max_concurrent_refreshes = max_concurrent_refreshes
+
+        # In-flight DID document resolutions, keyed by topic ID
+        self._pending_resolutions: dict[str, asyncio.Future[DidDocument]] = {}
+        self._background_refreshes: set[asyncio.Future[DidDocument]] = set()
 
     async def resolve(self, did: str) -> DIDResolutionResult:
         """
         Resolve DID document by identifier.
 
+        Concurrent resolutions of the same DID are coalesced - only one topic subscription is made, and its result is shared by callers.
+
         Args:
             did: DID identifier to resolve
 
         Returns:
             object: DID resolution result
         """
-        try:
-            parsed_identifier = parse_identifier(did)
-            topic_id = parsed_identifier.topic_id
+        cached_error = self._negative_cache.get(did)
 
-            timestamped_record: TimestampedRecord | None = self._cache.get(topic_id)
+        if cached_error:
+            return _get_error_result(cached_error)
 
-            if timestamped_record:
-                now = time.time()
-                last_updated_timestamp: float = timestamped_record.timestamp
-                did_document: DidDocument = timestamped_record.data
-
-                if (now - last_updated_timestamp) > INSERTION_THRESHOLD_SECONDS:
-                    result = await HcsMessageResolver(
-                        topic_id,
-                        HcsDidMessageEnvelope,
-                        timestamp_from=Timestamp(int(last_updated_timestamp), 0),
-                    ).execute(self._client)
-
-                    await did_document.process_messages(cast(list[HcsDidMessageEnvelope], result))
-
-                    self._cache.set(
-                        topic_id,
-                        TimestampedRecord(
-                            did_document,
-                            did_document.version_timestamp.timestamp()
-                            if did_document.version_timestamp
-                            else time.time(),
-                        ),
-                    )
-            else:
-                registered_did = HederaDid(identifier=did, client=self._client)
-
-                did_document = await registered_did.resolve()
-
-                self._cache.set(
-                    topic_id,
-                    TimestampedRecord(
-                        did_document,
-                        did_document.version_timestamp.timestamp() if did_document.version_timestamp else time.time(),
-                    ),
-                )
+        try:
+            parsed_identifier = parse_identifier(did)
+            did_document = await self._get_did_document(did, parsed_identifier.topic_id)
 
             document_meta: dict = {"deactivated": did_document.deactivated}
 
@@ -143,11 +193,140 @@ class HederaDidResolver:
                 "didDocument": cast(DIDDocument, did_document.get_json_payload()),
             }
         except Exception as error:
-            return {
-                "didResolutionMetadata": {
-                    "error": _get_error_description(error),
-                    "message": str(error),  # pyright: ignore - this is not in spec, but may be helpful
-                },
-                "didDocumentMetadata": {},
-                "didDocument": None,
-            }
+            self._cache_error(did, error)
+            return _get_error_result(error)
+
+    def _cache_error(self, did: str, error: Exception):
+        # Other errors can be transient (network issues, timeouts, etc.), so they are not cached
+        if not isinstance(error, DidException):
+            return
+
+        match error.code:
+            case DidErrorCode.INVALID_DID_STRING | DidErrorCode.INVALID_NETWORK:
+                self._negative_cache.set_invalid(did, error)
+            case DidErrorCode.DID_NOT_FOUND:
+                self._negative_cache.set_not_found(did, error)
+
+    def get_cache_stats(self) -> dict[str, CacheStats]:
+        """Get DID document cache stats.
+
+        Lookup is considered a hit if DID document is returned without waiting for network requests.
+        Loads include both initial resolutions and refreshes of cached DID documents.
+
+        Returns:
+            object: Dictionary with cache stats per object type
+        """
+        return {self._stats.name: self._stats.snapshot()}
+
+    async def _get_did_document(self, did: str, topic_id: str) -> DidDocument:
+        timestamped_record: TimestampedRecord | None = await cache_get(self._cache, topic_id)
+
+        if not timestamped_record:
+            self._stats.record(CacheEvent.MISS)
+            return await asyncio.shield(self._get_pending_resolution(did, topic_id, None))
+
+        # Record timestamp is the time of the last DID document refresh
+        record_age = time.time() - timestamped_record.timestamp
+
+        if record_age <= INSERTION_THRESHOLD_SECONDS:
+            self._stats.record(CacheEvent.HIT)
+            return timestamped_record.data
+
+        if self._can_serve_stale(record_age):
+            self._stats.record(CacheEvent.HIT)
+            self._schedule_background_refresh(did, topic_id, timestamped_record)
+            return timestamped_record.data
+
+        self._stats.record(CacheEvent.MISS)
+        return await asyncio.shield(self._get_pending_resolution(did, topic_id, timestamped_record))
+
+    def _can_serve_stale(self, record_age: float) -> bool:
+        return self._stale_while_revalidate and (self._max_staleness is None or record_age <= self._max_staleness)
+
+    def _schedule_background_refresh(self, did: str, topic_id: str, timestamped_record: TimestampedRecord):
+        if topic_id in self._pending_resolutions:
+            return
+
+        # Refresh is skipped if the limit is reached, it will be scheduled again on subsequent resolution
+        if len(self._background_refreshes) >= self._max_concurrent_refreshes:
+            return
+
+        refresh = self._get_pending_resolution(did, topic_id, timestamped_record)
+        refresh.add_done_callback(self._on_background_refresh_done)
+        self._background_refreshes.add(refresh)
+
+    def _on_background_refresh_done(self, refresh: asyncio.Future[DidDocument]):
+        self._background_refreshes.discard(refresh)
+
+        if not refresh.cancelled() and refresh.exception():
+            LOGGER.warning(f"Background DID document refresh failed: {refresh.exception()!s}")
+
+    def _get_pending_resolution(
+        self, did: str, topic_id: str, timestamped_record: TimestampedRecord | None
+    ) -> asyncio.Future[DidDocument]:
+        pending_resolution = self._pending_resolutions.get(topic_id, None)
+
+        if not pending_resolution:
+            pending_resolution = asyncio.ensure_future(self._fetch_did_document(did, topic_id, timestamped_record))
+            pending_resolution.add_done_callback(partial(self._on_resolution_done, topic_id))
+            self._pending_resolutions[topic_id] = pending_resolution
+
+        # Resolution is shared between callers, so it should be shielded from cancellation by callers
+        return pending_resolution
+
+    def _on_resolution_done(self, topic_id: str, resolution: asyncio.Future[DidDocument]):
+        if self._pending_resolutions.get(topic_id, None) is resolution:
+            del self._pending_resolutions[topic_id]
+
+        # Mark exception as retrieved, it's propagated to awaiting callers (if any)
+        if not resolution.cancelled():
+            resolution.exception()
+
+    async def _fetch_did_document(
+        self, did: str, topic_id: str, timestamped_record: TimestampedRecord | None
+    ) -> DidDocument:
+        refresh_timestamp = time.time()
+
+        with self._stats.measure_load():
+            if timestamped_record:
+                did_document: DidDocument = timestamped_record.data
+                topic_cursor = _get_topic_cursor(timestamped_record)
+
+                if topic_cursor:
+                    resolver = HcsMessageResolver(
+                        topic_id,
+                        HcsDidMessageEnvelope,
+                        include_response_metadata=True,
+                        transport=self._transport,
+                        resume_after=topic_cursor,
+                    )
+                else:
+                    # Records cached without topic position are refreshed from the last document update (second precision)
+                    last_updated_timestamp = (
+                        did_document.version_timestamp.timestamp()
+                        if did_document.version_timestamp
+                        else timestamped_record.timestamp
+                    )
+                    resolver = HcsMessageResolver(
+                        topic_id,
+                        HcsDidMessageEnvelope,
+                        timestamp_from=Timestamp(int(last_updated_timestamp), 0),
+                        include_response_metadata=True,
+                        transport=self._transport,
+                    )
+
+                messages = cast(list[HcsMessageWithResponseMetadata], await resolver.execute(self._client))
+
+                await did_document.process_messages([
+                    cast(HcsDidMessageEnvelope, message.message) for message in messages
+                ])
+                topic_cursor = HcsTopicCursor.from_messages(messages, default=topic_cursor)
+            else:
+                registered_did = HederaDid(identifier=did, client=self._client)
+
+                did_document = await registered_did.resolve()
+                topic_cursor = registered_did.topic_cursor
+
+        await cache_set(self._cache, topic_id, DidDocumentRecord(did_document, refresh_timestamp, topic_cursor))
+
+        return did_document
@@ -1,10 +1,21 @@
-from .hcs_file import HcsFileChunkMessage, HcsFileService
+from .hcs_bulk_message_resolver import HcsBulkMessageResolver, HcsTopicResolutionJob, HcsTopicResolutionResult
+from .hcs_file import (
+    HcsFileChunkMessage,
+    HcsFileChunkReceipt,
+    HcsFileCompression,
+    HcsFileService,
+    train_compression_dictionary,
+)
 from .hcs_message import HcsMessage, HcsMessageWithResponseMetadata
 from .hcs_message_envelope import HcsMessageEnvelope
-from .hcs_message_resolver import HcsMessageResolver
+from .hcs_message_resolver import HcsMessageBufferStats, HcsMessageResolver
 from .hcs_message_transaction import HcsMessageTransaction
+from .hcs_mirror_rest_transport import HcsMirrorRestTransport
+from .hcs_topic_cursor import HcsTopicCursor
 from .hcs_topic_listener import HcsTopicListener
 from .hcs_topic_service import HcsTopicOptions, HcsTopicService
+from .hcs_topic_subscription_manager import HcsTopicSubscriptionManager, get_default_subscription_manager
+from .hcs_topic_transport import HcsGrpcTransport, HcsTopicTransport
 from .utils import execute_hcs_query_async, execute_hcs_transaction_async, sign_hcs_transaction_async
 
 __all__ = [
@@ -12,10 +23,23 @@ __all__ = [
     "HcsMessageWithResponseMetadata",
     "HcsMessageEnvelope",
     "HcsMessageResolver",
+    "HcsMessageBufferStats",
+    "HcsBulkMessageResolver",
+    "HcsTopicResolutionJob",
+    "HcsTopicResolutionResult",
     "HcsMessageTransaction",
     "HcsTopicListener",
+    "HcsTopicCursor",
+    "HcsTopicTransport",
+    "HcsGrpcTransport",
+    "HcsMirrorRestTransport",
+    "HcsTopicSubscriptionManager",
+    "get_default_subscription_manager",
     "HcsFileService",
     "HcsFileChunkMessage",
+    "HcsFileChunkReceipt",
+    "HcsFileCompression",
+    "train_compression_dictionary",
     "HcsTopicService",
     "HcsTopicOptions",
     "execute_hcs_transaction_async",
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from hiero_sdk_python import Client, Timestamp
+
+from .hcs_message import HcsMessage
+from .hcs_message_resolver import DEFAULT_TIMEOUT_SECONDS, HcsMessageResolver, ResolvedMessage
+from .hcs_topic_transport import HcsTopicTransport
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class HcsTopicResolutionJob:
+    """Topic messages resolution job.
+
+    Attributes:
+        topic_id: HCS topic ID
+        message_type: Type of topic messages
+        timestamp_from: Consensus timestamp to resolve messages from
+        timestamp_to: Consensus timestamp to resolve messages to. Current time is used if not provided
+        limit: Max count of resolved messages
+        include_response_metadata: Include sequence numbers and consensus timestamps of resolved messages
+        deadline_seconds: Max duration (in seconds) of job resolution. Overrides default deadline of bulk resolver
+    """
+
+    topic_id: str
+    message_type: type[HcsMessage]
+    timestamp_from: Timestamp | None = None
+    timestamp_to: Timestamp | None = None
+    limit: int | None = None
+    include_response_metadata: bool = False
+    deadline_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class HcsTopicResolutionResult:
+    """Result of topic messages resolution job. Contains either resolved messages or resolution error."""
+
+    job: HcsTopicResolutionJob
+    messages: list[ResolvedMessage] | None = None
+    error: Exception | None = None
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
+
+
+class HcsBulkMessageResolver:
+    """Resolves messages of multiple HCS topics with bounded concurrency.
+
+    Failures are reported per job - failed (or timed out) jobs do not affect the results of other jobs.
+    Job deadline is measured from the start of job resolution, time spent waiting for a free concurrency slot is not included.
+
+    Args:
+        jobs: Topic messages resolution jobs
+        max_concurrency: Max count of concurrently resolved topics
+        deadline_seconds: Default max duration (in seconds) of job resolution. Unlimited if not set
+        timeout_seconds: Fallback idle timeout (in seconds) of topic resolutions
+        transport: Mirror node transport. gRPC streaming is used by default
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[HcsTopicResolutionJob],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        deadline_seconds: float | None = None,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        transport: HcsTopicTransport | None = None,
+    ):
+        if max_concurrency < 1:
+            raise Exception("Max concurrency must be a positive number")
+
+        self._jobs = list(jobs)
+        self._max_concurrency = max_concurrency
+        self._deadline_seconds = deadline_seconds
+        self._timeout_seconds = timeout_seconds
+        self._transport = transport
+
+    async def execute(self, client: Client) -> list[HcsTopicResolutionResult]:
+        """Resolve messages of all topics
+
+        Args:
+            client: Hedera Client
+
+        Returns:
+            object: List of job results (in the order of jobs)
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        return await asyncio.gather(*(self._resolve(client, job, semaphore) for job in self._jobs))
+
+    async def _resolve(
+        self, client: Client, job: HcsTopicResolutionJob, semaphore: asyncio.Semaphore
+    ) -> HcsTopicResolutionResult:
+        deadline_seconds = job.deadline_seconds if job.deadline_seconds is not None else self._deadline_seconds
+
+        async with semaphore:
+            resolver = HcsMessageResolver(
+                job.topic_id,
+                job.message_type,
+                timeout_seconds=self._timeout_seconds,
+                timestamp_from=job.timestamp_from,
+                timestamp_to=job.timestamp_to,
+                limit=job.limit,
+                include_response_metadata=job.include_response_metadata,
+                transport=self._transport,
+            )
+
+            try:
+                # Cancelled resolution unsubscribes from the topic
+                async with asyncio.timeout(deadline_seconds):
+                    messages = await resolver.execute(client)
+            except TimeoutError:
+                LOGGER.warning(f"Resolution of topic {job.topic_id} messages exceeded deadline of {deadline_seconds}s")
+                return HcsTopicResolutionResult(
+                    job, error=Exception(f"Deadline of {deadline_seconds}s exceeded for topic {job.topic_id}")
+                )
+            except Exception as error:
+                LOGGER.warning(f"Failed to resolve messages of topic {job.topic_id}: {error!s}")
+                return HcsTopicResolutionResult(job, error=error)
+
+        return HcsTopicResolutionResult(job, messages=messages)
@@ -1,5 +1,14 @@
 from .hcs_file_chunk_message import HcsFileChunkMessage
-from .hcs_file_service import HcsFileService
+from .hcs_file_compression import HcsFileCompression, train_compression_dictionary
+from .hcs_file_service import HcsFileChunkReceipt, HcsFileService
 from .utils import build_file_from_chunk_messages, get_file_chunk_messages
 
-__all__ = ["HcsFileService", "HcsFileChunkMessage", "get_file_chunk_messages", "build_file_from_chunk_messages"]
+__all__ = [
+    "HcsFileService",
+    "HcsFileChunkReceipt",
+    "HcsFileChunkMessage",
+    "HcsFileCompression",
+    "train_compression_dictionary",
+    "get_file_chunk_messages",
+    "build_file_from_chunk_messages",
+]
@@ -4,13 +4,30 @@ from ..hcs_message import HcsMessage
 
 
 class HcsFileChunkMessage(HcsMessage):
-    # 1024 bytes is a max size for HCS transaction (non-chunked) + we're reserving some space for JSON structural characters - 64 bytes
-    MAX_CHUNK_CONTENT_SIZE_IN_BYTES: ClassVar[int] = 960
+    # 1024 bytes is a max size of HCS message (non-chunked transaction)
+    MAX_MESSAGE_SIZE_IN_BYTES: ClassVar[int] = 1024
+    # Size of JSON structure ('{"o":<ordering index>,"c":"<content>"}') without ordering index digits and content
+    MESSAGE_ENVELOPE_SIZE_IN_BYTES: ClassVar[int] = 13
 
     def __init__(self, ordering_index: int, chunk_content: str):
         self.ordering_index = ordering_index
         self.content = chunk_content
 
+    @classmethod
+    def get_max_content_size(cls, ordering_index: int) -> int:
+        """Get max size of chunk content that fits HCS message
+
+        Chunk content (base64 with data URI prefix) does not require escaping in JSON, so envelope size depends only
+        on count of ordering index digits.
+
+        Args:
+            ordering_index: Ordering index of the chunk
+
+        Returns:
+            object: Max size of chunk content in bytes
+        """
+        return cls.MAX_MESSAGE_SIZE_IN_BYTES - cls.MESSAGE_ENVELOPE_SIZE_IN_BYTES - len(str(ordering_index))
+
     def is_valid(self, topic_id: str | None = None) -> bool:
         return bool(self.ordering_index is not None and self.ordering_index >= 0 and self.content)
 
@@ -0,0 +1,84 @@
+import re
+from dataclasses import dataclass
+
+from zstandard import ZstdCompressionDict, train_dictionary
+
+DEFAULT_COMPRESSION_LEVEL = 3
+DEFAULT_DICTIONARY_SIZE = 16 * 1024
+
+ZSTD_COMPRESSION_FORMAT = "zstd"
+ZSTD_DICTIONARY_COMPRESSION_FORMAT_REGEX = re.compile("^zstd-dict-(\\d+)$")
+
+
+@dataclass(frozen=True)
+class HcsFileCompression:
+    """Compression options of HCS-1 files.
+
+    Files compressed with dictionary are marked with dictionary ID in topic memo ('<hash>:zstd-dict-<id>:base64'),
+    so dictionary must be distributed to all resolvers of such files. Files compressed without dictionary
+    ('<hash>:zstd:base64') can always be resolved.
+
+    Attributes:
+        level: Zstd compression level
+        dictionary: Zstd dictionary used to compress submitted files (see 'train_compression_dictionary')
+        decompression_dictionaries: Additional dictionaries used to resolve files (for example, previous dictionaries)
+    """
+
+    level: int = DEFAULT_COMPRESSION_LEVEL
+    dictionary: ZstdCompressionDict | None = None
+    decompression_dictionaries: tuple[ZstdCompressionDict, ...] = ()
+
+    def __post_init__(self):
+        # Raw content dictionaries have no ID, so files compressed with them can't be identified
+        if self.dictionary and not self.dictionary.dict_id():
+            raise Exception("Compression dictionary must have ID (trained or loaded from zstd dictionary format)")
+
+    @property
+    def compression_format(self) -> str:
+        """Compression format stored in topic memo"""
+        if not self.dictionary:
+            return ZSTD_COMPRESSION_FORMAT
+
+        return f"{ZSTD_COMPRESSION_FORMAT}-dict-{self.dictionary.dict_id()}"
+
+    def get_decompression_dictionary(self, compression_format: str) -> ZstdCompressionDict | None:
+        """Get dictionary required to decompress files in given format
+
+        Args:
+            compression_format: Compression format from topic memo
+
+        Returns:
+            object: Zstd dictionary, None if format does not use dictionary
+        """
+        if compression_format == ZSTD_COMPRESSION_FORMAT:
+            return None
+
+        format_match = ZSTD_DICTIONARY_COMPRESSION_FORMAT_REGEX.match(compression_format)
+        if not format_match:
+            raise Exception(f"Unsupported HCS file compression format: {compression_format}")
+
+        dictionary_id = int(format_match.group(1))
+        for dictionary in (self.dictionary, *self.decompression_dictionaries):
+            if dictionary and dictionary.dict_id() == dictionary_id:
+                return dictionary
+
+        raise Exception(f"Compression dictionary {dictionary_id} is not available")
+
+
+def train_compression_dictionary(
+    samples: list[bytes], dictionary_size: int = DEFAULT_DICTIONARY_SIZE, level: int = DEFAULT_COMPRESSION_LEVEL
+) -> ZstdCompressionDict:
+    """Train zstd dictionary for HCS-1 files
+
+    Args:
+        samples: Corpus of typical file payloads (for example, serialized AnonCreds schemas and credential definitions)
+        dictionary_size: Max size of dictionary in bytes
+        level: Compression level the dictionary is optimized for
+
+    Returns:
+        object: Zstd dictionary. Use 'as_bytes' to store it and 'ZstdCompressionDict(data)' to load it
+    """
+    try:
+        return train_dictionary(dictionary_size, samples, level=level)
+    except Exception as error:
+        raise Exception(f"Error on training HCS-1 file compression dictionary: {error!s}") from error
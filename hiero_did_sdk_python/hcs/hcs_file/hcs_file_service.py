@@ -1,64 +1,214 @@
+import asyncio
 import logging
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from hashlib import sha256
 from typing import cast
 
-from hiero_sdk_python import Client, PrivateKey, TopicMessageSubmitTransaction
+from hiero_sdk_python import Client, PrivateKey, TopicMessageSubmitTransaction, TransactionReceipt
 from hiero_sdk_python.transaction.transaction import Transaction
+from zstandard import ZstdCompressionDict
 
-from ..constants import MAX_TRANSACTION_FEE
+from ..constants import BASE64_JSON_CONTENT_PREFIX, MAX_TRANSACTION_FEE
+from ..hcs_message import HcsMessage
 from ..hcs_message_resolver import HcsMessageResolver
 from ..hcs_message_transaction import HcsMessageTransaction
 from ..hcs_topic_service import HcsTopicOptions, HcsTopicService
+from ..utils import is_topic_not_found_error
 from .hcs_file_chunk_message import HcsFileChunkMessage
+from .hcs_file_compression import HcsFileCompression
 from .utils import build_file_from_chunk_messages, get_file_chunk_messages
 
 READ_TOPIC_MESSAGES_TIMEOUT_SECONDS = float(5)
 
-HCS_FILE_TOPIC_MEMO_REGEX = re.compile("^[A-Fa-f0-9]{64}:zstd:base64$")
+DEFAULT_MAX_IN_FLIGHT_CHUNKS = 8
+DEFAULT_MAX_CHUNK_RETRIES = 2
+CHUNK_RETRY_BACKOFF_SECONDS = float(1)
+
+HCS_FILE_TOPIC_MEMO_REGEX = re.compile("^[A-Fa-f0-9]{64}:zstd(-dict-\\d+)?:base64$")
 
 LOGGER = logging.getLogger(__name__)
 
 
-class HcsFileService:
-    """Provides API for managing files on Hedera HCS according to HCS-1 standard"""
+@dataclass(frozen=True)
+class HcsFileChunkReceipt:
+    """Receipt of submitted HCS file chunk.
+
+    Attributes:
+        ordering_index: Ordering index of the chunk
+        receipt: Receipt of chunk message transaction
+        attempts: Count of submission attempts (including retries)
+    """
+
+    ordering_index: int
+    receipt: TransactionReceipt
+    attempts: int
+
+
+class _HcsFileCompletionChecker:
+    """Checks whether resolved chunks form complete HCS file.
+
+    Payload is assembled only once chunks are contiguous, the last chunk is not full-sized (all chunks except the last
+    one are filled up to HCS message size) and total content length is valid for base64 content,
+    so payload is effectively assembled once. Assembled payload is verified against the hash from topic memo.
+    Files with full-sized last chunk are resolved on the end of topic stream.
+    """
+
+    def __init__(self, expected_payload_hash: str, dictionary: ZstdCompressionDict | None):
+        self._expected_payload_hash = expected_payload_hash
+        self._dictionary = dictionary
+        self._chunk_messages: dict[int, HcsFileChunkMessage] = {}
+        self._content_length = 0
+        self.payload: bytes | None = None
+
+    def __call__(self, message: HcsMessage) -> bool:
+        chunk_message = cast(HcsFileChunkMessage, message)
+
+        if chunk_message.ordering_index in self._chunk_messages:
+            return False
+
+        self._chunk_messages[chunk_message.ordering_index] = chunk_message
+        self._content_length += len(chunk_message.content)
+
+        last_index = max(self._chunk_messages)
+        if last_index != len(self._chunk_messages) - 1:
+            return False
+
+        last_chunk_size = len(self._chunk_messages[last_index].content)
+        if last_chunk_size >= HcsFileChunkMessage.get_max_content_size(last_index):
+            return False
+
+        if (self._content_length - len(BASE64_JSON_CONTENT_PREFIX)) % 4 != 0:
+            return False
 
-    def __init__(self, client: Client):
+        payload_hash = sha256()
+        try:
+            payload = build_file_from_chunk_messages(
+                list(self._chunk_messages.values()), payload_hash, self._dictionary
+            )
+        except Exception:
+            return False
+
+        if payload_hash.hexdigest() != self._expected_payload_hash:
+            return False
+
+        self.payload = payload
+        return True
+
+
+class HcsFileService:
+    """Provides API for managing files on Hedera HCS according to HCS-1 standard
+
+    File chunks are submitted concurrently - chunks carry ordering index, so they don't need to reach consensus in order.
+
+    Args:
+        client: Hedera Client
+        max_in_flight_chunks: Max count of chunk transactions awaiting consensus receipts at the same time
+        max_chunk_retries: Max count of retries for each failed chunk transaction
+        compression: File compression options (for example, zstd dictionary). Default zstd compression is used
+            if not provided
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        max_in_flight_chunks: int = DEFAULT_MAX_IN_FLIGHT_CHUNKS,
+        max_chunk_retries: int = DEFAULT_MAX_CHUNK_RETRIES,
+        compression: HcsFileCompression | None = None,
+    ):
         self._client = client
         self._hcs_topic_service = HcsTopicService(client)
-
-    async def submit_file(self, payload: bytes, submit_key_der: str) -> str:
-        """Submit new file to HCS"""
+        self._max_in_flight_chunks = max_in_flight_chunks
+        self._max_chunk_retries = max_chunk_retries
+        self._compression = compression or HcsFileCompression()
+
+    async def submit_file(
+        self,
+        payload: bytes,
+        submit_key_der: str,
+        chunk_receipt_handler: Callable[[HcsFileChunkReceipt], None] | None = None,
+    ) -> str:
+        """Submit new file to HCS
+
+        Args:
+            payload: File payload
+            submit_key_der: DER-encoded private key used as topic submit key
+            chunk_receipt_handler: Handler invoked with receipt of each submitted chunk (in order of completion)
+
+        Returns:
+            object: File topic ID
+        """
         try:
             submit_key = PrivateKey.from_string(submit_key_der)
             payload_hash = sha256(payload).hexdigest()
 
-            topic_memo = f"{payload_hash}:zstd:base64"
+            topic_memo = f"{payload_hash}:{self._compression.compression_format}:base64"
             topic_options = HcsTopicOptions(submit_key=submit_key.public_key(), topic_memo=topic_memo)
 
             topic_id = await self._hcs_topic_service.create_topic(topic_options, [submit_key])
 
-            chunk_messages = get_file_chunk_messages(payload)
+            chunk_messages = get_file_chunk_messages(payload, self._compression)
+            in_flight_chunks = asyncio.Semaphore(self._max_in_flight_chunks)
 
-            for message in chunk_messages:
+            async def submit_chunk(message: HcsFileChunkMessage):
+                async with in_flight_chunks:
+                    chunk_receipt = await self._submit_chunk(topic_id, message, submit_key)
 
-                def build_message_submit_transaction(
-                    message_submit_transaction: TopicMessageSubmitTransaction,
-                ) -> Transaction:
-                    message_submit_transaction.transaction_fee = MAX_TRANSACTION_FEE.to_tinybars()  # pyright: ignore [reportAttributeAccessIssue]
-                    return message_submit_transaction.freeze_with(self._client).sign(submit_key)
+                if chunk_receipt_handler:
+                    chunk_receipt_handler(chunk_receipt)
 
-                await HcsMessageTransaction(topic_id, message, build_message_submit_transaction).execute(self._client)
+            try:
+                # Remaining chunks are cancelled once any chunk fails after all retries
+                async with asyncio.TaskGroup() as task_group:
+                    for message in chunk_messages:
+                        task_group.create_task(submit_chunk(message))
+            except ExceptionGroup as error_group:
+                raise error_group.exceptions[0] from None
 
             return topic_id
         except Exception as error:
             LOGGER.error(f"Error on submitting new file to HCS: {error!s}")
             raise error
 
+    async def _submit_chunk(
+        self, topic_id: str, message: HcsFileChunkMessage, submit_key: PrivateKey
+    ) -> HcsFileChunkReceipt:
+        def build_message_submit_transaction(message_submit_transaction: TopicMessageSubmitTransaction) -> Transaction:
+            message_submit_transaction.transaction_fee = MAX_TRANSACTION_FEE.to_tinybars()  # pyright: ignore [reportAttributeAccessIssue]
+            return message_submit_transaction.freeze_with(self._client).sign(submit_key)
+
+        attempt = 1
+        while True:
+            # Transaction is frozen on each attempt, so retries use new transaction IDs
+            # Chunk duplicates (if failed attempt has reached consensus) are skipped on file resolution
+            try:
+                receipt = await HcsMessageTransaction(topic_id, message, build_message_submit_transaction).execute(
+                    self._client
+                )
+                return HcsFileChunkReceipt(ordering_index=message.ordering_index, receipt=receipt, attempts=attempt)
+            except Exception as error:
+                if attempt > self._max_chunk_retries:
+                    raise Exception(
+                        f"Failed to submit HCS file chunk {message.ordering_index} after {attempt} attempts: {error!s}"
+                    ) from error
+
+                LOGGER.warning(f"Failed to submit HCS file chunk {message.ordering_index}, retrying: {error!s}")
+                await asyncio.sleep(CHUNK_RETRY_BACKOFF_SECONDS * attempt)
+                attempt += 1
+
     async def resolve_file(self, topic_id: str) -> bytes | None:
-        """Resolve and verify HCS file payload by Topic ID"""
+        """Resolve and verify HCS file payload by Topic ID. Returns None if file topic does not exist or is empty"""
         try:
-            topic_info = await self._hcs_topic_service.get_topic_info(topic_id)
+            try:
+                topic_info = await self._hcs_topic_service.get_topic_info(topic_id)
+            except Exception as error:
+                # Missing topic means missing file, so it's reported the same way as empty topic
+                if is_topic_not_found_error(error):
+                    LOGGER.warning(f"HCS file Topic '{topic_id}' is not found")
+                    return None
+                raise
+
             topic_memo = str(topic_info.memo)
 
             if not topic_memo or not HCS_FILE_TOPIC_MEMO_REGEX.match(topic_memo):
@@ -66,18 +216,32 @@ class HcsFileService:
                     f"HCS file Topic '{topic_id}' is invalid - must contain memo compliant with HCS-1 standard"
                 )
 
+            expected_payload_hash, compression_format, _ = topic_memo.split(":")
+            dictionary = self._compression.get_decompression_dictionary(compression_format)
+
+            # Resolution completes as soon as file is complete or the last topic message is received,
+            # without waiting for the end of topic stream
+            completion_checker = _HcsFileCompletionChecker(expected_payload_hash, dictionary)
+
             resolved_messages = await HcsMessageResolver(
-                topic_id, HcsFileChunkMessage, READ_TOPIC_MESSAGES_TIMEOUT_SECONDS
+                topic_id,
+                HcsFileChunkMessage,
+                READ_TOPIC_MESSAGES_TIMEOUT_SECONDS,
+                last_sequence_number=topic_info.sequence_number or None,
+                completion_checker=completion_checker,
             ).execute(self._client)
 
+            if completion_checker.payload is not None:
+                return completion_checker.payload
+
             chunk_messages = [cast(HcsFileChunkMessage, message) for message in resolved_messages]
             if len(chunk_messages) == 0:
                 return None
 
-            payload = build_file_from_chunk_messages(chunk_messages)
+            payload_hash = sha256()
+            payload = build_file_from_chunk_messages(chunk_messages, payload_hash, dictionary)
 
-            expected_payload_hash, _, _ = topic_memo.split(":")
-            if sha256(payload).hexdigest() != expected_payload_hash:
+            if payload_hash.hexdigest() != expected_payload_hash:
                 raise Exception("Resolved HCS file payload is invalid")
 
             return payload
@@ -0,0 +1,37 @@
+"""Train zstd dictionary for HCS-1 file compression.
+
+Usage:
+    python -m hiero_did_sdk_python.hcs.hcs_file.train_dictionary samples/ --output anoncreds.dict
+"""
+
+import argparse
+from pathlib import Path
+
+from .hcs_file_compression import DEFAULT_COMPRESSION_LEVEL, DEFAULT_DICTIONARY_SIZE, train_compression_dictionary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train zstd dictionary for HCS-1 file compression")
+    parser.add_argument("samples", nargs="+", type=Path, help="Sample payload files (or directories of sample files)")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Output dictionary file")
+    parser.add_argument("--size", type=int, default=DEFAULT_DICTIONARY_SIZE, help="Max dictionary size in bytes")
+    parser.add_argument("--level", type=int, default=DEFAULT_COMPRESSION_LEVEL, help="Target compression level")
+    args = parser.parse_args()
+
+    sample_paths = [
+        file_path
+        for path in args.samples
+        for file_path in (sorted(path.iterdir()) if path.is_dir() else [path])
+        if file_path.is_file()
+    ]
+
+    dictionary = train_compression_dictionary(
+        [sample_path.read_bytes() for sample_path in sample_paths], args.size, args.level
+    )
+    args.output.write_bytes(dictionary.as_bytes())
+
+    print(f"Trained dictionary {dictionary.dict_id()} ({len(dictionary)} bytes) from {len(sample_paths)} samples")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,130 @@
-from zstandard import ZstdCompressor, ZstdDecompressor
+import binascii
+import hashlib
+import threading
+from io import BytesIO
 
-from ...utils.encoding import b64_to_bytes, bytes_to_b64
+from zstandard import ZstdCompressionDict, ZstdCompressor, ZstdDecompressor
+
+from ...utils.encoding import bytes_to_b64
 from ..constants import BASE64_JSON_CONTENT_PREFIX
 from .hcs_file_chunk_message import HcsFileChunkMessage
+from .hcs_file_compression import HcsFileCompression
+
+# Multiple of 4, so blocks are decoded independently
+DECODING_BLOCK_SIZE = 64 * 1024
+
+_THREAD_LOCAL = threading.local()
+
+
+def get_file_chunk_messages(payload: bytes, compression: HcsFileCompression | None = None) -> list[HcsFileChunkMessage]:
+    """Compress HCS-1 file payload and split it into chunk messages
 
+    Args:
+        payload: File payload
+        compression: Compression options. Default zstd compression (without dictionary) is used if not provided
 
-def get_file_chunk_messages(payload: bytes) -> list[HcsFileChunkMessage]:
+    Returns:
+        object: File chunk messages
+    """
     try:
-        compressed_payload = ZstdCompressor().compress(payload)
+        compressor = (
+            ZstdCompressor(level=compression.level, dict_data=compression.dictionary)
+            if compression
+            else ZstdCompressor()
+        )
+        compressed_payload = compressor.compress(payload)
         message_content = f"{BASE64_JSON_CONTENT_PREFIX}{bytes_to_b64(compressed_payload)}".encode()
 
         result: list[HcsFileChunkMessage] = []
 
-        for chunk_index, range_index in enumerate(
-            range(0, len(message_content), HcsFileChunkMessage.MAX_CHUNK_CONTENT_SIZE_IN_BYTES)
-        ):
-            chunk_content = message_content[
-                range_index : range_index + HcsFileChunkMessage.MAX_CHUNK_CONTENT_SIZE_IN_BYTES
-            ]
+        # Each chunk is filled up to HCS message size limit
+        range_index = 0
+        while range_index < len(message_content):
+            chunk_index = len(result)
+            chunk_size = HcsFileChunkMessage.get_max_content_size(chunk_index)
+
+            chunk_content = message_content[range_index : range_index + chunk_size]
             result.append(HcsFileChunkMessage(ordering_index=chunk_index, chunk_content=chunk_content.decode()))
+            range_index += chunk_size
 
         return result
     except Exception as error:
         raise Exception(f"Error on getting chunk messages for HCS-1 file: {error!s}") from error
 
 
-def build_file_from_chunk_messages(chunk_messages: list[HcsFileChunkMessage]) -> bytes:
-    message_content: str = ""
+def build_file_from_chunk_messages(
+    chunk_messages: list[HcsFileChunkMessage],
+    payload_hash: "hashlib._Hash | None" = None,
+    dictionary: ZstdCompressionDict | None = None,
+) -> bytes:
+    """Build HCS-1 file payload from chunk messages
+
+    Chunk contents are copied (in ordering index order) into preallocated block buffer, each block is base64-decoded
+    and fed to streaming decompressor. Encoded content is never joined, so it does not add to peak memory usage.
+    Decompressed blocks are accumulated in growing payload buffer, so peak memory usage can still reach about
+    twice the size of the payload (buffer reallocations and decompressed blocks of highly compressible content).
+
+    Args:
+        chunk_messages: File chunk messages (in any order)
+        payload_hash: Hash object updated with decompressed payload (for example, 'hashlib.sha256()')
+        dictionary: Zstd dictionary the payload is compressed with
 
+    Returns:
+        object: File payload
+    """
     try:
-        for chunk_message in sorted(chunk_messages, key=lambda message: message.ordering_index):
-            message_content += chunk_message.content
+        payload_buffer = BytesIO()
+        decompressor = _get_decompressor(dictionary).decompressobj()
+
+        def decode_block(block: memoryview | bytes):
+            decompressed_block = decompressor.decompress(binascii.a2b_base64(block))
+            if payload_hash is not None:
+                payload_hash.update(decompressed_block)
+            payload_buffer.write(decompressed_block)
+
+        block_buffer = bytearray(DECODING_BLOCK_SIZE)
+        block_view = memoryview(block_buffer)
+        block_length = 0
 
-        compressed_payload = b64_to_bytes(message_content.removeprefix(BASE64_JSON_CONTENT_PREFIX))
-        return ZstdDecompressor().decompress(compressed_payload)
+        sorted_chunk_messages = sorted(chunk_messages, key=lambda message: message.ordering_index)
+        for chunk_index, chunk_message in enumerate(sorted_chunk_messages):
+            chunk_content = chunk_message.content
+            if chunk_index == 0:
+                chunk_content = chunk_content.removeprefix(BASE64_JSON_CONTENT_PREFIX)
+
+            # Chunk contents are ASCII (base64), so non-ASCII content is rejected as invalid
+            chunk_view = memoryview(chunk_content.encode("ascii"))
+
+            while chunk_view:
+                copied_length = min(len(chunk_view), DECODING_BLOCK_SIZE - block_length)
+                block_view[block_length : block_length + copied_length] = chunk_view[:copied_length]
+                block_length += copied_length
+                chunk_view = chunk_view[copied_length:]
+
+                if block_length == DECODING_BLOCK_SIZE:
+                    decode_block(block_view)
+                    block_length = 0
+
+        # Padding is optional in the last block
+        decode_block(bytes(block_view[:block_length]) + b"=" * (-block_length % 4))
+
+        if not decompressor.eof:
+            raise Exception("Compressed payload is incomplete")
+
+        return payload_buffer.getvalue()
     except Exception as error:
         raise Exception(f"Error on building HCS-1 file payload from chunk messages: {error!s}") from error
+
+
+def _get_decompressor(dictionary: ZstdCompressionDict | None) -> ZstdDecompressor:
+    # Decompressors are reused to avoid allocation of decompression context (and dictionary loading) for each file,
+    # but they are not thread-safe
+    decompressors: dict[int, ZstdDecompressor] | None = getattr(_THREAD_LOCAL, "decompressors", None)
+    if decompressors is None:
+        decompressors = _THREAD_LOCAL.decompressors = {}
+
+    dictionary_id = dictionary.dict_id() if dictionary else 0
+    decompressor = decompressors.get(dictionary_id)
+    if decompressor is None:
+        decompressor = decompressors[dictionary_id] = ZstdDecompressor(dict_data=dictionary)
+    return decompressor
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from hashlib import sha256
+from typing import Self
 
 from hiero_sdk_python import Timestamp
 
@@ -10,12 +11,29 @@ from ..utils.serializable import Serializable
 class HcsMessage(ABC, Serializable):
     """Base class for HCS messages"""
 
+    _raw_payload_hash: str | None = None
+
     @abstractmethod
     def is_valid(self, topic_id: str | None = None) -> bool:
         """Validate the message against specific HCS topic"""
 
     def get_payload_hash(self) -> str:
-        return sha256(self.to_json().encode()).hexdigest()
+        # Messages parsed from HCS responses keep hash of raw payload, so they are not re-serialized for hashing
+        return self._raw_payload_hash or sha256(self.to_json().encode()).hexdigest()
+
+    @classmethod
+    def from_payload_bytes(cls, payload: bytes) -> Self:
+        """Parse message from raw HCS message contents.
+
+        Args:
+            payload: Raw message contents
+
+        Returns:
+            Message instance
+        """
+        message = cls.from_json(payload.decode())
+        message._raw_payload_hash = sha256(payload).hexdigest()
+        return message
 
 
 @dataclass
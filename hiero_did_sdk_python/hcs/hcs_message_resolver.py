@@ -1,23 +1,236 @@
 import asyncio
 import logging
+import threading
 import time
-from asyncio import Future
-from threading import Timer
+from asyncio import AbstractEventLoop, Future, TimerHandle
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import cast
 
 from hiero_sdk_python import Client, Timestamp
+from hiero_sdk_python.consensus.topic_message import TopicMessage
 
 from .hcs_message import HcsMessage, HcsMessageWithResponseMetadata
 from .hcs_message_envelope import HcsMessageEnvelope
-from .hcs_topic_listener import HcsTopicListener
+from .hcs_topic_cursor import HcsTopicCursor
+from .hcs_topic_listener import HcsMessageReceiver, HcsTopicListener
+from .hcs_topic_transport import HcsTopicTransport
 
 DEFAULT_TIMEOUT_SECONDS = float(5)
+DEFAULT_STREAM_BUFFER_SIZE = 1000
 
 TOPIC_UNSUBSCRIBED_ERROR = "CANCELLED: unsubscribe"
 
 LOGGER = logging.getLogger(__name__)
 
+type ResolvedMessage = HcsMessage | HcsMessageWithResponseMetadata
+
+
+def _set_future_result(future: Future, result: object):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: Future, error: Exception):
+    if not future.done():
+        future.set_exception(error)
+
+
+@dataclass(frozen=True)
+class HcsMessageBufferStats:
+    """Stats snapshot of message buffer between topic subscription and 'stream' consumer.
+
+    Attributes:
+        size: Current count of buffered messages
+        max_size: Peak count of buffered messages
+        high_watermark: Count of buffered messages that pauses topic subscription
+        low_watermark: Count of buffered messages that resumes paused topic subscription
+        pauses: Count of topic subscription pauses
+        paused_time: Total duration of topic subscription pauses (in seconds)
+        dropped: Count of messages dropped after stream was closed
+    """
+
+    size: int
+    max_size: int
+    high_watermark: int
+    low_watermark: int
+    pauses: int = 0
+    paused_time: float = 0.0
+    dropped: int = 0
+
+
+class _MessageBuffer:
+    """Bounded buffer between topic subscription and async consumer.
+
+    Subscription is paused once buffer reaches high watermark and resumed once consumer drains it to low watermark,
+    so paused producers are not woken up on each consumed message.
+    Producers running in other threads (gRPC subscriptions) are blocked while subscription is paused.
+    Producers running in event loop thread (REST transport) receive awaitable that completes once message is buffered.
+    """
+
+    def __init__(self, loop: AbstractEventLoop, high_watermark: int, low_watermark: int):
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+
+        self._items: deque[ResolvedMessage] = deque()
+        self._condition = Condition()
+        self._is_closed = False
+        self._is_paused = False
+        self._error: Exception | None = None
+
+        self._is_consumer_waiting = False
+        self._consumer_event = asyncio.Event()
+        self._capacity_event = asyncio.Event()
+
+        self._max_size = 0
+        self._pauses = 0
+        self._paused_time = 0.0
+        self._dropped = 0
+
+    def size(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> HcsMessageBufferStats:
+        with self._condition:
+            return HcsMessageBufferStats(
+                size=len(self._items),
+                max_size=self._max_size,
+                high_watermark=self._high_watermark,
+                low_watermark=self._low_watermark,
+                pauses=self._pauses,
+                paused_time=self._paused_time,
+                dropped=self._dropped,
+            )
+
+    def put(self, item: ResolvedMessage) -> Awaitable[None] | None:
+        if threading.get_ident() == self._loop_thread_id:
+            if self._is_blocked():
+                return self._put_when_ready(item)
+        else:
+            with self._condition:
+                if self._is_blocked():
+                    paused_at = time.perf_counter()
+                    while self._is_blocked():
+                        self._condition.wait()
+                    self._paused_time += time.perf_counter() - paused_at
+
+        self._append(item)
+
+    def close(self, error: Exception | None = None):
+        with self._condition:
+            if self._is_closed:
+                return
+
+            self._is_closed = True
+            self._error = error
+            self._condition.notify_all()
+
+        self._call_in_loop(self._consumer_event.set)
+        self._call_in_loop(self._capacity_event.set)
+
+    async def get(self) -> ResolvedMessage | None:
+        while True:
+            with self._condition:
+                if self._items:
+                    item = self._items.popleft()
+
+                    should_resume = self._is_paused and len(self._items) <= self._low_watermark
+                    if should_resume:
+                        self._is_paused = False
+                        self._condition.notify_all()
+                    break
+
+                if self._is_closed:
+                    if self._error:
+                        raise self._error
+                    return None
+
+                self._is_consumer_waiting = True
+                self._consumer_event.clear()
+
+            await self._consumer_event.wait()
+
+        if should_resume:
+            self._capacity_event.set()
+        return item
+
+    def _is_blocked(self) -> bool:
+        return self._is_paused and not self._is_closed
+
+    async def _put_when_ready(self, item: ResolvedMessage):
+        paused_at = time.perf_counter()
+        while self._is_blocked():
+            self._capacity_event.clear()
+            await self._capacity_event.wait()
+
+        with self._condition:
+            self._paused_time += time.perf_counter() - paused_at
+
+        self._append(item)
+
+    def _append(self, item: ResolvedMessage):
+        with self._condition:
+            # Messages received after closing (for example, after consumer is done) are dropped
+            if self._is_closed:
+                self._dropped += 1
+                return
+
+            self._items.append(item)
+            self._max_size = max(self._max_size, len(self._items))
+
+            if not self._is_paused and len(self._items) >= self._high_watermark:
+                self._is_paused = True
+                self._pauses += 1
+
+            # Consumer is woken up only if it waits for messages, so buffered messages do not cause loop wake-ups
+            should_wake_consumer = self._is_consumer_waiting
+            self._is_consumer_waiting = False
+
+        if should_wake_consumer:
+            self._call_in_loop(self._consumer_event.set)
+
+    def _call_in_loop(self, callback: Callable[[], None]):
+        if threading.get_ident() == self._loop_thread_id:
+            callback()
+        else:
+            self._loop.call_soon_threadsafe(callback)
+
 
 class HcsMessageResolver:
+    """Resolves messages of HCS topic.
+
+    Resolution completes as soon as mirror node closes the stream (requested end time or messages limit is reached)
+    or message with 'last_sequence_number' is received. Idle timeout is used as a fallback -
+    resolution also completes if no messages are received within 'timeout_seconds'.
+
+    Messages can be resolved as a list ('execute') or consumed incrementally ('stream').
+
+    Args:
+        topic_id: HCS topic ID
+        message_type: Type of topic messages
+        timeout_seconds: Fallback idle timeout (in seconds)
+        timestamp_from: Consensus timestamp to resolve messages from
+        timestamp_to: Consensus timestamp to resolve messages to. Current time is used if not provided
+        limit: Max count of resolved messages
+        include_response_metadata: Include sequence numbers and consensus timestamps of resolved messages
+        last_sequence_number: Known sequence number of the last topic message (for example, from topic info)
+        transport: Mirror node transport. gRPC streaming is used by default,
+            'HcsMirrorRestTransport' can be used for faster reads of historical messages
+        stream_buffer_size: Count of messages buffered by 'stream' that pauses topic subscription (high watermark)
+        resume_after: Position of the last consumed topic message. Only subsequent messages are resolved,
+            takes precedence over 'timestamp_from'
+        executor: Executor used to parse and validate messages. Messages are parsed on subscription thread by default
+        stream_buffer_low_watermark: Count of buffered messages that resumes paused topic subscription.
+            Half of 'stream_buffer_size' is used by default
+        completion_checker: Invoked with each resolved message, resolution completes once it returns True
+            (for example, once all expected messages are resolved)
+    """
+
     def __init__(
         self,
         topic_id: str,
@@ -27,10 +240,21 @@ class HcsMessageResolver:
         timestamp_to: Timestamp | None = None,
         limit: int | None = None,
         include_response_metadata: bool = False,
+        last_sequence_number: int | None = None,
+        transport: HcsTopicTransport | None = None,
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        resume_after: HcsTopicCursor | None = None,
+        executor: Executor | None = None,
+        stream_buffer_low_watermark: int | None = None,
+        completion_checker: Callable[[ResolvedMessage], bool] | None = None,
     ):
         self.topic_id = topic_id
         self._topic_listener = HcsTopicListener(
-            topic_id, message_type, include_response_metadata=include_response_metadata
+            topic_id,
+            message_type,
+            include_response_metadata=include_response_metadata,
+            transport=transport,
+            executor=executor,
         )
         self._message_type = message_type
 
@@ -40,76 +264,218 @@ class HcsMessageResolver:
         self._timestamp_from = timestamp_from
         self._timestamp_to = timestamp_to
         self._limit = limit
+        self._last_sequence_number = last_sequence_number
+        self._resume_after = resume_after
+
+        if stream_buffer_low_watermark is None:
+            stream_buffer_low_watermark = stream_buffer_size // 2
+
+        if stream_buffer_size < 1 or not 0 <= stream_buffer_low_watermark < stream_buffer_size:
+            raise Exception("Stream buffer low watermark must be lower than positive stream buffer size")
+
+        self._stream_buffer_size = stream_buffer_size
+        self._stream_buffer_low_watermark = stream_buffer_low_watermark
+        self._stream_buffer: _MessageBuffer | None = None
+        self._completion_checker = completion_checker
+
+        self._messages: list[ResolvedMessage] = []
+        self._received_message_hashes: set[str] = set()
+
+        self._loop: AbstractEventLoop | None = None
+        self._waiting_timer: TimerHandle | None = None
+        self._is_completed = False
+        self._completion_lock = Lock()
 
-        self._messages: list[HcsMessage | HcsMessageWithResponseMetadata] = []
-        self._received_message_hashes: list[str] = []
+        self._completion_callback: Callable[[], None] = lambda: None
+        self._error_callback: Callable[[Exception], None] = lambda _: None
+        self._is_consumer_busy: Callable[[], bool] = lambda: False
 
-        self._waiting_timer: Timer | None = None
+    async def execute(self, client: Client) -> list[ResolvedMessage]:
+        """Resolve topic messages
 
-    async def execute(self, client: Client) -> list[HcsMessage | HcsMessageWithResponseMetadata]:
-        self._received_message_hashes = []
+        Args:
+            client: Hedera Client
 
+        Returns:
+            object: List of resolved messages
+        """
         completion_future = asyncio.get_running_loop().create_future()
 
-        def handle_completion():
-            self._complete(completion_future)
+        # Completion callbacks are invoked from subscription thread, so result is set in the event loop thread
+        self._completion_callback = lambda: completion_future.get_loop().call_soon_threadsafe(
+            _set_future_result, completion_future, self._messages
+        )
+        self._error_callback = lambda error: completion_future.get_loop().call_soon_threadsafe(
+            _set_future_exception, completion_future, error
+        )
+
+        self._subscribe(client, self._handle_message)
+
+        try:
+            return await completion_future
+        finally:
+            # Subscription is cancelled if caller stops waiting (for example, on deadline)
+            self._complete()
+
+    async def stream(self, client: Client) -> AsyncIterator[ResolvedMessage]:
+        """Resolve topic messages as they arrive.
+
+        Messages are buffered up to 'stream_buffer_size' - if consumer is slower than topic subscription,
+        subscription is paused until buffered messages are consumed.
+        Subscription is cancelled once iterator is closed - use 'contextlib.aclosing' to stop iteration early.
+
+        Args:
+            client: Hedera Client
+
+        Returns:
+            object: Async iterator of resolved messages
+        """
+        buffer = _MessageBuffer(asyncio.get_running_loop(), self._stream_buffer_size, self._stream_buffer_low_watermark)
+        self._stream_buffer = buffer
+
+        self._completion_callback = buffer.close
+        self._error_callback = buffer.close
+        # Idle timeout should not complete the stream while subscription is paused by slow consumer
+        self._is_consumer_busy = lambda: buffer.size() > 0
+
+        def receive(message: ResolvedMessage) -> Awaitable[None] | None:
+            if not self._is_new_message(message):
+                return
+
+            put_result = buffer.put(message)
+            if put_result:
+                return self._check_completion_after(put_result, message)
+
+            self._check_completion(message)
+
+        self._subscribe(client, receive)
+
+        try:
+            while (message := await buffer.get()) is not None:
+                yield message
+        finally:
+            self._complete()
+
+    def get_stream_stats(self) -> HcsMessageBufferStats | None:
+        """Get stats of the last 'stream' buffer (queue depth and subscription pauses)
+
+        Returns:
+            object: Stream buffer stats, None if messages were not streamed
+        """
+        return self._stream_buffer.stats() if self._stream_buffer else None
+
+    def _subscribe(self, client: Client, receiver: HcsMessageReceiver):
+        self._loop = asyncio.get_running_loop()
+        self._received_message_hashes = set()
+        self._is_completed = False
+
+        def handle_progress(response: TopicMessage):
+            self._last_message_arrival_time = time.time()
+
+            if self._last_sequence_number is not None and int(response.sequence_number) >= self._last_sequence_number:
+                self._complete()
 
         def handle_error(error: Exception):
-            if not completion_future.done() and str(error) != TOPIC_UNSUBSCRIBED_ERROR:
-                completion_future.set_exception(error)
+            if str(error) != TOPIC_UNSUBSCRIBED_ERROR:
+                self._fail(error)
 
-        if self._timestamp_from:
+        if self._resume_after:
+            self._topic_listener.set_start_time(self._resume_after.consensus_timestamp).set_after_sequence_number(
+                self._resume_after.sequence_number
+            )
+        elif self._timestamp_from:
             self._topic_listener.set_start_time(self._timestamp_from)
 
         if self._limit:
             self._topic_listener.set_limit(self._limit)
 
+        self._last_message_arrival_time = time.time()
+
         (
             self._topic_listener.set_end_time(self._timestamp_to or Timestamp(seconds=int(time.time()), nanos=0))
-            .set_completion_handler(handle_completion)
-            .subscribe(client, self._handle_message, handle_error)
+            .set_completion_handler(self._complete)
+            .set_progress_handler(handle_progress)
+            .subscribe(client, receiver, handle_error)
         )
 
-        self._last_message_arrival_time = time.time()
-        self._wait_or_complete(completion_future)
+        self._wait_or_complete()
 
-        await completion_future
+    def _handle_message(self, message: ResolvedMessage):
+        if self._is_new_message(message):
+            self._messages.append(message)
+            self._check_completion(message)
 
-        return completion_future.result()
+    def _check_completion(self, message: ResolvedMessage):
+        if self._completion_checker and self._completion_checker(message):
+            self._complete()
 
-    def _handle_message(self, message: HcsMessage | HcsMessageWithResponseMetadata):
-        self._last_message_arrival_time = time.time()
+    async def _check_completion_after(self, put_result: Awaitable[None], message: ResolvedMessage):
+        # Message must be buffered before stream is closed
+        await put_result
+        self._check_completion(message)
 
+    def _is_new_message(self, message: ResolvedMessage) -> bool:
         if isinstance(message, HcsMessageEnvelope) and not message.signature:
             LOGGER.warning("Received message envelope with missing signature, skipping...")
-            return
+            return False
 
         message_hash = message.get_payload_hash()
 
         if message_hash in self._received_message_hashes:
             LOGGER.warning("Received message duplicate, skipping...")
+            return False
+
+        self._received_message_hashes.add(message_hash)
+        return True
+
+    def _complete(self):
+        if not self._mark_completed():
             return
 
-        self._received_message_hashes.append(message_hash)
-        self._messages.append(message)
+        self._stop()
+        self._completion_callback()
 
-    def _complete(self, future: Future):
-        future.get_loop().call_soon_threadsafe(future.set_result, self._messages)
+    def _fail(self, error: Exception):
+        if not self._mark_completed():
+            return
 
+        self._stop()
+        self._error_callback(error)
+
+    def _mark_completed(self) -> bool:
+        # Completion can be triggered concurrently by stream end, last sequence number, idle timeout and errors
+        with self._completion_lock:
+            if self._is_completed:
+                return False
+
+            self._is_completed = True
+            return True
+
+    def _stop(self):
+        # Completion can be triggered from subscription thread, timer handles must be cancelled in the event loop thread
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._cancel_waiting_timer)
+
+        self._topic_listener.unsubscribe()
+
+    def _cancel_waiting_timer(self):
         if self._waiting_timer:
             self._waiting_timer.cancel()
+            self._waiting_timer = None
 
-        self._topic_listener.unsubscribe()
+    def _wait_or_complete(self):
+        # Runs in the event loop thread, message arrival time is updated by subscription threads
+        if self._is_completed:
+            return
+
+        if self._is_consumer_busy():
+            self._last_message_arrival_time = time.time()
 
-    def _wait_or_complete(self, future: Future):
         time_diff = time.time() - self._last_message_arrival_time
 
         if time_diff <= self._message_waiting_timeout:
-            if self._waiting_timer:
-                self._waiting_timer.cancel()
+            self._cancel_waiting_timer()
             timer_interval = self._message_waiting_timeout - time_diff
-            self._waiting_timer = Timer(timer_interval, self._wait_or_complete, [future])
-            self._waiting_timer.start()
-            return
+            self._waiting_timer = cast(AbstractEventLoop, self._loop).call_later(timer_interval, self._wait_or_complete)
         else:
-            self._complete(future)
+            self._complete()
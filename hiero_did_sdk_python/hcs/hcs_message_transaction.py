@@ -1,6 +1,6 @@
 from collections.abc import Callable
 
-from hiero_sdk_python import Client, TopicId, TopicMessageSubmitTransaction
+from hiero_sdk_python import Client, TopicId, TopicMessageSubmitTransaction, TransactionReceipt
 from hiero_sdk_python.transaction.transaction import Transaction
 
 from .hcs_message import HcsMessage
@@ -20,7 +20,7 @@ class HcsMessageTransaction:
 
         self.executed = False
 
-    async def execute(self, client: Client):
+    async def execute(self, client: Client) -> TransactionReceipt:
         if self.executed:
             raise Exception("This transaction has already been executed")
 
@@ -37,6 +37,7 @@ class HcsMessageTransaction:
         if self._transaction_builder:
             transaction = self._transaction_builder(transaction)
 
-        await execute_hcs_transaction_async(transaction, client)
+        receipt = await execute_hcs_transaction_async(transaction, client)
 
         self.executed = True
+        return receipt
@@ -0,0 +1,230 @@
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Self, cast
+
+from aiohttp import ClientError, ClientSession, TCPConnector
+from aiohttp_retry import ExponentialRetry, RetryClient
+from hiero_sdk_python import Client, Timestamp
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.consensus.topic_message import TopicMessage
+
+from ..utils.encoding import b64_to_bytes
+from .hcs_topic_transport import HcsTopicQuery, HcsTopicTransport
+
+LOGGER = logging.getLogger(__name__)
+
+# Max page size supported by mirror node REST API
+MAX_PAGE_SIZE = 100
+
+DEFAULT_CONNECTIONS_LIMIT = 16
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _format_timestamp(dt: datetime) -> str:
+    timestamp = Timestamp.from_date(dt)
+    return f"{timestamp.seconds}.{timestamp.nanos:09d}"
+
+
+def _parse_timestamp(value: str) -> datetime:
+    seconds, _, nanos = value.partition(".")
+    return Timestamp(int(seconds), int(nanos.ljust(9, "0"))).to_date()
+
+
+def _parse_topic_message(payload: dict) -> TopicMessage:
+    return TopicMessage(
+        consensus_timestamp=_parse_timestamp(payload["consensus_timestamp"]),
+        message_data={
+            "contents": b64_to_bytes(payload["message"]),
+            "running_hash": b64_to_bytes(payload.get("running_hash") or ""),
+            "sequence_number": int(payload["sequence_number"]),
+        },
+        chunks=[],
+    )
+
+
+class _RestSubscriptionHandle:
+    def __init__(self, task: asyncio.Task):
+        self._task = task
+
+    def cancel(self):
+        # Subscription can be cancelled from other threads (for example, by resolver idle timer)
+        self._task.get_loop().call_soon_threadsafe(self._task.cancel)
+
+
+class HcsMirrorRestTopicQuery:
+    """Topic messages query that reads bounded message ranges from mirror node REST API page by page.
+
+    Args:
+        topic_id: HCS topic ID
+        transport: Mirror node REST transport
+    """
+
+    def __init__(self, topic_id: str, transport: "HcsMirrorRestTransport"):
+        self._topic_id = topic_id
+        self._transport = transport
+        self._start_time: datetime | None = None
+        self._end_time: datetime | None = None
+        self._limit: int | None = None
+        self._completion_handler: Callable[[], None] | None = None
+
+    def set_start_time(self, dt: datetime) -> Self:
+        self._start_time = dt
+        return self
+
+    def set_end_time(self, dt: datetime) -> Self:
+        self._end_time = dt
+        return self
+
+    def set_limit(self, limit: int) -> Self:
+        self._limit = limit
+        return self
+
+    def set_completion_handler(self, handler: Callable[[], None]) -> Self:
+        self._completion_handler = handler
+        return self
+
+    def subscribe(
+        self,
+        client: Client,
+        on_message: Callable[[TopicMessage], Awaitable[None] | None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> _RestSubscriptionHandle:
+        # Must be called from event loop thread
+        task = asyncio.get_running_loop().create_task(self._read(client, on_message, on_error))
+        return _RestSubscriptionHandle(task)
+
+    async def _read(
+        self,
+        client: Client,
+        on_message: Callable[[TopicMessage], Awaitable[None] | None],
+        on_error: Callable[[Exception], None] | None,
+    ):
+        try:
+            async for message in self._read_messages(client):
+                # Message handler can apply backpressure by returning awaitable
+                result = on_message(message)
+                if inspect.isawaitable(result):
+                    await result
+        except asyncio.CancelledError:
+            return
+        except Exception as error:
+            LOGGER.warning(f"Failed to read messages of topic {self._topic_id} from mirror node: {error!s}")
+            if on_error:
+                on_error(error)
+            return
+
+        if self._completion_handler:
+            self._completion_handler()
+
+    async def _read_messages(self, client: Client):
+        remaining = self._limit
+        last_sequence_number = 0
+
+        while remaining is None or remaining > 0:
+            page_size = min(remaining, MAX_PAGE_SIZE) if remaining is not None else MAX_PAGE_SIZE
+            params = [("limit", str(page_size)), ("order", "asc")]
+
+            if self._start_time:
+                params.append(("timestamp", f"gte:{_format_timestamp(self._start_time)}"))
+            if self._end_time:
+                params.append(("timestamp", f"lt:{_format_timestamp(self._end_time)}"))
+            if last_sequence_number:
+                params.append(("sequencenumber", f"gt:{last_sequence_number}"))
+
+            page = await self._transport.get_topic_messages_page(client, self._topic_id, params)
+
+            for payload in page:
+                message = _parse_topic_message(payload)
+                last_sequence_number = cast(int, message.sequence_number)
+                yield message
+
+            if remaining is not None:
+                remaining -= len(page)
+
+            # Last page is reached
+            if len(page) < page_size:
+                return
+
+
+class HcsMirrorRestTransport(HcsTopicTransport):
+    """Mirror node REST API transport for bounded historical topic reads.
+
+    Pages are requested sequentially with 'sequencenumber' filter, so reads are deterministic and complete as soon as
+    the last page is received. Live tailing is not supported - use gRPC transport for subscriptions to new messages.
+
+    HTTP connections are pooled and reused across queries, call 'close' to release them.
+
+    Args:
+        mirror_node_url: Mirror node REST API base URL. If not provided, URL is selected by client network name
+        connections_limit: Max count of pooled HTTP connections
+        max_attempts: Max count of attempts for each page request
+    """
+
+    def __init__(
+        self,
+        mirror_node_url: str | None = None,
+        connections_limit: int = DEFAULT_CONNECTIONS_LIMIT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self._mirror_node_url = mirror_node_url.rstrip("/") if mirror_node_url else None
+        self._connections_limit = connections_limit
+        self._max_attempts = max_attempts
+        self._http_client: RetryClient | None = None
+
+    def create_query(self, topic_id: str) -> HcsTopicQuery:
+        return HcsMirrorRestTopicQuery(topic_id, self)
+
+    async def get_topic_messages_page(self, client: Client, topic_id: str, params: list[tuple[str, str]]) -> list[dict]:
+        """Get page of topic messages from mirror node REST API
+
+        Args:
+            client: Hedera Client (used to select mirror node URL)
+            topic_id: HCS topic ID
+            params: Query parameters
+
+        Returns:
+            object: List of topic message payloads
+        """
+        url = f"{self._get_mirror_node_url(client)}/api/v1/topics/{topic_id}/messages"
+
+        async with self._get_http_client().get(url, params=params) as response:
+            if response.status == 404:
+                return []
+
+            if response.status < 200 or response.status >= 300:
+                raise ClientError(f"Bad response from mirror node: {response.status} - {response.reason}")
+
+            payload = await response.json()
+
+        return payload.get("messages", [])
+
+    async def close(self):
+        """Close pooled HTTP connections."""
+        if self._http_client:
+            await self._http_client.close()
+            self._http_client = None
+
+    def _get_mirror_node_url(self, client: Client) -> str:
+        if self._mirror_node_url:
+            return self._mirror_node_url
+
+        network_name = client.network.network
+        mirror_node_url = Network.MIRROR_NODE_URLS.get(network_name)
+
+        if not mirror_node_url:
+            raise Exception(f"Mirror node URL is not known for network '{network_name}'")
+
+        return mirror_node_url
+
+    def _get_http_client(self) -> RetryClient:
+        # Session is created lazily, so transport can be instantiated outside of event loop
+        if not self._http_client:
+            session = ClientSession(connector=TCPConnector(limit=self._connections_limit), trust_env=True)
+            self._http_client = RetryClient(
+                client_session=session, retry_options=ExponentialRetry(attempts=self._max_attempts)
+            )
+
+        return self._http_client
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Self
+
+from hiero_sdk_python import Timestamp
+
+from .hcs_message import HcsMessageWithResponseMetadata
+
+
+@dataclass(frozen=True)
+class HcsTopicCursor:
+    """Position of the last consumed topic message. Used to resume topic reads without overlap with consumed messages.
+
+    Attributes:
+        consensus_timestamp: Consensus timestamp of the last consumed message (with nanosecond precision)
+        sequence_number: Sequence number of the last consumed message
+    """
+
+    consensus_timestamp: Timestamp
+    sequence_number: int
+
+    @classmethod
+    def from_message(cls, message: HcsMessageWithResponseMetadata) -> Self:
+        return cls(consensus_timestamp=message.consensus_timestamp, sequence_number=int(message.sequence_number))
+
+    @classmethod
+    def from_messages(cls, messages: list[HcsMessageWithResponseMetadata], default: Self | None = None) -> Self | None:
+        """Get position of the last message in the list
+
+        Args:
+            messages: Consumed messages (in topic order)
+            default: Position returned if list is empty
+
+        Returns:
+            object: Topic cursor
+        """
+        return cls.from_message(messages[-1]) if messages else default
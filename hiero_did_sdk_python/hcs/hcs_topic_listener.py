@@ -1,21 +1,200 @@
+import asyncio
+import inspect
 import logging
-from collections.abc import Callable
+import queue
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, Future
+from functools import partial
+from threading import Lock, Semaphore
 from typing import cast
 
-from hiero_sdk_python import Client, Timestamp, TopicId, TopicMessageQuery
+from hiero_sdk_python import Client, Timestamp
 from hiero_sdk_python.consensus.topic_message import TopicMessage
 
 from .hcs_message import HcsMessage, HcsMessageWithResponseMetadata
+from .hcs_topic_transport import HcsGrpcTransport, HcsTopicTransport
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_PARSING_BATCH_SIZE = 64
+MAX_PENDING_PARSING_BATCHES = 16
+
+# Receiver can return awaitable to apply backpressure. It's awaited by transports running in event loop (REST transport),
+# receivers invoked from other threads (gRPC transport) should block instead
+type HcsMessageReceiver = Callable[[HcsMessage | HcsMessageWithResponseMetadata], Awaitable[None] | None]
+
+# Parsed message or the reason of its rejection
+type _ParsingResult = HcsMessage | str
+
+
+def _parse_payload(message_class: type[HcsMessage], topic_id: str, payload: bytes) -> _ParsingResult:
+    try:
+        message = message_class.from_payload_bytes(payload)
+    except Exception as error:
+        LOGGER.warning(f"Failed to extract HCS message from response: {error!s}")
+        return "Extracting message from the mirror response failed"
+
+    if not message.is_valid(topic_id):
+        return "Extracted message is invalid"
+
+    return message
+
+
+def _parse_payloads(message_class: type[HcsMessage], topic_id: str, payloads: list[bytes]) -> list[_ParsingResult]:
+    return [_parse_payload(message_class, topic_id, payload) for payload in payloads]
+
+
+_END_OF_STREAM = object()
+
+
+class _ParsingStage:
+    """Parses topic messages in executor workers.
+
+    Messages are submitted in batches. Batch is submitted once it's full or delivery is idle, so batches grow
+    only while workers are busy (large replays) and single messages are not delayed (live messages).
+    Parsed messages are delivered in topic order by a dedicated delivery thread.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        batch_size: int,
+        parse_batch: Callable[[list[bytes]], list[_ParsingResult]],
+        deliver: Callable[[TopicMessage, _ParsingResult], None],
+        error_handler: Callable[[Exception], None] | None,
+    ):
+        self._executor = executor
+        self._batch_size = batch_size
+        self._parse_batch = parse_batch
+        self._deliver = deliver
+        self._error_handler = error_handler
+        self._completion_handler: Callable[[], None] | None = None
+
+        self._lock = Lock()
+        self._pending_responses: list[TopicMessage] = []
+        # Submitted batches are delivered in submission order
+        self._batches: queue.Queue = queue.Queue()
+        self._capacity = Semaphore(MAX_PENDING_PARSING_BATCHES)
+        self._is_cancelled = False
+
+        threading.Thread(target=self._run_delivery, daemon=True).start()
+
+    def set_completion_handler(self, completion_handler: Callable[[], None] | None):
+        self._completion_handler = completion_handler
+
+    def submit(self, response: TopicMessage) -> Awaitable[None] | None:
+        with self._lock:
+            self._pending_responses.append(response)
+            should_submit = len(self._pending_responses) >= self._batch_size or self._batches.empty()
+
+        if not should_submit:
+            return
+
+        if self._capacity.acquire(blocking=False):
+            self._submit_pending_batch()
+            return
+
+        if _is_event_loop_thread():
+            # Event loop must not be blocked (delivery can wait for event loop consumers)
+            return self._submit_when_ready()
+
+        self._capacity.acquire()
+        self._submit_pending_batch()
+
+    def end(self):
+        # Not limited by capacity, so stream completion never blocks
+        with self._lock:
+            self._submit_batch_locked(holds_capacity=False)
+            self._batches.put_nowait(_END_OF_STREAM)
+
+    def cancel(self):
+        self._is_cancelled = True
+        self._batches.put_nowait(_END_OF_STREAM)
+
+    async def _submit_when_ready(self):
+        await asyncio.to_thread(self._capacity.acquire)
+        self._submit_pending_batch()
+
+    def _submit_pending_batch(self):
+        # Must be called with acquired capacity slot
+        with self._lock:
+            if not self._submit_batch_locked(holds_capacity=True):
+                self._capacity.release()
+
+    def _submit_batch_locked(self, holds_capacity: bool) -> bool:
+        if not self._pending_responses:
+            return False
+
+        responses = self._pending_responses
+        self._pending_responses = []
+
+        payloads = [cast(bytes, response.contents) for response in responses]
+        self._batches.put_nowait((responses, self._executor.submit(self._parse_batch, payloads), holds_capacity))
+        return True
+
+    def _run_delivery(self):
+        while (batch := self._batches.get()) is not _END_OF_STREAM:
+            responses, future, holds_capacity = cast(tuple[list[TopicMessage], Future, bool], batch)
+
+            try:
+                results = future.result()
+            except Exception as error:
+                LOGGER.warning(f"Failed to parse HCS messages: {error!s}")
+                self._is_cancelled = True
+                if self._error_handler:
+                    self._error_handler(error)
+                return
+            finally:
+                if holds_capacity:
+                    self._capacity.release()
+
+            for response, result in zip(responses, results, strict=True):
+                if self._is_cancelled:
+                    return
+                self._deliver(response, result)
+
+            with self._lock:
+                # Delivery is idle, pending messages are not waiting for a full batch
+                if self._batches.empty() and self._pending_responses and self._capacity.acquire(blocking=False):
+                    self._submit_batch_locked(holds_capacity=True)
+
+        if not self._is_cancelled and self._completion_handler:
+            self._completion_handler()
+
+
+def _is_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
 
 class HcsTopicListener:
+    """Listener of HCS topic messages.
+
+    Messages are parsed and validated on subscription callback thread by default. Executor can be provided to parse
+    messages in worker threads or processes (in batches), so large replays are not limited by a single thread.
+    Process pools require message types that can be pickled.
+
+    Args:
+        topic_id: HCS topic ID
+        message_class: Type of topic messages
+        include_response_metadata: Include sequence numbers and consensus timestamps of received messages
+        transport: Mirror node transport. gRPC streaming is used by default
+        executor: Executor used to parse and validate messages
+        parsing_batch_size: Max count of messages in parsing batch submitted to executor
+    """
+
     def __init__(
         self,
         topic_id: str,
         message_class: type[HcsMessage],
         include_response_metadata: bool = False,
+        transport: HcsTopicTransport | None = None,
+        executor: Executor | None = None,
+        parsing_batch_size: int = DEFAULT_PARSING_BATCH_SIZE,
     ):
         self.topic_id = topic_id
         self._message_class = message_class
@@ -23,13 +202,16 @@ class HcsTopicListener:
         self._filters = []
         self._subscription_handle = None
         self._invalid_message_handler = None
+        self._progress_handler = None
+        self._completion_handler: Callable[[], None] | None = None
         self._error_handler = None
+        self._after_sequence_number: int | None = None
 
-        self._query = (
-            TopicMessageQuery(topic_id=TopicId.from_string(topic_id), start_time=Timestamp(0, 0).to_date())
-            .set_max_backoff(2.0)
-            .set_max_attempts(5)
-        )
+        self._executor = executor
+        self._parsing_batch_size = parsing_batch_size
+        self._parsing_stage: _ParsingStage | None = None
+
+        self._query = (transport or HcsGrpcTransport()).create_query(topic_id)
 
     def set_start_time(self, start_time: Timestamp):
         self._query.set_start_time(start_time.to_date())
@@ -43,10 +225,21 @@ class HcsTopicListener:
         self._query.set_limit(limit)
         return self
 
+    def set_after_sequence_number(self, sequence_number: int):
+        # Start time filter is not precise enough (mirror queries use microseconds), so consumed messages are skipped by sequence number
+        self._after_sequence_number = sequence_number
+        return self
+
     def set_completion_handler(self, completion_handler: Callable[[], None]):
-        # Completion handler + subscription handle cancellation does not work properly in native SDK
-        # See GH issue: https://github.com/hiero-ledger/hiero-sdk-python/issues/43
-        # self._query.setCompletionHandler(completion_handler)
+        # Native SDK invokes completion handler once mirror node closes the stream (end time or limit is reached)
+        # It's not invoked for cancelled subscriptions
+        self._completion_handler = completion_handler
+        self._query.set_completion_handler(self._handle_stream_end)
+        return self
+
+    def set_progress_handler(self, progress_handler: Callable[[TopicMessage], None]):
+        # Progress handler receives each mirror response (including invalid and rejected messages) after it's processed
+        self._progress_handler = progress_handler
         return self
 
     def add_filter(self, response_filter: Callable[[TopicMessage], bool]):
@@ -60,11 +253,37 @@ class HcsTopicListener:
     def subscribe(
         self,
         client: Client,
-        receiver: Callable[[HcsMessage | HcsMessageWithResponseMetadata], None],
+        receiver: HcsMessageReceiver,
         error_handler: Callable[[Exception], None] | None = None,
     ):
-        def handle_message(response):
-            self._handle_response(response, receiver)
+        if self._executor:
+            parsing_stage = _ParsingStage(
+                self._executor,
+                self._parsing_batch_size,
+                # Module-level function is used, so batches can be sent to worker processes
+                partial(_parse_payloads, self._message_class, self.topic_id),
+                lambda response, result: self._deliver_parsed(response, result, receiver),
+                error_handler,
+            )
+            parsing_stage.set_completion_handler(self._completion_handler)
+            self._parsing_stage = parsing_stage
+
+            def handle_message(response):
+                if self._is_consumed(response):
+                    self._report_progress(response)
+                    return
+
+                return parsing_stage.submit(response)
+
+        else:
+
+            def handle_message(response):
+                result = self._handle_response(response, receiver)
+
+                if inspect.isawaitable(result):
+                    return self._report_progress_after(result, response)
+
+                self._report_progress(response)
 
         self._subscription_handle = self._query.subscribe(client, handle_message, error_handler)
 
@@ -72,41 +291,70 @@ class HcsTopicListener:
         if self._subscription_handle:
             self._subscription_handle.cancel()
 
-    def _handle_response(
-        self, response: TopicMessage, receiver: Callable[[HcsMessage | HcsMessageWithResponseMetadata], None]
-    ):
-        if len(self._filters) > 0:
-            for response_filter in self._filters:
-                if not response_filter(response):
-                    self._report_invalid_message(response, "Message response was rejected by user-defined filter")
-                    return
+        if self._parsing_stage:
+            self._parsing_stage.cancel()
+
+    def _handle_stream_end(self):
+        # Messages parsed by executor are delivered before completion
+        if self._parsing_stage:
+            self._parsing_stage.end()
+        elif self._completion_handler:
+            self._completion_handler()
+
+    def _report_progress(self, response: TopicMessage):
+        if self._progress_handler:
+            self._progress_handler(response)
 
-        message = self._extract_message(response)
-        if not message:
-            self._report_invalid_message(response, "Extracting message from the mirror response failed")
+    async def _report_progress_after(self, receiver_result: Awaitable[None], response: TopicMessage):
+        await receiver_result
+        self._report_progress(response)
+
+    def _is_consumed(self, response: TopicMessage) -> bool:
+        return self._after_sequence_number is not None and int(response.sequence_number) <= self._after_sequence_number
+
+    def _handle_response(self, response: TopicMessage, receiver: HcsMessageReceiver) -> Awaitable[None] | None:
+        if self._is_consumed(response):
+            # Already consumed messages are skipped before parsing and validation
             return
 
-        if not message.is_valid(self.topic_id):
-            self._report_invalid_message(response, "Extracted message is invalid")
+        if not self._passes_filters(response):
+            return
+
+        result = _parse_payload(self._message_class, self.topic_id, cast(bytes, response.contents))
+        return self._receive_result(response, result, receiver)
+
+    def _deliver_parsed(self, response: TopicMessage, result: _ParsingResult, receiver: HcsMessageReceiver):
+        # Invoked by delivery thread, so receivers can block to apply backpressure
+        if self._passes_filters(response):
+            self._receive_result(response, result, receiver)
+
+        self._report_progress(response)
+
+    def _passes_filters(self, response: TopicMessage) -> bool:
+        for response_filter in self._filters:
+            if not response_filter(response):
+                self._report_invalid_message(response, "Message response was rejected by user-defined filter")
+                return False
+
+        return True
+
+    def _receive_result(
+        self, response: TopicMessage, result: _ParsingResult, receiver: HcsMessageReceiver
+    ) -> Awaitable[None] | None:
+        if isinstance(result, str):
+            self._report_invalid_message(response, result)
             return
 
         if self._include_response_metadata:
-            receiver(
+            return receiver(
                 HcsMessageWithResponseMetadata(
-                    message=message,
+                    message=result,
                     sequence_number=cast(int, response.sequence_number),
                     consensus_timestamp=Timestamp.from_date(response.consensus_timestamp),
                 )
             )
         else:
-            receiver(message)
-
-    def _extract_message(self, response: TopicMessage) -> HcsMessage | None:
-        try:
-            message_content = cast(bytes, response.contents).decode()
-            return self._message_class.from_json(message_content)
-        except Exception as error:
-            LOGGER.warning(f"Failed to extract HCS message from response: {error!s}")
+            return receiver(result)
 
     def _report_invalid_message(self, response: TopicMessage, reason: str):
         message_content = cast(bytes, response.contents).decode()
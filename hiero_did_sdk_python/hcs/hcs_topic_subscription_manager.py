@@ -0,0 +1,440 @@
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Self
+
+from hiero_sdk_python import Client
+from hiero_sdk_python.consensus.topic_message import TopicMessage
+
+from .hcs_topic_transport import HcsGrpcTransport, HcsTopicQuery, HcsTopicSubscriptionHandle, HcsTopicTransport
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BUFFERED_MESSAGES = 10000
+
+# Open-ended reads (live tailing) are represented with max end time, so time ranges can be compared directly
+_END_OF_TIME = datetime.max.replace(tzinfo=UTC)
+_START_OF_TIME = datetime.fromtimestamp(0, tz=UTC)
+
+type _MessageHandler = Callable[[TopicMessage], Awaitable[None] | None]
+type _ErrorHandler = Callable[[Exception], None]
+
+
+class _Subscriber:
+    def __init__(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int | None,
+        on_message: _MessageHandler,
+        on_error: _ErrorHandler | None,
+        completion_handler: Callable[[], None] | None,
+    ):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.limit = limit
+        self.on_message = on_message
+        self.on_error = on_error
+        self.completion_handler = completion_handler
+
+        # Index of the next buffered message to deliver, guarded by shared subscription lock
+        self.next_index = 0
+        self.delivered_count = 0
+        self.is_active = True
+
+        self.drain_lock = Lock()
+        self.is_draining = False
+        self.has_pending_messages = False
+
+
+class _SharedTopicSubscription:
+    """Single mirror node stream of topic messages, fanned out to subscribers.
+
+    Received messages are buffered, so late joiners get the buffered prefix replayed before live messages.
+    Stream is extended with continuation query if subscriber requests messages beyond the end time of current stream.
+    """
+
+    def __init__(
+        self,
+        manager: "HcsTopicSubscriptionManager",
+        client: Client,
+        topic_id: str,
+        start_time: datetime,
+        transport: HcsGrpcTransport,
+        max_buffered_messages: int,
+    ):
+        self._manager = manager
+        self._client = client
+        self._topic_id = topic_id
+        self._start_time = start_time
+        self._transport = transport
+        self._max_buffered_messages = max_buffered_messages
+
+        self._lock = Lock()
+        self._subscribers: list[_Subscriber] = []
+
+        # Buffered messages are trimmed once replay is not possible anymore, offset is the index of the first one
+        self._messages: list[TopicMessage] = []
+        self._messages_offset = 0
+        self._is_replayable = True
+        self._last_sequence_number = 0
+
+        # All messages before this time are buffered (or delivered)
+        self._covered_until = start_time
+        self._requested_end_time = start_time
+        self._stream_end_time = start_time
+        self._stream_id = 0
+        self._stream_handle: HcsTopicSubscriptionHandle | None = None
+        self._is_streaming = False
+        self._is_closed = False
+        self._error: Exception | None = None
+
+    def join(self, subscriber: _Subscriber) -> bool:
+        with self._lock:
+            if self._is_closed or not self._is_replayable or subscriber.start_time < self._start_time:
+                return False
+
+            should_replay = len(self._messages) > 0 or self._covered_until > self._start_time
+
+            self._subscribers.append(subscriber)
+            self._requested_end_time = max(self._requested_end_time, subscriber.end_time)
+
+            should_start_stream = not self._is_streaming and subscriber.end_time > self._covered_until
+            if should_start_stream:
+                self._is_streaming = True
+
+        if should_start_stream:
+            self._start_stream()
+
+        if should_replay:
+            # Buffered prefix is replayed in separate thread, so callbacks are never invoked from the caller thread
+            threading.Thread(target=self._drain, args=(subscriber,), daemon=True).start()
+
+        return True
+
+    def leave(self, subscriber: _Subscriber):
+        with self._lock:
+            subscriber.is_active = False
+            is_released = self._detach(subscriber)
+
+        if is_released:
+            self._release()
+
+    def _detach(self, subscriber: _Subscriber) -> bool:
+        # Must be called with acquired lock. Returns True if the last subscriber is detached
+        if subscriber not in self._subscribers:
+            return False
+
+        self._subscribers.remove(subscriber)
+        self._requested_end_time = max(
+            (subscriber.end_time for subscriber in self._subscribers), default=self._covered_until
+        )
+
+        if self._subscribers or self._is_closed:
+            return False
+
+        self._is_closed = True
+        self._is_streaming = False
+        return True
+
+    def _release(self):
+        with self._lock:
+            stream_handle = self._stream_handle
+            self._stream_handle = None
+
+        if stream_handle:
+            stream_handle.cancel()
+
+        self._manager._remove(self)
+
+    def _start_stream(self):
+        with self._lock:
+            self._stream_id += 1
+            stream_id = self._stream_id
+
+            start_time = self._covered_until
+            self._stream_end_time = self._requested_end_time
+
+            query = self._transport.create_query(self._topic_id).set_start_time(start_time)
+            if self._stream_end_time != _END_OF_TIME:
+                query.set_end_time(self._stream_end_time)
+
+        LOGGER.debug(f"Starting shared subscription to topic {self._topic_id} from {start_time}")
+
+        query.set_completion_handler(self._handle_stream_end)
+        stream_handle = query.subscribe(self._client, self._handle_message, self._handle_error)
+
+        with self._lock:
+            # Stream can end (and continuation can be started) before subscription call returns
+            is_current_stream = self._is_streaming and stream_id == self._stream_id
+            if is_current_stream:
+                self._stream_handle = stream_handle
+
+        if not is_current_stream:
+            stream_handle.cancel()
+
+    def _handle_message(self, response: TopicMessage):
+        with self._lock:
+            if self._is_closed:
+                return
+
+            # Stream reconnection replays messages from the start time of the query
+            sequence_number = int(response.sequence_number)
+            if sequence_number <= self._last_sequence_number:
+                return
+
+            self._last_sequence_number = sequence_number
+            self._messages.append(response)
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            self._drain(subscriber)
+
+        self._trim_messages()
+
+    def _handle_stream_end(self):
+        with self._lock:
+            if self._is_closed:
+                return
+
+            self._covered_until = self._stream_end_time
+            self._stream_handle = None
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            self._drain(subscriber)
+
+        with self._lock:
+            # Remaining subscribers (including the ones joined meanwhile) may need messages beyond the end time
+            should_continue = not self._is_closed and self._requested_end_time > self._covered_until
+            if not should_continue:
+                self._is_streaming = False
+
+        if should_continue:
+            self._start_stream()
+
+    def _handle_error(self, error: Exception):
+        with self._lock:
+            if self._is_closed:
+                return
+
+            self._error = error
+            self._is_closed = True
+            self._is_streaming = False
+            subscribers = list(self._subscribers)
+
+        # Failed subscription is not reused, next readers start a new one
+        self._manager._remove(self)
+
+        for subscriber in subscribers:
+            self._drain(subscriber)
+
+    def _drain(self, subscriber: _Subscriber):
+        # Messages are delivered to each subscriber in order, by a single thread at a time
+        with subscriber.drain_lock:
+            if subscriber.is_draining:
+                subscriber.has_pending_messages = True
+                return
+
+            subscriber.is_draining = True
+
+        while True:
+            self._deliver_messages(subscriber)
+
+            with subscriber.drain_lock:
+                if not subscriber.has_pending_messages:
+                    subscriber.is_draining = False
+                    return
+
+                subscriber.has_pending_messages = False
+
+    def _deliver_messages(self, subscriber: _Subscriber):
+        while (response := self._get_next_message(subscriber)) is not None:
+            if response.consensus_timestamp < subscriber.start_time:
+                continue
+
+            if response.consensus_timestamp >= subscriber.end_time:
+                break
+
+            subscriber.on_message(response)
+            subscriber.delivered_count += 1
+
+            if subscriber.limit is not None and subscriber.delivered_count >= subscriber.limit:
+                break
+        else:
+            # All buffered messages are delivered, subscriber is finished only if its time range is covered
+            with self._lock:
+                if not subscriber.is_active or (not self._error and subscriber.end_time > self._covered_until):
+                    return
+
+        self._finish(subscriber)
+
+    def _get_next_message(self, subscriber: _Subscriber) -> TopicMessage | None:
+        with self._lock:
+            index = subscriber.next_index - self._messages_offset
+
+            if not subscriber.is_active or index >= len(self._messages):
+                return None
+
+            subscriber.next_index += 1
+            return self._messages[index]
+
+    def _finish(self, subscriber: _Subscriber):
+        with self._lock:
+            if not subscriber.is_active:
+                return
+
+            subscriber.is_active = False
+            error = self._error
+            # Finished subscribers do not hold the stream
+            is_released = self._detach(subscriber)
+
+        if is_released:
+            self._release()
+
+        if error:
+            if subscriber.on_error:
+                subscriber.on_error(error)
+        elif subscriber.completion_handler:
+            subscriber.completion_handler()
+
+    def _trim_messages(self):
+        with self._lock:
+            if len(self._messages) > self._max_buffered_messages:
+                # Late joiners need complete prefix, so oversized subscription is not shared anymore
+                self._is_replayable = False
+
+            if self._is_replayable or not self._subscribers:
+                return
+
+            delivered_index = min(subscriber.next_index for subscriber in self._subscribers)
+            del self._messages[: delivered_index - self._messages_offset]
+            self._messages_offset = delivered_index
+
+
+class _SharedTopicSubscriptionHandle:
+    def __init__(self, subscription: _SharedTopicSubscription, subscriber: _Subscriber):
+        self._subscription = subscription
+        self._subscriber = subscriber
+
+    def cancel(self):
+        self._subscription.leave(self._subscriber)
+
+
+class _SharedTopicQuery:
+    def __init__(self, topic_id: str, manager: "HcsTopicSubscriptionManager"):
+        self._topic_id = topic_id
+        self._manager = manager
+        self._start_time = _START_OF_TIME
+        self._end_time = _END_OF_TIME
+        self._limit: int | None = None
+        self._completion_handler: Callable[[], None] | None = None
+
+    def set_start_time(self, dt: datetime) -> Self:
+        self._start_time = dt
+        return self
+
+    def set_end_time(self, dt: datetime) -> Self:
+        self._end_time = dt
+        return self
+
+    def set_limit(self, limit: int) -> Self:
+        self._limit = limit
+        return self
+
+    def set_completion_handler(self, handler: Callable[[], None]) -> Self:
+        self._completion_handler = handler
+        return self
+
+    def subscribe(
+        self, client: Client, on_message: _MessageHandler, on_error: _ErrorHandler | None = None
+    ) -> HcsTopicSubscriptionHandle:
+        subscriber = _Subscriber(
+            self._start_time, self._end_time, self._limit, on_message, on_error, self._completion_handler
+        )
+        return self._manager._subscribe(client, self._topic_id, subscriber)
+
+
+class HcsTopicSubscriptionManager(HcsTopicTransport):
+    """Transport that shares mirror node gRPC subscriptions between concurrent readers of the same topic.
+
+    Readers of a topic (for example, concurrent resolutions of popular revocation registry) are served by a single
+    stream with reference counting - stream is cancelled once the last reader unsubscribes or completes.
+    Readers that join an active subscription receive buffered messages replayed, followed by live messages.
+    If reader requests messages beyond the end time of active stream, stream is extended with continuation query.
+
+    Message handlers are invoked from subscription threads, slow handlers delay delivery to other readers of the topic.
+
+    Args:
+        transport: gRPC transport used for shared subscriptions
+        max_buffered_messages: Max count of buffered messages. Larger subscriptions are not shared with new readers
+    """
+
+    def __init__(
+        self, transport: HcsGrpcTransport | None = None, max_buffered_messages: int = DEFAULT_MAX_BUFFERED_MESSAGES
+    ):
+        self._transport = transport or HcsGrpcTransport()
+        self._max_buffered_messages = max_buffered_messages
+
+        self._lock = Lock()
+        self._subscriptions: dict[tuple[Client, str, bool], list[_SharedTopicSubscription]] = {}
+
+    def create_query(self, topic_id: str) -> HcsTopicQuery:
+        return _SharedTopicQuery(topic_id, self)
+
+    def get_active_subscriptions_count(self) -> int:
+        """Get count of active shared subscriptions
+
+        Returns:
+            object: Count of shared subscriptions
+        """
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def _subscribe(self, client: Client, topic_id: str, subscriber: _Subscriber) -> HcsTopicSubscriptionHandle:
+        # Live tailing subscriptions never complete, so bounded readers are not mixed with them
+        key = (client, topic_id, subscriber.end_time == _END_OF_TIME)
+
+        with self._lock:
+            subscriptions = self._subscriptions.setdefault(key, [])
+
+            for subscription in subscriptions:
+                if subscription.join(subscriber):
+                    return _SharedTopicSubscriptionHandle(subscription, subscriber)
+
+            subscription = _SharedTopicSubscription(
+                self, client, topic_id, subscriber.start_time, self._transport, self._max_buffered_messages
+            )
+            subscriptions.append(subscription)
+            subscription.join(subscriber)
+
+            return _SharedTopicSubscriptionHandle(subscription, subscriber)
+
+    def _remove(self, subscription: _SharedTopicSubscription):
+        with self._lock:
+            for key, subscriptions in list(self._subscriptions.items()):
+                if subscription in subscriptions:
+                    subscriptions.remove(subscription)
+                if not subscriptions:
+                    del self._subscriptions[key]
+
+
+_default_subscription_manager: HcsTopicSubscriptionManager | None = None
+_default_subscription_manager_lock = Lock()
+
+
+def get_default_subscription_manager() -> HcsTopicSubscriptionManager:
+    """Get process-wide topic subscription manager (created on first use).
+
+    Returns:
+        object: Shared topic subscription manager
+    """
+    global _default_subscription_manager
+
+    with _default_subscription_manager_lock:
+        if not _default_subscription_manager:
+            _default_subscription_manager = HcsTopicSubscriptionManager()
+
+        return _default_subscription_manager
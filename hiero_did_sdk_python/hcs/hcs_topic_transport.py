@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Protocol, Self
+
+from hiero_sdk_python import Client, Timestamp, TopicId, TopicMessageQuery
+from hiero_sdk_python.consensus.topic_message import TopicMessage
+
+
+class HcsTopicSubscriptionHandle(Protocol):
+    def cancel(self): ...
+
+
+class HcsTopicQuery(Protocol):
+    """Topic messages query interface (subset of native 'TopicMessageQuery' API)."""
+
+    def set_start_time(self, dt: datetime) -> Self: ...
+
+    def set_end_time(self, dt: datetime) -> Self: ...
+
+    def set_limit(self, limit: int) -> Self: ...
+
+    def set_completion_handler(self, handler: Callable[[], None]) -> Self: ...
+
+    def subscribe(
+        self,
+        client: Client,
+        on_message: Callable[[TopicMessage], Awaitable[None] | None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> HcsTopicSubscriptionHandle: ...
+
+
+class HcsTopicTransport(ABC):
+    """Interface for transports used to read HCS topic messages from mirror node."""
+
+    @abstractmethod
+    def create_query(self, topic_id: str) -> HcsTopicQuery:
+        """Create topic messages query
+
+        Args:
+            topic_id: HCS topic ID
+
+        Returns:
+            object: Topic messages query
+        """
+
+
+class HcsGrpcTransport(HcsTopicTransport):
+    """Mirror node gRPC streaming transport (native SDK subscriptions). Supports both historical reads and live tailing.
+
+    Args:
+        max_backoff: Max delay (in seconds) between reconnection attempts
+        max_attempts: Max count of reconnection attempts
+    """
+
+    def __init__(self, max_backoff: float = 2.0, max_attempts: int = 5):
+        self._max_backoff = max_backoff
+        self._max_attempts = max_attempts
+
+    def create_query(self, topic_id: str) -> HcsTopicQuery:
+        return (
+            TopicMessageQuery(topic_id=TopicId.from_string(topic_id), start_time=Timestamp(0, 0).to_date())
+            .set_max_backoff(self._max_backoff)
+            .set_max_attempts(self._max_attempts)
+        )
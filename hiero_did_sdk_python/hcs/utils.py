@@ -2,6 +2,7 @@ import asyncio
 from typing import Any, cast
 
 from hiero_sdk_python import Client, PrivateKey, ResponseCode, TransactionReceipt
+from hiero_sdk_python.exceptions import PrecheckError
 from hiero_sdk_python.query.query import Query
 from hiero_sdk_python.transaction.transaction import Transaction
 
@@ -41,3 +42,21 @@ async def execute_hcs_query_async(query: Query, client: Client) -> Any:
     query_task = asyncio.create_task(asyncio.to_thread(lambda: query.execute(client)))  # pyright: ignore [reportAttributeAccessIssue]
     await query_task
     return query_task.result()
+
+
+def is_topic_not_found_error(error: Exception) -> bool:
+    """Check if error is caused by HCS topic that does not exist.
+
+    Args:
+        error: Error raised by topic query or subscription
+
+    Returns:
+        object: True if topic is not found
+    """
+    # Consensus nodes reject queries for unknown topics with 'INVALID_TOPIC_ID' precheck status
+    if isinstance(error, PrecheckError):
+        return error.status == ResponseCode.INVALID_TOPIC_ID
+
+    # Mirror node rejects gRPC subscriptions to unknown topics with 'NOT_FOUND' status
+    status_code = getattr(error, "code", None)
+    return callable(status_code) and getattr(status_code(), "name", None) == "NOT_FOUND"
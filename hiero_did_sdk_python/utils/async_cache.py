@@ -0,0 +1,199 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import final
+
+from .cache import DEFAULT_TTL, Cache, seconds
+from .cache_stats import CacheEvent, CacheStats, CacheStatsCollector, CacheStatsListener
+
+
+class AsyncCache[K, V](ABC):
+    """Interface for asynchronous cache instances. Can be used to create custom cache implementations for network-backed storages (Redis, Memcached, etc.).
+
+    Unlike synchronous Cache implementations, async cache instances do not block the event loop on I/O.
+    Atomicity of operations is expected to be provided by underlying storage.
+
+    Cache hits and misses are tracked for all implementations, see 'stats' method.
+
+    Args:
+        default_ttl: Data retention duration (in seconds) used if TTL is not specified on insertion.
+            If None, unspecified TTL is passed to implementation as None
+    """
+
+    def __init__(self, default_ttl: seconds | None = DEFAULT_TTL):
+        self._stats = CacheStatsCollector(type(self).__name__)
+        self._default_ttl = default_ttl
+
+    @final
+    async def get(self, key: K) -> V | None:
+        """Get cached data by key
+
+        Args:
+            key: Cached data key
+
+        Returns:
+            object: Cached data
+        """
+        value = await self.data_get(key)
+        self._stats.record(CacheEvent.MISS if value is None else CacheEvent.HIT)
+        return value
+
+    @final
+    async def get_with_expiration(self, key: K) -> tuple[V, float | None] | None:
+        """Get cached data by key along with its expiration timestamp
+
+        Args:
+            key: Cached data key
+
+        Returns:
+            object: Tuple of cached data and expiration timestamp (None if not tracked by implementation)
+        """
+        record = await self.data_get_with_expiration(key)
+        self._stats.record(CacheEvent.MISS if record is None else CacheEvent.HIT)
+        return record
+
+    @final
+    async def set(self, key: K, value: V, ttl: seconds | None = None) -> None:
+        """Set cached data with key
+
+        Args:
+            key: Data key
+            value: Data to cache
+            ttl: Data retention duration in seconds.
+        """
+        await self.data_set(key, value, ttl or self._default_ttl)
+
+    @final
+    async def remove(self, key: K) -> None:
+        """Remove cached data by key.
+
+        Args:
+            key: Cached data key
+        """
+        await self.data_remove(key)
+
+    @final
+    async def get_many(self, keys: Sequence[K]) -> dict[K, V]:
+        """Get cached data for multiple keys
+
+        Args:
+            keys: Cached data keys
+
+        Returns:
+            object: Dictionary with cached data, missing keys are omitted
+        """
+        values = await self.data_get_many(keys)
+        self._stats.record(CacheEvent.HIT, len(values))
+        self._stats.record(CacheEvent.MISS, len(keys) - len(values))
+        return values
+
+    @final
+    async def set_many(self, items: Mapping[K, V], ttl: seconds | None = None) -> None:
+        """Set cached data for multiple keys
+
+        Args:
+            items: Dictionary with data to cache
+            ttl: Data retention duration in seconds.
+        """
+        await self.data_set_many(items, ttl or self._default_ttl)
+
+    @final
+    async def size(self) -> int:
+        """Get cached records count."""
+        return await self.data_size()
+
+    @final
+    async def flush(self):
+        """Clear cached data."""
+        return await self.data_flush()
+
+    @final
+    async def stats(self) -> CacheStats:
+        """Get cache stats snapshot."""
+        return self._stats.snapshot(entries=await self.size(), bytes_=await self.data_estimated_size())
+
+    @final
+    def add_stats_listener(self, listener: CacheStatsListener):
+        """Add cache stats listener. Listeners are invoked synchronously, so they should be lightweight.
+
+        Args:
+            listener: Callback invoked on each cache event
+        """
+        self._stats.add_listener(listener)
+
+    @abstractmethod
+    async def data_get(self, key: K) -> V | None:
+        pass
+
+    @abstractmethod
+    async def data_set(self, key: K, value: V, ttl: seconds | None):
+        # TTL is None only if it's not specified and cache has no default TTL
+        pass
+
+    @abstractmethod
+    async def data_remove(self, key: K):
+        pass
+
+    @abstractmethod
+    async def data_size(self) -> int:
+        pass
+
+    @abstractmethod
+    async def data_flush(self):
+        pass
+
+    async def data_get_with_expiration(self, key: K) -> tuple[V, float | None] | None:
+        # Default implementation, storages that track records expiration (like Redis TTL) should override it
+        value = await self.data_get(key)
+        return (value, None) if value is not None else None
+
+    async def data_estimated_size(self) -> int | None:
+        # Estimated size of cached records (in bytes), None if not tracked by implementation
+        return None
+
+    async def data_get_many(self, keys: Sequence[K]) -> dict[K, V]:
+        # Default implementation, storages with native batch operations (like Redis MGET) should override it
+        values = await asyncio.gather(*(self.data_get(key) for key in keys))
+        return {key: value for key, value in zip(keys, values, strict=True) if value is not None}
+
+    async def data_set_many(self, items: Mapping[K, V], ttl: seconds | None):
+        # Default implementation, storages with native batch operations (like Redis pipelines) should override it
+        await asyncio.gather(*(self.data_set(key, value, ttl) for key, value in items.items()))
+
+
+type AnyCache[K, V] = Cache[K, V] | AsyncCache[K, V]
+
+
+async def cache_get[K, V](cache: AnyCache[K, V], key: K) -> V | None:
+    """Get cached data from either synchronous or asynchronous cache instance.
+
+    Synchronous cache instances (like MemoryCache) are accessed directly, without additional scheduling overhead.
+    """
+    if isinstance(cache, AsyncCache):
+        return await cache.get(key)
+
+    return cache.get(key)
+
+
+async def cache_get_with_expiration[K, V](cache: AnyCache[K, V], key: K) -> tuple[V, float | None] | None:
+    """Get cached data along with its expiration timestamp from either synchronous or asynchronous cache instance."""
+    if isinstance(cache, AsyncCache):
+        return await cache.get_with_expiration(key)
+
+    return cache.get_with_expiration(key)
+
+
+async def cache_set[K, V](cache: AnyCache[K, V], key: K, value: V, ttl: seconds | None = None) -> None:
+    """Set cached data in either synchronous or asynchronous cache instance."""
+    if isinstance(cache, AsyncCache):
+        await cache.set(key, value, ttl)
+    else:
+        cache.set(key, value, ttl)
+
+
+async def cache_remove[K, V](cache: AnyCache[K, V], key: K) -> None:
+    """Remove cached data from either synchronous or asynchronous cache instance."""
+    if isinstance(cache, AsyncCache):
+        await cache.remove(key)
+    else:
+        cache.remove(key)
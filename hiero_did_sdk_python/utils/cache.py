@@ -1,13 +1,21 @@
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from heapq import heapify, heappop, heappush
+from itertools import count
 from threading import Lock
 from typing import final, override
 
+from .cache_eviction import EvictionPolicy, LRUEvictionPolicy, estimate_size
+from .cache_stats import CacheEvent, CacheStats, CacheStatsCollector, CacheStatsListener
+
 seconds = float
 
 DEFAULT_TTL: seconds = float(3600)
 
+DEFAULT_LOCK_STRIPES_COUNT = 64
+
 
 @dataclass
 class TimestampedRecord[T]:
@@ -23,16 +31,28 @@ class TimestampedRecord[T]:
 
 
 class Cache[K, V](ABC):
-    """Interface for cache instances used across SDK. Can be used to create custom cache implementations."""
+    """Interface for cache instances used across SDK. Can be used to create custom cache implementations.
 
-    def __init__(self):
-        self._locks = {}
+    Access to records is synchronized with a fixed-size table of striped locks (key hash determines the lock),
+    so memory usage of locks does not depend on keys cardinality.
 
-    def _get_lock(self, key: K) -> Lock:
-        if key not in self._locks:
-            self._locks[key] = Lock()
+    Cache hits and misses are tracked for all implementations, see 'stats' method.
+
+    Args:
+        lock_stripes_count: Count of striped locks. Higher values reduce contention between unrelated keys
+        default_ttl: Data retention duration (in seconds) used if TTL is not specified on insertion
+    """
 
-        return self._locks[key]
+    def __init__(self, lock_stripes_count: int = DEFAULT_LOCK_STRIPES_COUNT, default_ttl: seconds = DEFAULT_TTL):
+        if lock_stripes_count < 1:
+            raise ValueError("Lock stripes count must be positive")
+
+        self._locks = tuple(Lock() for _ in range(lock_stripes_count))
+        self._default_ttl = default_ttl
+        self._stats = CacheStatsCollector(type(self).__name__)
+
+    def _get_lock(self, key: K) -> Lock:
+        return self._locks[hash(key) % len(self._locks)]
 
     @final
     def get(self, key: K) -> V | None:
@@ -48,7 +68,31 @@ class Cache[K, V](ABC):
         lock = self._get_lock(key)
 
         with lock:
-            return self.data_get(key)
+            value = self.data_get(key)
+
+        self._stats.record(CacheEvent.MISS if value is None else CacheEvent.HIT)
+
+        return value
+
+    @final
+    def get_with_expiration(self, key: K) -> tuple[V, float | None] | None:
+        """Get cached data by key along with its expiration timestamp
+
+        Args:
+            key: Cached data key
+
+        Returns:
+            object: Tuple of cached data and expiration timestamp (None if not tracked by implementation)
+        """
+
+        lock = self._get_lock(key)
+
+        with lock:
+            record = self.data_get_with_expiration(key)
+
+        self._stats.record(CacheEvent.MISS if record is None else CacheEvent.HIT)
+
+        return record
 
     @final
     def set(self, key: K, value: V, ttl: seconds | None = None) -> None:
@@ -59,7 +103,7 @@ class Cache[K, V](ABC):
             value: Data to cache
             ttl: Data retention duration in seconds.
         """
-        ttl = ttl or DEFAULT_TTL
+        ttl = ttl or self._default_ttl
 
         lock = self._get_lock(key)
 
@@ -88,6 +132,20 @@ class Cache[K, V](ABC):
         """Clear cached data."""
         return self.data_flush()
 
+    @final
+    def stats(self) -> CacheStats:
+        """Get cache stats snapshot."""
+        return self._stats.snapshot(entries=self.size(), bytes_=self.data_estimated_size())
+
+    @final
+    def add_stats_listener(self, listener: CacheStatsListener):
+        """Add cache stats listener. Listeners are invoked synchronously, so they should be lightweight and should not access the cache.
+
+        Args:
+            listener: Callback invoked on each cache event
+        """
+        self._stats.add_listener(listener)
+
     @abstractmethod
     def data_get(self, key: K) -> V | None:
         pass
@@ -108,55 +166,219 @@ class Cache[K, V](ABC):
     def data_flush(self):
         pass
 
+    def data_get_with_expiration(self, key: K) -> tuple[V, float | None] | None:
+        # Default implementation, storages that track records expiration should override it
+        value = self.data_get(key)
+        return (value, None) if value is not None else None
+
+    def data_estimated_size(self) -> int | None:
+        # Estimated size of cached records (in bytes), None if not tracked by implementation
+        return None
+
 
 class MemoryCache[K, V](Cache[K, V]):
-    """In-memory cache implementation. Includes built-in data retention logic."""
+    """In-memory cache implementation. Includes built-in data retention logic.
+
+    Record expiration timestamps are indexed with a min-heap, so retention checks only touch records that have actually expired.
+
+    Cache is unbounded by default. If capacity limits are set, records are evicted according to eviction policy (LRU by default).
 
-    def __init__(self):
-        super().__init__()
+    Args:
+        max_entries: Max count of cached records
+        max_bytes: Max estimated size of cached records (in bytes). Records larger than the limit are not cached
+        eviction_policy: Custom eviction policy instance. Used only if capacity limits are set
+        size_estimator: Custom function for record size estimation (in bytes). Used only if 'max_bytes' limit is set
+        lock_stripes_count: Count of striped locks used for records access synchronization
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction_policy: EvictionPolicy[K] | None = None,
+        size_estimator: Callable[[V], int] = estimate_size,
+        lock_stripes_count: int = DEFAULT_LOCK_STRIPES_COUNT,
+    ):
+        super().__init__(lock_stripes_count)
         self._mem: dict[K, TimestampedRecord[V]] = {}
 
+        # Heap items are (expires_timestamp, insertion_counter, key, record) tuples
+        # Insertion counter keeps ordering stable and prevents comparison of keys (which may not be orderable)
+        self._expiration_heap: list[tuple[float, int, K, TimestampedRecord[V]]] = []
+        self._expiration_counter = count()
+
+        # Guards shared structures (expiration heap, eviction policy and sizes), per-key locks are not enough for them
+        self._lock = Lock()
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size_estimator = size_estimator
+        self._sizes: dict[K, int] = {}
+        self._total_size = 0
+
+        is_bounded = max_entries is not None or max_bytes is not None
+        self._eviction_policy = (eviction_policy or LRUEvictionPolicy[K]()) if is_bounded else None
+
+    @property
+    def total_size(self) -> int:
+        """Estimated size of cached records (in bytes). Tracked only if 'max_bytes' limit is set."""
+        return self._total_size
+
     # Cache clearing logic goes to child class because different classes can use different strategies
     # For example, Redis would use its built-in key TTL mechanic
     def _remove_expired_cached_items(self):
-        for key in self._mem.copy():
-            value = self._mem.get(key, None)
+        now = time.time()
+
+        # Cheap check without acquiring the lock - in most cases there is nothing to remove
+        try:
+            if not self._expiration_heap or self._expiration_heap[0][0] >= now:
+                return
+        except IndexError:
+            # Heap can be emptied by another thread between checks
+            return
+
+        expired_count = 0
+
+        with self._lock:
+            while self._expiration_heap and self._expiration_heap[0][0] < now:
+                _, _, key, record = heappop(self._expiration_heap)
+
+                # Heap items are removed lazily, so the record might have been already overwritten or removed
+                if self._mem.get(key, None) is record:
+                    self._discard(key)
+                    expired_count += 1
+
+        self._stats.record(CacheEvent.EXPIRATION, expired_count)
+
+    def _compact_expiration_heap(self):
+        # Overwritten and removed records leave stale items in the heap until they expire
+        # Rebuild the heap from live records once stale items start to dominate, keeping memory usage proportional to cache size
+        if len(self._expiration_heap) <= 2 * len(self._mem) + 64:
+            return
+
+        self._expiration_heap = [
+            (record.timestamp, next(self._expiration_counter), key, record) for key, record in self._mem.items()
+        ]
+        heapify(self._expiration_heap)
+
+    def _discard(self, key: K):
+        # Must be called with acquired lock
+        self._mem.pop(key, None)
+        self._total_size -= self._sizes.pop(key, 0)
 
-            # Assure value is still there, in multithreaded environment
-            if value is not None:
-                expires_timestamp = value.timestamp
-                now = time.time()
+        if self._eviction_policy:
+            self._eviction_policy.record_remove(key)
 
-                if now > expires_timestamp:
-                    self.data_remove(key)
+    def _is_over_capacity(self, incoming_size: int) -> bool:
+        if self._max_entries is not None and len(self._mem) + 1 > self._max_entries:
+            return True
 
-    @override
-    def data_get(self, key: K) -> V | None:
+        return self._max_bytes is not None and self._total_size + incoming_size > self._max_bytes
+
+    def _make_room(self, key: K, size: int) -> tuple[bool, int]:
+        # Must be called with acquired lock
+        # Returns whether the record can be stored and count of evicted records
+        if not self._eviction_policy:
+            return True, 0
+
+        # Previous version of the record is discarded in any case, so stale data is not served if new value cannot be stored
+        is_existing_key = key in self._mem
+        if is_existing_key:
+            self._discard(key)
+
+        if self._max_bytes is not None and size > self._max_bytes:
+            return False, 0
+
+        evicted_count = 0
+
+        while self._is_over_capacity(size):
+            victim = self._eviction_policy.select_victim()
+
+            if victim is None:
+                break
+
+            if not is_existing_key and not self._eviction_policy.admit(key, victim):
+                return False, evicted_count
+
+            self._discard(victim)
+            evicted_count += 1
+
+        return True, evicted_count
+
+    def _get_record(self, key: K) -> TimestampedRecord[V] | None:
         self._remove_expired_cached_items()
 
         record = self._mem.get(key, None)
+        is_hit = record is not None and time.time() <= record.timestamp
 
-        if record is None:
-            return None
+        if self._eviction_policy:
+            with self._lock:
+                if is_hit:
+                    self._eviction_policy.record_access(key)
+                else:
+                    self._eviction_policy.record_miss(key)
 
-        return record.data
+        return record if is_hit else None
+
+    @override
+    def data_get(self, key: K) -> V | None:
+        record = self._get_record(key)
+        return record.data if record else None
+
+    @override
+    def data_get_with_expiration(self, key: K) -> tuple[V, float | None] | None:
+        # Record timestamp is the expiration timestamp
+        record = self._get_record(key)
+        return (record.data, record.timestamp) if record else None
 
     @override
     def data_set(self, key: K, value: V, ttl: seconds):
         self._remove_expired_cached_items()
 
         expires_timestamp = time.time() + ttl
-        self._mem[key] = TimestampedRecord(value, expires_timestamp)
+        record = TimestampedRecord(value, expires_timestamp)
+        size = self._size_estimator(value) if self._max_bytes is not None else 0
+
+        with self._lock:
+            is_admitted, evicted_count = self._make_room(key, size)
+
+            if is_admitted:
+                self._mem[key] = record
+                heappush(self._expiration_heap, (expires_timestamp, next(self._expiration_counter), key, record))
+                self._compact_expiration_heap()
+
+                if self._max_bytes is not None:
+                    self._sizes[key] = size
+                    self._total_size += size
+
+                if self._eviction_policy:
+                    self._eviction_policy.record_insert(key)
+
+        # Recorded without holding the shared lock, so stats listeners cannot block access to other records
+        self._stats.record(CacheEvent.EVICTION, evicted_count)
+
+    @override
+    def data_estimated_size(self) -> int | None:
+        return self._total_size if self._max_bytes is not None else None
 
     @override
     def data_size(self):
+        self._remove_expired_cached_items()
         return len(self._mem)
 
     @override
     def data_remove(self, key):
-        # del wouldn't be thread safe
-        self._mem.pop(key, None)
+        # Related heap item is left in place and discarded lazily on expiration or compaction
+        with self._lock:
+            self._discard(key)
 
     @override
     def data_flush(self):
-        self._mem = {}
+        with self._lock:
+            self._mem = {}
+            self._expiration_heap = []
+            self._sizes = {}
+            self._total_size = 0
+
+            if self._eviction_policy:
+                self._eviction_policy.clear()
@@ -0,0 +1,141 @@
+import importlib
+import json
+from datetime import datetime
+from enum import Enum
+from types import ModuleType
+
+from .encoding import b64_to_bytes, bytes_to_b64
+
+TYPE_KEY = "__type__"
+VALUE_KEY = "__value__"
+STATE_KEY = "__state__"
+
+# Decoding instantiates classes referenced in serialized data, so only SDK models can be restored
+DECODABLE_MODULE_PREFIXES = ("hiero_did_sdk_python.", "hiero_sdk_python.")
+
+
+def _get_type_name(type_: type) -> str:
+    return f"{type_.__module__}:{type_.__qualname__}"
+
+
+def _is_decodable_module(module_name: str) -> bool:
+    return module_name.startswith(DECODABLE_MODULE_PREFIXES)
+
+
+def _resolve_type(type_name: str) -> type:
+    module_name, _, qualname = type_name.partition(":")
+
+    if not _is_decodable_module(module_name):
+        raise ValueError(f"Type {type_name} is not allowed for cache value decoding")
+
+    resolved: object = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        resolved = getattr(resolved, attribute, None)
+
+        # Modules imported by SDK modules (like 'sqlite3' or 'logging') must not be reachable
+        if isinstance(resolved, ModuleType):
+            raise ValueError(f"Type {type_name} is not allowed for cache value decoding")
+
+    if not isinstance(resolved, type):
+        raise ValueError(f"Cache value decoding failed: {type_name} is not a type")
+
+    # Non-SDK types imported by SDK modules are rejected as well
+    if not _is_decodable_module(resolved.__module__):
+        raise ValueError(f"Type {type_name} is not allowed for cache value decoding")
+
+    return resolved
+
+
+def _resolve_enum_type(type_name: str) -> type[Enum]:
+    type_ = _resolve_type(type_name)
+
+    # Only enums are encoded by value, other types are never constructed from cached data
+    if not issubclass(type_, Enum):
+        raise ValueError(f"Cache value decoding failed: {type_name} is not an enum")
+
+    return type_
+
+
+def _to_tree(value: object) -> object:
+    match value:
+        case None | bool() | int() | float() | str() if not isinstance(value, Enum):
+            return value
+        case list():
+            return [_to_tree(item) for item in value]
+        case tuple():
+            return {TYPE_KEY: "tuple", VALUE_KEY: [_to_tree(item) for item in value]}
+        case dict() if TYPE_KEY not in value and all(isinstance(key, str) for key in value):
+            return {key: _to_tree(item) for key, item in value.items()}
+        case dict():
+            return {TYPE_KEY: "dict", VALUE_KEY: [[_to_tree(key), _to_tree(item)] for key, item in value.items()]}
+        case bytes():
+            return {TYPE_KEY: "bytes", VALUE_KEY: bytes_to_b64(value)}
+        case datetime():
+            return {TYPE_KEY: "datetime", VALUE_KEY: value.isoformat()}
+        case Enum():
+            return {TYPE_KEY: _get_type_name(type(value)), VALUE_KEY: _to_tree(value.value)}
+        case _:
+            state = value.__getstate__()
+            if not isinstance(state, dict):
+                raise TypeError(f"Object of type {type(value).__name__} cannot be encoded as cache value")
+
+            return {TYPE_KEY: _get_type_name(type(value)), STATE_KEY: _to_tree(state)}
+
+
+def _from_tree(tree: object) -> object:
+    match tree:
+        case list():
+            return [_from_tree(item) for item in tree]
+        case {"__type__": "tuple", "__value__": items}:
+            return tuple(_from_tree(item) for item in items)
+        case {"__type__": "dict", "__value__": items}:
+            return {_from_tree(key): _from_tree(item) for key, item in items}
+        case {"__type__": "bytes", "__value__": value}:
+            return b64_to_bytes(value)
+        case {"__type__": "datetime", "__value__": value}:
+            return datetime.fromisoformat(value)
+        case {"__type__": type_name, "__value__": value}:
+            return _resolve_enum_type(type_name)(_from_tree(value))
+        case {"__type__": type_name, "__state__": state}:
+            type_ = _resolve_type(type_name)
+            instance = type_.__new__(type_)
+            instance_state = _from_tree(state)
+
+            if hasattr(instance, "__setstate__"):
+                instance.__setstate__(instance_state)
+            else:
+                instance.__dict__.update(instance_state)
+
+            return instance
+        case dict():
+            return {key: _from_tree(item) for key, item in tree.items()}
+        case _:
+            return tree
+
+
+def encode_cache_value(value: object) -> bytes:
+    """Encode cache value into stable serialized form (type-tagged JSON).
+
+    Custom objects are encoded with their state ('__getstate__'), so SDK models can customize the serialized form.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        Encoded value bytes
+    """
+    return json.dumps(_to_tree(value), separators=(",", ":")).encode()
+
+
+def decode_cache_value(data: bytes) -> object:
+    """Decode cache value from serialized form created by 'encode_cache_value'.
+
+    Only SDK types (from 'hiero_did_sdk_python' and 'hiero_sdk_python' packages) can be restored.
+
+    Args:
+        data: Encoded value bytes
+
+    Returns:
+        Decoded value
+    """
+    return _from_tree(json.loads(data))
@@ -0,0 +1,249 @@
+import sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import override
+
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+_OPAQUE_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def estimate_size(value: object) -> int:
+    """Estimate memory footprint of cached value (in bytes).
+
+    Walks through containers and object attributes, summing up shallow sizes of all reachable objects.
+    Shared objects are counted once, classes, modules and functions are not traversed.
+
+    Args:
+        value: Value to estimate
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, _OPAQUE_TYPES):
+            continue
+
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, _ATOMIC_TYPES):
+            continue
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+
+        if hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                stack.append(getattr(obj, slot))
+
+    return total
+
+
+class EvictionPolicy[K](ABC):
+    """Interface for cache eviction policies. Can be used to create custom eviction policies.
+
+    Policy instances are not thread safe - cache implementation is responsible for synchronization.
+    """
+
+    @abstractmethod
+    def record_insert(self, key: K):
+        """Track new cache record"""
+
+    @abstractmethod
+    def record_access(self, key: K):
+        """Track cache hit for existing record"""
+
+    def record_miss(self, key: K):  # noqa: B027
+        """Track cache miss. No-op by default, used by frequency-based admission policies."""
+
+    @abstractmethod
+    def record_remove(self, key: K):
+        """Stop tracking removed record"""
+
+    @abstractmethod
+    def select_victim(self) -> K | None:
+        """Select record to evict. Returns None if there are no tracked records."""
+
+    def admit(self, candidate: K, victim: K) -> bool:
+        """Decide whether new record should be stored in place of eviction victim. Always admits by default."""
+        return True
+
+    @abstractmethod
+    def clear(self):
+        """Stop tracking all records"""
+
+
+class LRUEvictionPolicy[K](EvictionPolicy[K]):
+    """Least Recently Used eviction policy."""
+
+    def __init__(self):
+        self._order: OrderedDict[K, None] = OrderedDict()
+
+    @override
+    def record_insert(self, key: K):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    @override
+    def record_access(self, key: K):
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    @override
+    def record_remove(self, key: K):
+        self._order.pop(key, None)
+
+    @override
+    def select_victim(self) -> K | None:
+        return next(iter(self._order), None)
+
+    @override
+    def clear(self):
+        self._order.clear()
+
+
+class LFUEvictionPolicy[K](EvictionPolicy[K]):
+    """Least Frequently Used eviction policy. Ties are resolved in LRU order.
+
+    Uses frequency buckets, so all operations have O(1) complexity.
+    """
+
+    def __init__(self):
+        self._frequencies: dict[K, int] = {}
+        self._buckets: dict[int, OrderedDict[K, None]] = {}
+        self._min_frequency = 0
+
+    def _move_to_bucket(self, key: K, frequency: int):
+        self._frequencies[key] = frequency
+        self._buckets.setdefault(frequency, OrderedDict())[key] = None
+
+    def _remove_from_bucket(self, key: K, frequency: int) -> bool:
+        # Returns True if bucket is emptied and removed
+        bucket = self._buckets[frequency]
+        bucket.pop(key, None)
+
+        if bucket:
+            return False
+
+        del self._buckets[frequency]
+        return True
+
+    @override
+    def record_insert(self, key: K):
+        if key in self._frequencies:
+            self.record_access(key)
+            return
+
+        self._move_to_bucket(key, 1)
+        self._min_frequency = 1
+
+    @override
+    def record_access(self, key: K):
+        frequency = self._frequencies.get(key, None)
+
+        if frequency is None:
+            return
+
+        self._move_to_bucket(key, frequency + 1)
+
+        # Accessed key is the only one left in min frequency bucket, so it's moved to the next min frequency bucket
+        if self._remove_from_bucket(key, frequency) and self._min_frequency == frequency:
+            self._min_frequency = frequency + 1
+
+    @override
+    def record_remove(self, key: K):
+        frequency = self._frequencies.pop(key, None)
+
+        if frequency is not None:
+            self._remove_from_bucket(key, frequency)
+
+    @override
+    def select_victim(self) -> K | None:
+        bucket = self._buckets.get(self._min_frequency, None)
+
+        if not bucket and self._buckets:
+            # Min frequency bucket can be emptied only by explicit removals (evictions are followed by insertions),
+            # so min frequency is looked up only in this case
+            self._min_frequency = min(self._buckets)
+            bucket = self._buckets[self._min_frequency]
+
+        return next(iter(bucket), None) if bucket else None
+
+    @override
+    def clear(self):
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+
+class TinyLFUEvictionPolicy[K](LRUEvictionPolicy[K]):
+    """TinyLFU admission policy on top of LRU eviction.
+
+    Access frequencies (including misses) are approximated with Count-Min sketch that is periodically aged.
+    New record is admitted only if its estimated frequency is not lower than frequency of LRU eviction victim,
+    which protects frequently used records from being flushed by one-off lookups.
+
+    Args:
+        sketch_width: Count-Min sketch row width. Should be comparable to expected cache capacity
+        sample_size_multiplier: Sketch is aged (counters are halved) after 'sketch_width * sample_size_multiplier' increments
+    """
+
+    SKETCH_DEPTH = 4
+    MAX_COUNTER_VALUE = 15
+
+    def __init__(self, sketch_width: int = 4096, sample_size_multiplier: int = 10):
+        super().__init__()
+        self._sketch_width = sketch_width
+        self._sketch = [[0] * sketch_width for _ in range(self.SKETCH_DEPTH)]
+        self._sample_size = sketch_width * sample_size_multiplier
+        self._increments_count = 0
+
+    def _get_indexes(self, key: K) -> list[int]:
+        return [hash((row, key)) % self._sketch_width for row in range(self.SKETCH_DEPTH)]
+
+    def _increment(self, key: K):
+        for row, index in zip(self._sketch, self._get_indexes(key), strict=True):
+            if row[index] < self.MAX_COUNTER_VALUE:
+                row[index] += 1
+
+        self._increments_count += 1
+
+        if self._increments_count >= self._sample_size:
+            self._age()
+
+    def _age(self):
+        for row in self._sketch:
+            for index, value in enumerate(row):
+                row[index] = value >> 1
+
+        self._increments_count //= 2
+
+    def frequency(self, key: K) -> int:
+        """Get estimated access frequency of the key"""
+        return min(row[index] for row, index in zip(self._sketch, self._get_indexes(key), strict=True))
+
+    @override
+    def record_access(self, key: K):
+        self._increment(key)
+        super().record_access(key)
+
+    @override
+    def record_miss(self, key: K):
+        self._increment(key)
+
+    @override
+    def admit(self, candidate: K, victim: K) -> bool:
+        return self.frequency(candidate) >= self.frequency(victim)
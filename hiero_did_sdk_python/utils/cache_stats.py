@@ -0,0 +1,154 @@
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from threading import Lock
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CacheEvent(StrEnum):
+    """Enum for cache events reported to stats listeners"""
+
+    HIT = "hit"
+    MISS = "miss"
+    EXPIRATION = "expiration"
+    EVICTION = "eviction"
+    LOAD = "load"
+
+
+# Cache stats listener receives stats name, event and event value (load duration in seconds or events count)
+type CacheStatsListener = Callable[[str, CacheEvent, float], None]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Cache stats snapshot.
+
+    Attributes:
+        hits: Count of lookups served from cache
+        misses: Count of lookups that were not served from cache
+        expirations: Count of records removed due to expiration
+        evictions: Count of records evicted due to capacity limits
+        loads: Count of data loads (network requests) performed on cache misses and refreshes
+        load_time: Total duration of data loads (in seconds)
+        entries: Count of cached records (if tracked)
+        bytes: Estimated size of cached records in bytes (if tracked)
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    loads: int = 0
+    load_time: float = 0.0
+    entries: int | None = None
+    bytes: int | None = None
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups served from cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def average_load_time(self) -> float:
+        """Average duration of data load (in seconds)"""
+        return self.load_time / self.loads if self.loads else 0.0
+
+
+class CacheStatsCollector:
+    """Thread-safe cache stats counters with optional listeners.
+
+    Args:
+        name: Stats name (cache class name or cached object type) passed to listeners
+        listeners: Stats listeners
+    """
+
+    def __init__(self, name: str, listeners: list[CacheStatsListener] | None = None):
+        self.name = name
+        self._listeners = list(listeners or [])
+        self._lock = Lock()
+        self._counters: dict[CacheEvent, int] = dict.fromkeys(CacheEvent, 0)
+        self._load_time = 0.0
+
+    def add_listener(self, listener: CacheStatsListener):
+        """Add stats listener
+
+        Args:
+            listener: Callback invoked on each recorded event
+        """
+        self._listeners.append(listener)
+
+    def record(self, event: CacheEvent, count: int = 1):
+        """Record cache event(s)
+
+        Args:
+            event: Cache event
+            count: Count of events
+        """
+        if count < 1:
+            return
+
+        with self._lock:
+            self._counters[event] += count
+
+        self._notify(event, count)
+
+    def record_load(self, duration: float):
+        """Record data load
+
+        Args:
+            duration: Load duration in seconds
+        """
+        with self._lock:
+            self._counters[CacheEvent.LOAD] += 1
+            self._load_time += duration
+
+        self._notify(CacheEvent.LOAD, duration)
+
+    @contextmanager
+    def measure_load(self) -> Iterator[None]:
+        """Context manager that records data load with its duration. Failed loads are recorded as well."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_load(time.perf_counter() - start)
+
+    def snapshot(self, entries: int | None = None, bytes_: int | None = None) -> CacheStats:
+        """Get stats snapshot
+
+        Args:
+            entries: Count of cached records
+            bytes_: Estimated size of cached records in bytes
+
+        Returns:
+            object: Stats snapshot
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._counters[CacheEvent.HIT],
+                misses=self._counters[CacheEvent.MISS],
+                expirations=self._counters[CacheEvent.EXPIRATION],
+                evictions=self._counters[CacheEvent.EVICTION],
+                loads=self._counters[CacheEvent.LOAD],
+                load_time=self._load_time,
+                entries=entries,
+                bytes=bytes_,
+            )
+
+    def reset(self):
+        """Reset stats counters"""
+        with self._lock:
+            self._counters = dict.fromkeys(CacheEvent, 0)
+            self._load_time = 0.0
+
+    def _notify(self, event: CacheEvent, value: float):
+        for listener in self._listeners:
+            try:
+                listener(self.name, event, value)
+            except Exception as error:
+                LOGGER.warning(f"Cache stats listener failed: {error!s}")
@@ -0,0 +1,76 @@
+import math
+
+from .cache import MemoryCache, seconds
+
+DEFAULT_NOT_FOUND_TTL: seconds = float(30)
+DEFAULT_NEGATIVE_CACHE_MAX_ENTRIES = 10_000
+
+
+class NegativeCache[K, V]:
+    """Cache for failed lookup results. Kept separate from cache of resolved objects, so failed lookups cannot evict them.
+
+    Retention depends on failure class:
+
+    - Invalid identifiers (parsing errors) are deterministic, so related results are cached permanently
+    - "Not found" results may change once the object is published, so they are cached for a short period
+
+    Transient failures (network errors, timeouts, etc.) should not be cached.
+    Cache is bounded - once the limit is reached, least recently used results are evicted.
+
+    Args:
+        not_found_ttl: Retention duration (in seconds) of "not found" results. Non-positive value disables their caching
+        max_entries: Max count of cached results
+    """
+
+    def __init__(
+        self, not_found_ttl: seconds = DEFAULT_NOT_FOUND_TTL, max_entries: int = DEFAULT_NEGATIVE_CACHE_MAX_ENTRIES
+    ):
+        self._not_found_ttl = not_found_ttl
+        self._cache = MemoryCache[K, V](max_entries=max_entries)
+
+    def get(self, key: K) -> V | None:
+        """Get cached failed lookup result
+
+        Args:
+            key: Lookup key
+
+        Returns:
+            object: Cached result
+        """
+        record = self._cache.get_with_expiration(key)
+        return record[0] if record else None
+
+    def set_invalid(self, key: K, result: V):
+        """Cache result of lookup with invalid identifier (permanently)
+
+        Args:
+            key: Lookup key
+            result: Lookup result
+        """
+        self._cache.set(key, result, math.inf)
+
+    def set_not_found(self, key: K, result: V):
+        """Cache "not found" lookup result (for a short period)
+
+        Args:
+            key: Lookup key
+            result: Lookup result
+        """
+        if self._not_found_ttl > 0:
+            self._cache.set(key, result, self._not_found_ttl)
+
+    def remove(self, key: K):
+        """Remove cached result
+
+        Args:
+            key: Lookup key
+        """
+        self._cache.remove(key)
+
+    def size(self) -> int:
+        """Get cached results count."""
+        return self._cache.size()
+
+    def flush(self):
+        """Clear cached results."""
+        self._cache.flush()
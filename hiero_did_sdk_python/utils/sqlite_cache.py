@@ -0,0 +1,200 @@
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+from typing import cast, override
+
+from .cache import DEFAULT_LOCK_STRIPES_COUNT, Cache, seconds
+from .cache_codec import decode_cache_value, encode_cache_value
+from .cache_stats import CacheEvent
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WRITE_BATCH_SIZE = 64
+DEFAULT_WRITE_BATCH_INTERVAL: seconds = 1.0
+DEFAULT_PERSISTENT_TTL: seconds = float(7 * 24 * 3600)
+
+# Pending write is either (encoded value, expiration timestamp) pair or None for pending removal
+_PendingWrite = tuple[bytes, float] | None
+
+
+class SqliteCache[K: str, V](Cache[K, V]):
+    """Persistent cache implementation backed by SQLite database.
+
+    Cached records survive process restarts, so resolvers can resume from cached state instead of replaying topics from the start.
+    Database is opened in WAL mode, so reads are not blocked by writes (including writes from other processes).
+
+    Writes are buffered and committed in batches (one transaction per batch).
+    Buffered writes are visible to reads immediately, but are persisted only when batch is full, batch interval has elapsed,
+    or 'commit'/'close' is called.
+
+    Values are stored in serialized form (see 'encode_cache_value'), so each read returns a new value instance.
+
+    Args:
+        path: Database file path. Use ':memory:' for non-persistent database
+        write_batch_size: Max count of buffered writes
+        write_batch_interval: Max age of buffered writes (in seconds). Checked on cache operations
+        encoder: Custom function for value serialization
+        decoder: Custom function for value deserialization
+        default_ttl: Data retention duration (in seconds) used if TTL is not specified on insertion.
+            Cached DID documents and revocation registries are refreshed incrementally, so long retention is usually safe
+        lock_stripes_count: Count of striped locks used for records access synchronization
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        write_batch_interval: seconds = DEFAULT_WRITE_BATCH_INTERVAL,
+        encoder: Callable[[V], bytes] = encode_cache_value,
+        decoder: Callable[[bytes], object] = decode_cache_value,
+        default_ttl: seconds = DEFAULT_PERSISTENT_TTL,
+        lock_stripes_count: int = DEFAULT_LOCK_STRIPES_COUNT,
+    ):
+        super().__init__(lock_stripes_count, default_ttl)
+
+        if write_batch_size < 1:
+            raise ValueError("Write batch size must be positive")
+
+        self._write_batch_size = write_batch_size
+        self._write_batch_interval = write_batch_interval
+        self._encoder = encoder
+        self._decoder = decoder
+
+        # Connection is shared between threads, access is serialized with the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection_lock = Lock()
+
+        self._pending_writes: dict[K, _PendingWrite] = {}
+        self._last_commit_timestamp = time.monotonic()
+
+        with self._connection_lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # Durability of the latest transactions is not critical for cache, so fsync on each commit is avoided
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_records (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_records_expires_at ON cache_records (expires_at)"
+            )
+
+    def commit(self):
+        """Persist buffered writes and remove expired records from the database."""
+        with self._connection_lock:
+            self._commit_pending_writes()
+
+    def close(self):
+        """Persist buffered writes and close database connection."""
+        with self._connection_lock:
+            self._commit_pending_writes()
+            self._connection.close()
+
+    def _commit_pending_writes(self):
+        # Must be called with acquired connection lock
+        pending_writes, self._pending_writes = self._pending_writes, {}
+        self._last_commit_timestamp = time.monotonic()
+
+        upserts = [(key, *write) for key, write in pending_writes.items() if write is not None]
+        removals = [(key,) for key, write in pending_writes.items() if write is None]
+
+        with self._connection:
+            self._connection.execute("BEGIN")
+
+            if upserts:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO cache_records (key, value, expires_at) VALUES (?, ?, ?)", upserts
+                )
+            if removals:
+                self._connection.executemany("DELETE FROM cache_records WHERE key = ?", removals)
+
+            expired_count = self._connection.execute(
+                "DELETE FROM cache_records WHERE expires_at < ?", (time.time(),)
+            ).rowcount
+
+        self._stats.record(CacheEvent.EXPIRATION, expired_count)
+
+    def _commit_if_batch_is_ready(self):
+        # Must be called with acquired connection lock
+        is_batch_full = len(self._pending_writes) >= self._write_batch_size
+        is_batch_stale = time.monotonic() - self._last_commit_timestamp >= self._write_batch_interval
+
+        if self._pending_writes and (is_batch_full or is_batch_stale):
+            self._commit_pending_writes()
+
+    @override
+    def data_get(self, key: K) -> V | None:
+        record = self.data_get_with_expiration(key)
+        return record[0] if record else None
+
+    @override
+    def data_get_with_expiration(self, key: K) -> tuple[V, float | None] | None:
+        with self._connection_lock:
+            if key in self._pending_writes:
+                row = self._pending_writes[key]
+            else:
+                row = self._connection.execute(
+                    "SELECT value, expires_at FROM cache_records WHERE key = ?", (key,)
+                ).fetchone()
+
+            self._commit_if_batch_is_ready()
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+
+        # Expired rows are purged on commit, until then they are just skipped
+        if time.time() > expires_at:
+            return None
+
+        try:
+            return cast(V, self._decoder(value)), expires_at
+        except Exception as error:
+            LOGGER.warning(f"Cannot decode cached value for key {key}, skipping: {error!s}")
+            return None
+
+    @override
+    def data_set(self, key: K, value: V, ttl: seconds):
+        try:
+            encoded_value = self._encoder(value)
+        except Exception as error:
+            LOGGER.warning(f"Cannot encode value for key {key}, skipping caching: {error!s}")
+            return
+
+        with self._connection_lock:
+            self._pending_writes[key] = (encoded_value, time.time() + ttl)
+            self._commit_if_batch_is_ready()
+
+    @override
+    def data_remove(self, key: K):
+        with self._connection_lock:
+            self._pending_writes[key] = None
+            self._commit_if_batch_is_ready()
+
+    @override
+    def data_size(self) -> int:
+        with self._connection_lock:
+            self._commit_pending_writes()
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM cache_records").fetchone()
+
+        return count
+
+    @override
+    def data_estimated_size(self) -> int | None:
+        with self._connection_lock:
+            self._commit_pending_writes()
+            (size,) = self._connection.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache_records").fetchone()
+
+        return size
+
+    @override
+    def data_flush(self):
+        with self._connection_lock:
+            self._pending_writes = {}
+
+            with self._connection:
+                self._connection.execute("BEGIN")
+                self._connection.execute("DELETE FROM cache_records")
@@ -0,0 +1,94 @@
+import time
+from typing import override
+
+from .async_cache import AnyCache, AsyncCache, cache_get_with_expiration, cache_remove, cache_set
+from .cache import Cache, MemoryCache, seconds
+
+DEFAULT_L1_TTL: seconds = float(30)
+DEFAULT_L1_MAX_ENTRIES = 1024
+
+
+class TieredCache[K, V](AsyncCache[K, V]):
+    """Two-tier cache: small in-process L1 cache layered over shared L2 cache.
+
+    Intended for deployments with multiple worker processes - L2 cache (for example, SqliteCache on shared file
+    or custom network-backed AsyncCache) is shared between workers, so a record resolved by one worker is reused by the others.
+
+    - Reads check L1 first. L2 hits are promoted to L1 (read-through)
+    - Writes go to L2 and L1 (write-through)
+    - L1 records never outlive related L2 records. L1 TTL is capped by L2 record expiration (if tracked by L2 implementation)
+    - If TTL is not specified on insertion, L2 record is stored with L2 default TTL (for example, SqliteCache keeps it for 7 days)
+
+    Records updated by other workers become visible once related L1 record expires, so staleness is bounded by 'l1_ttl'.
+
+    Args:
+        l2_cache: Shared cache instance (synchronous or asynchronous)
+        l1_cache: In-process cache instance. If not provided, bounded in-memory cache is used
+        l1_ttl: Max retention duration (in seconds) of L1 records
+    """
+
+    def __init__(self, l2_cache: AnyCache[K, V], l1_cache: Cache[K, V] | None = None, l1_ttl: seconds = DEFAULT_L1_TTL):
+        # Unspecified TTL is passed to L2 cache, so its own default TTL is applied
+        super().__init__(default_ttl=None)
+        self._l2_cache = l2_cache
+        self._l1_cache: Cache[K, V] = l1_cache or MemoryCache[K, V](max_entries=DEFAULT_L1_MAX_ENTRIES)
+        self._l1_ttl = l1_ttl
+
+    def _get_l1_ttl(self, expires_timestamp: float | None) -> seconds:
+        if expires_timestamp is None:
+            return self._l1_ttl
+
+        return min(self._l1_ttl, expires_timestamp - time.time())
+
+    @override
+    async def data_get(self, key: K) -> V | None:
+        record = await self.data_get_with_expiration(key)
+        return record[0] if record else None
+
+    @override
+    async def data_get_with_expiration(self, key: K) -> tuple[V, float | None] | None:
+        l1_record = self._l1_cache.get_with_expiration(key)
+
+        if l1_record is not None:
+            return l1_record
+
+        l2_record = await cache_get_with_expiration(self._l2_cache, key)
+
+        if l2_record is None:
+            return None
+
+        value, expires_timestamp = l2_record
+        l1_ttl = self._get_l1_ttl(expires_timestamp)
+
+        # Non-positive TTL means that L2 record is about to expire, there is no point to promote it
+        if l1_ttl > 0:
+            self._l1_cache.set(key, value, l1_ttl)
+
+        return l2_record
+
+    @override
+    async def data_set(self, key: K, value: V, ttl: seconds | None):
+        await cache_set(self._l2_cache, key, value, ttl)
+        self._l1_cache.set(key, value, min(self._l1_ttl, ttl) if ttl else self._l1_ttl)
+
+    @override
+    async def data_remove(self, key: K):
+        self._l1_cache.remove(key)
+        await cache_remove(self._l2_cache, key)
+
+    @override
+    async def data_size(self) -> int:
+        # L1 records are a subset of L2 records
+        if isinstance(self._l2_cache, AsyncCache):
+            return await self._l2_cache.size()
+
+        return self._l2_cache.size()
+
+    @override
+    async def data_flush(self):
+        self._l1_cache.flush()
+
+        if isinstance(self._l2_cache, AsyncCache):
+            await self._l2_cache.flush()
+        else:
+            self._l2_cache.flush()
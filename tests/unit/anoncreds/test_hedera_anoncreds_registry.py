@@ -1,8 +1,10 @@
+import asyncio
 import time
 from unittest.mock import NonCallableMagicMock, call
 
 import pytest
-from hiero_sdk_python import Client, Timestamp
+from hiero_sdk_python import Client, ResponseCode, Timestamp
+from hiero_sdk_python.exceptions import PrecheckError
 from pytest_mock import MockerFixture
 
 from hiero_did_sdk_python import (
@@ -16,6 +18,7 @@ from hiero_did_sdk_python import (
     MemoryCache,
     RevRegDefValue,
 )
+from hiero_did_sdk_python.anoncreds import hedera_anoncreds_registry
 from hiero_did_sdk_python.anoncreds.models.revocation import (
     HcsRevRegEntryMessage,
     RevRegDefWithHcsMetadata,
@@ -35,15 +38,22 @@ from hiero_did_sdk_python.anoncreds.types import (
     RevRegDefState,
     SchemaState,
 )
-from hiero_did_sdk_python.anoncreds.utils import AnonCredsObjectType, build_anoncreds_identifier
+from hiero_did_sdk_python.anoncreds.utils import (
+    AnonCredsObjectType,
+    build_anoncreds_identifier,
+    parse_anoncreds_identifier,
+)
 from hiero_did_sdk_python.hcs import (
     HcsFileService,
     HcsMessageResolver,
     HcsMessageTransaction,
     HcsMessageWithResponseMetadata,
+    HcsTopicCursor,
     HcsTopicService,
 )
+from hiero_did_sdk_python.utils.negative_cache import NegativeCache
 from tests.integration.conftest import OPERATOR_KEY_DER
+from tests.unit.utils.common import DictAsyncCache
 
 ISSUER_ID = "did:hedera:testnet:zvAQyPeUecGck2EsxcsihxhAB6jZurFrBbj2gC7CNkS5o_0.0.5063027"
 
@@ -236,6 +246,75 @@ class TestHederaAnonCredsRegistry:
 
             mock_hcs_file_service.resolve_file.assert_not_awaited()
 
+        async def test_resolve_caches_not_found(
+            self,
+            mock_client: Client,
+            mock_hcs_file_service: NonCallableMagicMock,
+        ):
+            mock_hcs_file_service.resolve_file.return_value = None
+
+            registry = HederaAnonCredsRegistry(mock_client, negative_cache_instance=NegativeCache(not_found_ttl=0.01))
+
+            first_result = await registry.get_schema(MOCK_SCHEMA_ID)
+            second_result = await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert second_result == first_result
+            mock_hcs_file_service.resolve_file.assert_awaited_once()
+
+            await asyncio.sleep(0.02)
+
+            await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert mock_hcs_file_service.resolve_file.await_count == 2
+
+        async def test_resolve_caches_missing_topic(self, mock_client: Client, mocker: MockerFixture):
+            MockHcsTopicService = mocker.patch(
+                "hiero_did_sdk_python.hcs.hcs_file.hcs_file_service.HcsTopicService", autospec=HcsTopicService
+            )
+            mock_get_topic_info = MockHcsTopicService.return_value.get_topic_info
+            mock_get_topic_info.side_effect = PrecheckError(ResponseCode.INVALID_TOPIC_ID)
+
+            registry = HederaAnonCredsRegistry(mock_client)
+
+            first_result = await registry.get_schema(MOCK_SCHEMA_ID)
+            second_result = await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert first_result.resolution_metadata["error"] == "notFound"
+            assert second_result == first_result
+            mock_get_topic_info.assert_awaited_once_with(MOCK_SCHEMA_TOPIC_ID)
+
+        async def test_resolve_caches_invalid_id(self, mock_client: Client, mocker: MockerFixture):
+            mock_parse_identifier = mocker.patch(
+                "hiero_did_sdk_python.anoncreds.hedera_anoncreds_registry.parse_anoncreds_identifier",
+                side_effect=parse_anoncreds_identifier,
+            )
+
+            registry = HederaAnonCredsRegistry(mock_client, negative_cache_instance=NegativeCache(not_found_ttl=0))
+
+            first_result = await registry.get_schema("invalid-schema-id")
+            second_result = await registry.get_schema("invalid-schema-id")
+
+            assert first_result.resolution_metadata["error"] == "otherError"
+            assert second_result == first_result
+
+            # Identifier is parsed on resolution and on error classification
+            assert mock_parse_identifier.call_count == 2
+
+        async def test_resolve_does_not_cache_other_errors(
+            self,
+            mock_client: Client,
+            mock_hcs_file_service: NonCallableMagicMock,
+        ):
+            mock_hcs_file_service.resolve_file.side_effect = Exception("Network error")
+
+            registry = HederaAnonCredsRegistry(mock_client)
+
+            await registry.get_schema(MOCK_SCHEMA_ID)
+            result = await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert result.resolution_metadata["error"] == "otherError"
+            assert mock_hcs_file_service.resolve_file.await_count == 2
+
         async def test_registers_schema_as_hcs_file(
             self,
             mock_client: Client,
@@ -270,6 +349,36 @@ class TestHederaAnonCredsRegistry:
 
             mock_cache_get.assert_called_once_with(MOCK_SCHEMA_TOPIC_ID)
 
+        async def test_resolve_uses_async_cache(self, mock_client: Client, mock_hcs_file_service: NonCallableMagicMock):
+            mock_hcs_file_service.resolve_file.return_value = MOCK_SCHEMA.to_json().encode()
+
+            cache_instance = DictAsyncCache[str, object]()
+            registry = HederaAnonCredsRegistry(mock_client, cache_instance)
+
+            first_result = await registry.get_schema(MOCK_SCHEMA_ID)
+            second_result = await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert first_result.schema == MOCK_SCHEMA
+            assert second_result.schema == MOCK_SCHEMA
+            assert await cache_instance.get(MOCK_SCHEMA_TOPIC_ID) == MOCK_SCHEMA
+
+            mock_hcs_file_service.resolve_file.assert_awaited_once()
+
+        async def test_tracks_cache_stats(self, mock_client: Client, mock_hcs_file_service: NonCallableMagicMock):
+            mock_hcs_file_service.resolve_file.return_value = MOCK_SCHEMA.to_json().encode()
+
+            registry = HederaAnonCredsRegistry(mock_client, DictAsyncCache[str, object]())
+
+            await registry.get_schema(MOCK_SCHEMA_ID)
+            await registry.get_schema(MOCK_SCHEMA_ID)
+
+            cache_stats = registry.get_cache_stats()
+
+            assert cache_stats["SCHEMA"].hits == 1
+            assert cache_stats["SCHEMA"].misses == 1
+            assert cache_stats["SCHEMA"].loads == 1
+            assert cache_stats["PUBLIC_CRED_DEF"].loads == 0
+
     class TestCredDef:
         async def test_resolves_cred_def_hcs_file(
             self,
@@ -711,8 +820,8 @@ class TestHederaAnonCredsRegistry:
                 revocation_list_metadata={},
             )
 
-            assert mock_hcs_file_service.resolve_file.await_count == 2
-            mock_hcs_file_service.resolve_file.assert_awaited_with(MOCK_REV_REG_DEF_TOPIC_ID)
+            # Second lookup is served from negative cache
+            mock_hcs_file_service.resolve_file.assert_awaited_once_with(MOCK_REV_REG_DEF_TOPIC_ID)
 
             mock_hcs_message_transaction.execute.assert_not_awaited()
 
@@ -795,6 +904,10 @@ class TestHederaAnonCredsRegistry:
 
             mock_hcs_message_resolver.execute.assert_not_awaited()
 
+            rev_list_stats = registry.get_cache_stats()["REV_REG_ENTRY"]
+            assert rev_list_stats.hits == 1
+            assert rev_list_stats.loads == 0
+
         async def test_resolves_future_state_using_cache(
             self,
             mock_client: Client,
@@ -827,3 +940,7 @@ class TestHederaAnonCredsRegistry:
             ])
 
             mock_hcs_message_resolver.execute.assert_awaited_once()
+
+            # Resolution resumes strictly after the last cached message
+            resolver_kwargs = hedera_anoncreds_registry.HcsMessageResolver.call_args.kwargs
+            assert resolver_kwargs["resume_after"] == HcsTopicCursor(Timestamp(seconds=200, nanos=0), 2)
@@ -17,6 +17,7 @@ from hiero_did_sdk_python.did.hcs.events.verification_relationship.hcs_did_updat
     HcsDidUpdateVerificationRelationshipEvent,
 )
 from hiero_did_sdk_python.did.hcs.hcs_did_message import HcsDidMessage
+from hiero_did_sdk_python.utils.cache_codec import decode_cache_value, encode_cache_value
 from hiero_did_sdk_python.utils.encoding import bytes_to_b58, bytes_to_b64, multibase_encode
 from hiero_did_sdk_python.utils.keys import get_key_type
 
@@ -586,3 +587,76 @@ class TestDidDocument:
         assert doc.created
         assert doc.updated
         assert not doc.deactivated
+
+    @pytest.mark.asyncio
+    async def test_restores_from_json_payload(self, test_key):
+        """restores DID document from JSON payload and keeps processing events"""
+        key1 = PrivateKey.generate()
+        key1_type = get_key_type(key1)
+
+        messages = [
+            HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                IDENTIFIER_2,
+                HcsDidUpdateDidOwnerEvent(IDENTIFIER_2, IDENTIFIER_2, test_key.public_key, test_key.key_type),
+            ),
+            HcsDidMessage(
+                DidDocumentOperation.UPDATE,
+                IDENTIFIER_2,
+                HcsDidUpdateServiceEvent(f"{IDENTIFIER_2}#service-1", "LinkedDomains", "https://test.identity.com"),
+            ),
+            HcsDidMessage(
+                DidDocumentOperation.UPDATE,
+                IDENTIFIER_2,
+                HcsDidUpdateVerificationRelationshipEvent(
+                    f"{IDENTIFIER_2}#key-1", key1.public_key(), IDENTIFIER_2, "authentication", key1_type
+                ),
+            ),
+        ]
+
+        doc = DidDocument(IDENTIFIER_2)
+        await doc.process_messages(_get_signed_envelopes(messages, test_key.private_key))
+
+        restored_doc = DidDocument.from_json(doc.to_json())
+
+        assert restored_doc.get_json_payload() == doc.get_json_payload()
+        assert restored_doc.controller == doc.controller
+
+        update_messages = [
+            HcsDidMessage(
+                DidDocumentOperation.UPDATE,
+                IDENTIFIER_2,
+                HcsDidUpdateServiceEvent(f"{IDENTIFIER_2}#service-2", "LinkedDomains", "https://test2.identity.com"),
+            )
+        ]
+
+        await restored_doc.process_messages(_get_signed_envelopes(update_messages, test_key.private_key))
+
+        assert list(restored_doc.services) == [f"{IDENTIFIER_2}#service-1", f"{IDENTIFIER_2}#service-2"]
+
+    @pytest.mark.asyncio
+    async def test_restores_from_cache_value(self, test_key):
+        """keeps document metadata in serialized cache value"""
+        messages = [
+            HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                IDENTIFIER_2,
+                HcsDidUpdateDidOwnerEvent(IDENTIFIER_2, IDENTIFIER_2, test_key.public_key, test_key.key_type),
+            )
+        ]
+
+        doc = DidDocument(IDENTIFIER_2)
+        await doc.process_messages(_get_signed_envelopes(messages, test_key.private_key))
+
+        restored_doc = decode_cache_value(encode_cache_value(doc))
+
+        assert isinstance(restored_doc, DidDocument)
+        assert restored_doc.get_json_payload() == doc.get_json_payload()
+        assert restored_doc.created == doc.created
+        assert restored_doc.updated == doc.updated
+        assert restored_doc.deactivated == doc.deactivated
+
+    def test_from_json_payload_throws_on_invalid_structure(self):
+        """throws on invalid DID document JSON structure"""
+        with pytest.raises(Exception, match="DidDocument JSON parsing failed: Invalid JSON structure"):
+            DidDocument.from_json_payload({"verificationMethod": []})
@@ -1,9 +1,17 @@
+import grpc
 import pytest
+from pytest_mock import MockerFixture
 
-from hiero_did_sdk_python.did.did_error import DidException
+from hiero_did_sdk_python.did.did_error import DidErrorCode, DidException
 from hiero_did_sdk_python.did.hedera_did import HederaDid
 
-from .common import PRIVATE_KEY
+from ..hcs.common import mock_topic_subscriptions
+from .common import IDENTIFIER, PRIVATE_KEY
+
+
+class MockTopicNotFoundError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.NOT_FOUND
 
 
 class TestHederaDid:
@@ -76,3 +84,28 @@ class TestHederaDid:
 
         assert did.network == "testnet"
         assert did.topic_id == "0.0.1"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHederaDidResolve:
+    async def test_throws_not_found_if_document_is_not_created(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, messages=[])
+
+        with pytest.raises(DidException, match="DID document is not found") as error_info:
+            await HederaDid(mock_client, identifier=IDENTIFIER).resolve()
+
+        assert error_info.value.code == DidErrorCode.DID_NOT_FOUND
+
+    async def test_throws_not_found_if_topic_does_not_exist(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, messages=[], error=MockTopicNotFoundError())
+
+        with pytest.raises(DidException, match="DID topic is not found") as error_info:
+            await HederaDid(mock_client, identifier=IDENTIFIER).resolve()
+
+        assert error_info.value.code == DidErrorCode.DID_NOT_FOUND
+
+    async def test_does_not_map_other_mirror_errors(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, messages=[], error=Exception("Stream failed"))
+
+        with pytest.raises(Exception, match="Stream failed"):
+            await HederaDid(mock_client, identifier=IDENTIFIER).resolve()
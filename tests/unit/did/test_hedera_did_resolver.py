@@ -0,0 +1,259 @@
+import asyncio
+import time
+
+import pytest
+from hiero_sdk_python import Timestamp
+from pytest_mock import MockerFixture
+
+from hiero_did_sdk_python.did.did_document import DidDocument
+from hiero_did_sdk_python.did.hedera_did import HederaDid
+from hiero_did_sdk_python.did.hedera_did_resolver import DidDocumentRecord, HederaDidResolver
+from hiero_did_sdk_python.did.utils import parse_identifier
+from hiero_did_sdk_python.hcs import HcsMessageResolver, HcsMessageWithResponseMetadata, HcsTopicCursor
+from hiero_did_sdk_python.utils.cache import MemoryCache, TimestampedRecord
+from hiero_did_sdk_python.utils.cache_stats import CacheEvent
+from hiero_did_sdk_python.utils.negative_cache import NegativeCache
+
+from ..hcs.common import mock_topic_subscriptions
+from .common import DID_TOPIC_ID_1, DID_TOPIC_ID_2, IDENTIFIER
+
+CONCURRENT_RESOLUTIONS_COUNT = 100
+
+
+@pytest.fixture
+def mock_hedera_did(mocker: MockerFixture):
+    MockHederaDid = mocker.patch("hiero_did_sdk_python.did.hedera_did_resolver.HederaDid", autospec=HederaDid)
+
+    async def _resolve():
+        await asyncio.sleep(0.01)
+        return DidDocument(IDENTIFIER)
+
+    MockHederaDid.return_value.resolve.side_effect = _resolve
+    MockHederaDid.return_value.topic_cursor = None
+
+    return MockHederaDid
+
+
+@pytest.fixture
+def mock_hcs_message_resolver(mocker: MockerFixture):
+    MockHcsMessageResolver = mocker.patch(
+        "hiero_did_sdk_python.did.hedera_did_resolver.HcsMessageResolver", autospec=HcsMessageResolver
+    )
+
+    async def _execute(_):
+        await asyncio.sleep(0.01)
+        return []
+
+    MockHcsMessageResolver.return_value.execute.side_effect = _execute
+
+    return MockHcsMessageResolver
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHederaDidResolver:
+    async def test_coalesces_concurrent_resolutions(self, mock_client, mock_hedera_did):
+        resolver = HederaDidResolver(mock_client)
+
+        results = await asyncio.gather(*(resolver.resolve(IDENTIFIER) for _ in range(CONCURRENT_RESOLUTIONS_COUNT)))
+
+        mock_hedera_did.return_value.resolve.assert_awaited_once()
+        assert all(result["didDocument"]["id"] == IDENTIFIER for result in results)
+        assert resolver._pending_resolutions == {}
+
+    async def test_coalesces_concurrent_refreshes(self, mock_client, mock_hedera_did, mock_hcs_message_resolver):
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        cache.set(DID_TOPIC_ID_1, TimestampedRecord(DidDocument(IDENTIFIER), time.time() - 60))
+
+        resolver = HederaDidResolver(mock_client, cache)
+
+        results = await asyncio.gather(*(resolver.resolve(IDENTIFIER) for _ in range(CONCURRENT_RESOLUTIONS_COUNT)))
+
+        mock_hcs_message_resolver.return_value.execute.assert_awaited_once()
+        mock_hedera_did.return_value.resolve.assert_not_awaited()
+        assert all(result["didDocument"]["id"] == IDENTIFIER for result in results)
+
+    async def test_shares_resolution_error(self, mock_client, mock_hedera_did):
+        async def _resolve():
+            await asyncio.sleep(0.01)
+            raise Exception("Resolution failed")
+
+        mock_hedera_did.return_value.resolve.side_effect = _resolve
+
+        resolver = HederaDidResolver(mock_client)
+
+        results = await asyncio.gather(*(resolver.resolve(IDENTIFIER) for _ in range(CONCURRENT_RESOLUTIONS_COUNT)))
+
+        mock_hedera_did.return_value.resolve.assert_awaited_once()
+        assert all(result["didResolutionMetadata"]["message"] == "Resolution failed" for result in results)
+        assert resolver._pending_resolutions == {}
+
+    async def test_caller_cancellation_does_not_cancel_shared_resolution(self, mock_client, mock_hedera_did):
+        resolver = HederaDidResolver(mock_client)
+
+        cancelled_resolution = asyncio.create_task(resolver.resolve(IDENTIFIER))
+        await asyncio.sleep(0)
+
+        resolution = asyncio.create_task(resolver.resolve(IDENTIFIER))
+        await asyncio.sleep(0)
+
+        cancelled_resolution.cancel()
+        result = await resolution
+
+        mock_hedera_did.return_value.resolve.assert_awaited_once()
+        assert result["didDocument"]["id"] == IDENTIFIER
+
+    async def test_uses_fresh_cached_document(self, mock_client, mock_hedera_did, mock_hcs_message_resolver):
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        cache.set(DID_TOPIC_ID_1, TimestampedRecord(DidDocument(IDENTIFIER), time.time()))
+
+        resolver = HederaDidResolver(mock_client, cache)
+
+        result = await resolver.resolve(IDENTIFIER)
+
+        assert result["didDocument"]["id"] == IDENTIFIER
+        mock_hcs_message_resolver.return_value.execute.assert_not_awaited()
+        mock_hedera_did.return_value.resolve.assert_not_awaited()
+
+    async def test_resumes_refresh_from_topic_cursor(
+        self, mock_client, mock_hedera_did, mock_hcs_message_resolver, mocker: MockerFixture
+    ):
+        mock_process_messages = mocker.patch.object(DidDocument, "process_messages", autospec=True)
+
+        topic_cursor = HcsTopicCursor(Timestamp(100, 123456789), 5)
+        new_message = HcsMessageWithResponseMetadata(
+            message=mocker.Mock(), consensus_timestamp=Timestamp(200, 987654321), sequence_number=6
+        )
+        mock_hcs_message_resolver.return_value.execute.side_effect = None
+        mock_hcs_message_resolver.return_value.execute.return_value = [new_message]
+
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        cache.set(DID_TOPIC_ID_1, DidDocumentRecord(DidDocument(IDENTIFIER), time.time() - 60, topic_cursor))
+
+        resolver = HederaDidResolver(mock_client, cache)
+
+        await resolver.resolve(IDENTIFIER)
+
+        assert mock_hcs_message_resolver.call_args.kwargs["resume_after"] == topic_cursor
+        mock_process_messages.assert_awaited_once_with(mocker.ANY, [new_message.message])
+
+        cached_record = cache.get(DID_TOPIC_ID_1)
+        assert cached_record.topic_cursor == HcsTopicCursor(Timestamp(200, 987654321), 6)
+
+    async def test_stale_while_revalidate(self, mock_client, mock_hedera_did, mock_hcs_message_resolver):
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        cache.set(DID_TOPIC_ID_1, TimestampedRecord(DidDocument(IDENTIFIER), time.time() - 60))
+
+        resolver = HederaDidResolver(mock_client, cache, stale_while_revalidate=True)
+
+        results = await asyncio.gather(*(resolver.resolve(IDENTIFIER) for _ in range(CONCURRENT_RESOLUTIONS_COUNT)))
+
+        assert all(result["didDocument"]["id"] == IDENTIFIER for result in results)
+        assert len(resolver._background_refreshes) == 1
+
+        # Callers do not wait for the refresh
+        assert not any(refresh.done() for refresh in resolver._background_refreshes)
+
+        await asyncio.gather(*resolver._background_refreshes)
+
+        mock_hcs_message_resolver.return_value.execute.assert_awaited_once()
+        assert time.time() - cache.get(DID_TOPIC_ID_1).timestamp < 1
+        assert resolver._background_refreshes == set()
+
+    async def test_stale_while_revalidate_max_staleness(self, mock_client, mock_hedera_did, mock_hcs_message_resolver):
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        cache.set(DID_TOPIC_ID_1, TimestampedRecord(DidDocument(IDENTIFIER), time.time() - 60))
+
+        resolver = HederaDidResolver(mock_client, cache, stale_while_revalidate=True, max_staleness=30)
+
+        await resolver.resolve(IDENTIFIER)
+
+        mock_hcs_message_resolver.return_value.execute.assert_awaited_once()
+        assert resolver._background_refreshes == set()
+
+    async def test_stale_while_revalidate_max_concurrent_refreshes(
+        self, mock_client, mock_hedera_did, mock_hcs_message_resolver
+    ):
+        other_identifier = IDENTIFIER.replace(DID_TOPIC_ID_1, DID_TOPIC_ID_2)
+
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        cache.set(DID_TOPIC_ID_1, TimestampedRecord(DidDocument(IDENTIFIER), time.time() - 60))
+        cache.set(DID_TOPIC_ID_2, TimestampedRecord(DidDocument(other_identifier), time.time() - 60))
+
+        resolver = HederaDidResolver(mock_client, cache, stale_while_revalidate=True, max_concurrent_refreshes=1)
+
+        await resolver.resolve(IDENTIFIER)
+        result = await resolver.resolve(other_identifier)
+
+        assert result["didDocument"]["id"] == other_identifier
+        assert len(resolver._background_refreshes) == 1
+
+        await asyncio.gather(*resolver._background_refreshes)
+
+        mock_hcs_message_resolver.return_value.execute.assert_awaited_once()
+
+    async def test_caches_invalid_did_errors(self, mock_client, mocker: MockerFixture):
+        mock_parse_identifier = mocker.patch(
+            "hiero_did_sdk_python.did.hedera_did_resolver.parse_identifier", side_effect=parse_identifier
+        )
+
+        resolver = HederaDidResolver(mock_client)
+
+        first_result = await resolver.resolve("did:hedera:invalid")
+        second_result = await resolver.resolve("did:hedera:invalid")
+
+        assert first_result["didResolutionMetadata"]["error"] == "invalidDid"
+        assert second_result == first_result
+        mock_parse_identifier.assert_called_once()
+
+    async def test_caches_not_found_errors(self, mock_client, mocker: MockerFixture):
+        # DID topic has no DID messages, so the real HederaDid resolution fails with "not found" error
+        mock_subscribe, _, _ = mock_topic_subscriptions(mocker, messages=[])
+
+        resolver = HederaDidResolver(mock_client, negative_cache_instance=NegativeCache(not_found_ttl=0.01))
+
+        await resolver.resolve(IDENTIFIER)
+        result = await resolver.resolve(IDENTIFIER)
+
+        assert result["didResolutionMetadata"]["error"] == "notFound"
+        assert mock_subscribe.call_count == 1
+
+        await asyncio.sleep(0.02)
+
+        await resolver.resolve(IDENTIFIER)
+
+        assert mock_subscribe.call_count == 2
+
+    async def test_does_not_cache_other_errors(self, mock_client, mock_hedera_did):
+        async def _resolve():
+            raise Exception("Network error")
+
+        mock_hedera_did.return_value.resolve.side_effect = _resolve
+
+        resolver = HederaDidResolver(mock_client)
+
+        await resolver.resolve(IDENTIFIER)
+        result = await resolver.resolve(IDENTIFIER)
+
+        assert result["didResolutionMetadata"]["error"] == "unknown"
+        assert mock_hedera_did.return_value.resolve.await_count == 2
+
+    async def test_tracks_cache_stats(self, mock_client, mock_hedera_did, mock_hcs_message_resolver):
+        events = []
+        resolver = HederaDidResolver(
+            mock_client, cache_stats_listener=lambda name, event, value: events.append((name, event))
+        )
+
+        await resolver.resolve(IDENTIFIER)
+        await resolver.resolve(IDENTIFIER)
+
+        stats = resolver.get_cache_stats()["didDocument"]
+
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.loads == 1
+        assert stats.load_time > 0
+        assert events == [
+            ("didDocument", CacheEvent.MISS),
+            ("didDocument", CacheEvent.LOAD),
+            ("didDocument", CacheEvent.HIT),
+        ]
@@ -0,0 +1,88 @@
+import math
+import threading
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from hiero_sdk_python import TopicMessageQuery
+from hiero_sdk_python.utils.subscription_handle import SubscriptionHandle
+from pytest_mock import MockerFixture
+
+from hiero_did_sdk_python.hcs import HcsFileChunkMessage, HcsMessage
+
+MOCK_TOPIC_ID = "0.0.1"
+
+# Consensus timestamp (in seconds) of each message matches its sequence number
+MOCK_MESSAGES = [HcsFileChunkMessage(index, f"chunk-{index}") for index in range(3)]
+
+
+def build_response(message: HcsMessage, sequence_number: int):
+    return SimpleNamespace(
+        contents=message.to_json().encode(),
+        sequence_number=sequence_number,
+        consensus_timestamp=datetime.fromtimestamp(sequence_number, tz=UTC),
+    )
+
+
+def mock_topic_subscriptions(
+    mocker: MockerFixture,
+    messages: Sequence[HcsMessage] = MOCK_MESSAGES,
+    close_stream: bool = True,
+    error: Exception | None = None,
+    replays_count: int = 1,
+    paused_stream: threading.Event | None = None,
+):
+    """Mock mirror node topic subscriptions.
+
+    Streams respect start and end time of the query. If "paused_stream" event is provided, the first stream is paused
+    after the first message until event is set.
+
+    Returns:
+        object: Subscribe mock, handles of created subscriptions and event set once the first message is delivered
+    """
+    handles: list[SubscriptionHandle] = []
+    first_message_delivered = threading.Event()
+
+    def _subscribe(query, client, on_message, on_error=None):
+        handle = SubscriptionHandle()
+        is_first_stream = len(handles) == 0
+        handles.append(handle)
+
+        start_time = query._start_time.seconds if query._start_time else 0
+        end_time = query._end_time.seconds if query._end_time else math.inf
+        stream_messages = [
+            (sequence_number, message)
+            for sequence_number, message in enumerate(messages, start=1)
+            if start_time <= sequence_number < end_time
+        ]
+
+        def run_stream():
+            # Stream reconnection replays messages from the start
+            for _ in range(replays_count):
+                for sequence_number, message in stream_messages:
+                    if handle.is_cancelled():
+                        return
+
+                    on_message(build_response(message, sequence_number))
+
+                    if is_first_stream and paused_stream and not first_message_delivered.is_set():
+                        first_message_delivered.set()
+                        paused_stream.wait(5)
+
+            if handle.is_cancelled():
+                return
+
+            if error and on_error:
+                on_error(error)
+            elif close_stream and query._completion_handler:
+                query._completion_handler()
+
+        thread = threading.Thread(target=run_stream, daemon=True)
+        handle.set_thread(thread)
+        thread.start()
+
+        return handle
+
+    subscribe = mocker.patch.object(TopicMessageQuery, "subscribe", autospec=True, side_effect=_subscribe)
+
+    return subscribe, handles, first_message_delivered
@@ -1,3 +1,4 @@
+import asyncio
 from hashlib import sha256
 from pathlib import Path
 from unittest.mock import NonCallableMagicMock
@@ -8,14 +9,18 @@ from pytest_mock import MockerFixture
 
 from hiero_did_sdk_python.hcs import (
     HcsFileChunkMessage,
+    HcsFileChunkReceipt,
+    HcsFileCompression,
     HcsFileService,
     HcsMessageResolver,
     HcsMessageTransaction,
     HcsTopicOptions,
     HcsTopicService,
+    train_compression_dictionary,
 )
-from hiero_did_sdk_python.hcs.hcs_file import get_file_chunk_messages
+from hiero_did_sdk_python.hcs.hcs_file import build_file_from_chunk_messages, get_file_chunk_messages
 from tests.integration.conftest import OPERATOR_KEY_DER
+from tests.unit.hcs.hcs_file.test_hcs_file_utils import TEST_FILE_LARGE_CHUNK_MESSAGES, build_cred_def_samples
 
 MOCK_TOPIC_ID = "0.0.1"
 
@@ -50,6 +55,7 @@ def mock_hcs_topic_service(mocker: MockerFixture):
     mock_hsc_topic_service = MockHcsTopicService.return_value
     mock_hsc_topic_service.create_topic.return_value = MOCK_TOPIC_ID
     mock_hsc_topic_service.get_topic_info.return_value.memo = MOCK_TOPIC_MEMO
+    mock_hsc_topic_service.get_topic_info.return_value.sequence_number = len(MOCK_CHUNK_MESSAGES)
 
     return mock_hsc_topic_service
 
@@ -94,6 +100,70 @@ class TestHcsFileService:
 
         assert mock_hcs_message_transaction.execute.await_count == expected_chunks_count
 
+    async def test_submits_chunks_concurrently(
+        self,
+        mock_client: Client,
+        mock_hcs_topic_service: NonCallableMagicMock,
+        mock_hcs_message_transaction: NonCallableMagicMock,
+    ):
+        state = {"in_flight": 0, "max_in_flight": 0}
+
+        async def execute(client):
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return "receipt"
+
+        mock_hcs_message_transaction.execute.side_effect = execute
+
+        chunk_receipts: list[HcsFileChunkReceipt] = []
+        service = HcsFileService(mock_client, max_in_flight_chunks=2)
+
+        await service.submit_file(
+            Path("./tests/test_data/test_file_large.txt").read_bytes(), OPERATOR_KEY_DER, chunk_receipts.append
+        )
+
+        assert state["max_in_flight"] == 2
+        assert sorted(receipt.ordering_index for receipt in chunk_receipts) == list(range(6))
+        assert all(receipt.receipt == "receipt" and receipt.attempts == 1 for receipt in chunk_receipts)
+
+    async def test_retries_failed_chunks(
+        self,
+        mock_client: Client,
+        mock_hcs_topic_service: NonCallableMagicMock,
+        mock_hcs_message_transaction: NonCallableMagicMock,
+        mocker: MockerFixture,
+    ):
+        mocker.patch("hiero_did_sdk_python.hcs.hcs_file.hcs_file_service.CHUNK_RETRY_BACKOFF_SECONDS", 0)
+        mock_hcs_message_transaction.execute.side_effect = [Exception("BUSY"), "receipt"]
+
+        chunk_receipts: list[HcsFileChunkReceipt] = []
+        service = HcsFileService(mock_client)
+
+        await service.submit_file(
+            Path("./tests/test_data/test_file.txt").read_bytes(), OPERATOR_KEY_DER, chunk_receipts.append
+        )
+
+        assert chunk_receipts == [HcsFileChunkReceipt(ordering_index=0, receipt="receipt", attempts=2)]
+
+    async def test_throws_on_exhausted_chunk_retries(
+        self,
+        mock_client: Client,
+        mock_hcs_topic_service: NonCallableMagicMock,
+        mock_hcs_message_transaction: NonCallableMagicMock,
+        mocker: MockerFixture,
+    ):
+        mocker.patch("hiero_did_sdk_python.hcs.hcs_file.hcs_file_service.CHUNK_RETRY_BACKOFF_SECONDS", 0)
+        mock_hcs_message_transaction.execute.side_effect = Exception("BUSY")
+
+        service = HcsFileService(mock_client, max_chunk_retries=1)
+
+        with pytest.raises(Exception, match="Failed to submit HCS file chunk 0 after 2 attempts: BUSY"):
+            await service.submit_file(Path("./tests/test_data/test_file.txt").read_bytes(), OPERATOR_KEY_DER)
+
+        assert mock_hcs_message_transaction.execute.await_count == 2
+
     async def test_resolves_messages_from_topic(
         self,
         mock_client: Client,
@@ -112,6 +182,93 @@ class TestHcsFileService:
 
         mock_hcs_message_resolver.execute.assert_awaited_once()
 
+    async def test_completes_resolution_on_last_topic_message(
+        self, mock_client: Client, mock_hcs_topic_service: NonCallableMagicMock, mocker: MockerFixture
+    ):
+        MockHcsMessageResolver = mocker.patch(
+            "hiero_did_sdk_python.hcs.hcs_file.hcs_file_service.HcsMessageResolver", autospec=HcsMessageResolver
+        )
+        MockHcsMessageResolver.return_value.execute.return_value = MOCK_CHUNK_MESSAGES
+
+        await HcsFileService(mock_client).resolve_file(MOCK_TOPIC_ID)
+
+        assert MockHcsMessageResolver.call_args.kwargs["last_sequence_number"] == len(MOCK_CHUNK_MESSAGES)
+
+    @pytest.mark.parametrize(
+        "chunk_messages",
+        [
+            get_file_chunk_messages(Path("./tests/test_data/test_file_large.txt").read_bytes()),
+            # Files submitted with legacy chunk size (960 bytes of content) are supported as well
+            TEST_FILE_LARGE_CHUNK_MESSAGES,
+        ],
+    )
+    async def test_completes_file_resolution_once_all_chunks_are_resolved(
+        self,
+        chunk_messages: list[HcsFileChunkMessage],
+        mock_client: Client,
+        mock_hcs_topic_service: NonCallableMagicMock,
+        mocker: MockerFixture,
+    ):
+        payload = build_file_from_chunk_messages(chunk_messages)
+        mock_hcs_topic_service.get_topic_info.return_value.memo = f"{sha256(payload).hexdigest()}:zstd:base64"
+
+        completion_results = []
+
+        def create_resolver(*args, completion_checker, **kwargs):
+            mock_resolver = mocker.MagicMock()
+
+            async def execute(client):
+                # Chunks can be resolved in any order
+                for message in [*reversed(chunk_messages[1:]), chunk_messages[0]]:
+                    completion_results.append(completion_checker(message))
+                    if completion_results[-1]:
+                        break
+                return chunk_messages
+
+            mock_resolver.execute = execute
+            return mock_resolver
+
+        mocker.patch(
+            "hiero_did_sdk_python.hcs.hcs_file.hcs_file_service.HcsMessageResolver", side_effect=create_resolver
+        )
+
+        resolved_payload = await HcsFileService(mock_client).resolve_file(MOCK_TOPIC_ID)
+
+        assert resolved_payload == payload
+        assert completion_results == [False] * (len(chunk_messages) - 1) + [True]
+
+    async def test_submits_and_resolves_file_compressed_with_dictionary(
+        self,
+        mock_client: Client,
+        mock_hcs_topic_service: NonCallableMagicMock,
+        mock_hcs_message_transaction: NonCallableMagicMock,
+        mock_hcs_message_resolver: NonCallableMagicMock,
+        mocker: MockerFixture,
+    ):
+        samples = build_cred_def_samples(100)
+        dictionary = train_compression_dictionary(samples[1:], dictionary_size=4096)
+        MockHcsMessageTransaction = mocker.patch(
+            "hiero_did_sdk_python.hcs.hcs_file.hcs_file_service.HcsMessageTransaction", autospec=HcsMessageTransaction
+        )
+        MockHcsMessageTransaction.return_value.execute = mocker.AsyncMock()
+
+        service = HcsFileService(mock_client, compression=HcsFileCompression(dictionary=dictionary))
+        await service.submit_file(samples[0], OPERATOR_KEY_DER)
+
+        topic_memo = mock_hcs_topic_service.create_topic.await_args.args[0].topic_memo
+        assert topic_memo == f"{sha256(samples[0]).hexdigest()}:zstd-dict-{dictionary.dict_id()}:base64"
+
+        mock_hcs_topic_service.get_topic_info.return_value.memo = topic_memo
+        mock_hcs_message_resolver.execute.return_value = [
+            call.args[1] for call in MockHcsMessageTransaction.call_args_list
+        ]
+
+        assert await service.resolve_file(MOCK_TOPIC_ID) == samples[0]
+
+        # Files compressed with dictionary can't be resolved without it
+        with pytest.raises(Exception, match=f"Compression dictionary {dictionary.dict_id()} is not available"):
+            await HcsFileService(mock_client).resolve_file(MOCK_TOPIC_ID)
+
     async def test_throws_on_resolving_file_with_wrong_hash(
         self,
         mock_client: Client,
@@ -1,9 +1,10 @@
+import json
 from hashlib import sha256
 from pathlib import Path
 
 import pytest
 
-from hiero_did_sdk_python.hcs import HcsFileChunkMessage
+from hiero_did_sdk_python.hcs import HcsFileChunkMessage, HcsFileCompression, train_compression_dictionary
 from hiero_did_sdk_python.hcs.hcs_file import build_file_from_chunk_messages, get_file_chunk_messages
 
 TEST_FILE_CHUNK_MESSAGES = [
@@ -41,6 +42,19 @@ TEST_FILE_LARGE_CHUNK_MESSAGES = [
 ]
 
 
+def build_cred_def_samples(count: int) -> list[bytes]:
+    return [
+        json.dumps({
+            "issuerId": f"did:hedera:testnet:zIssuer{index}_0.0.{1000 + index}",
+            "schemaId": f"did:hedera:testnet:zIssuer{index}_0.0.{1000 + index}/anoncreds/v0/SCHEMA/0.0.{2000 + index}",
+            "type": "CL",
+            "tag": f"tag-{index}",
+            "value": {"primary": {"n": str(7**200 + index), "s": str(11**180 + index), "r": {"name": str(13**170)}}},
+        }).encode()
+        for index in range(count)
+    ]
+
+
 class TestHcsFileUtils:
     @pytest.mark.parametrize(
         "test_file_path, expected_chunks_count",
@@ -55,7 +69,15 @@ class TestHcsFileUtils:
 
         for message in chunk_messages:
             assert isinstance(message, HcsFileChunkMessage)
-            assert len(message.content.encode()) <= HcsFileChunkMessage.MAX_CHUNK_CONTENT_SIZE_IN_BYTES
+            assert len(message.to_json().encode()) <= HcsFileChunkMessage.MAX_MESSAGE_SIZE_IN_BYTES
+
+        # All chunks except the last one are filled up to HCS message size
+        for message in chunk_messages[:-1]:
+            assert len(message.to_json().encode()) == HcsFileChunkMessage.MAX_MESSAGE_SIZE_IN_BYTES
+
+    @pytest.mark.parametrize("ordering_index, expected_size", [(0, 1010), (9, 1010), (10, 1009), (1000, 1007)])
+    def test_get_max_content_size(self, ordering_index: int, expected_size: int):
+        assert HcsFileChunkMessage.get_max_content_size(ordering_index) == expected_size
 
     @pytest.mark.parametrize(
         "chunk_messages, expected_hash",
@@ -68,11 +90,41 @@ class TestHcsFileUtils:
         file_payload = build_file_from_chunk_messages(chunk_messages)
         assert sha256(file_payload).hexdigest() == expected_hash
 
+    def test_build_file_from_chunk_messages_computes_hash(self):
+        file_payload = Path("./tests/test_data/test_file_large.txt").read_bytes()
+        payload_hash = sha256()
+
+        # Chunks can be provided in any order
+        chunk_messages = list(reversed(get_file_chunk_messages(file_payload)))
+
+        assert build_file_from_chunk_messages(chunk_messages, payload_hash) == file_payload
+        assert payload_hash.hexdigest() == sha256(file_payload).hexdigest()
+
+    def test_compresses_file_with_dictionary(self):
+        samples = build_cred_def_samples(100)
+        compression = HcsFileCompression(dictionary=train_compression_dictionary(samples[1:], dictionary_size=4096))
+
+        chunk_messages = get_file_chunk_messages(samples[0], compression)
+
+        assert len("".join(message.content for message in chunk_messages)) < len(
+            "".join(message.content for message in get_file_chunk_messages(samples[0]))
+        )
+        assert build_file_from_chunk_messages(chunk_messages, dictionary=compression.dictionary) == samples[0]
+
+        with pytest.raises(Exception, match="Error on building HCS-1 file payload from chunk messages"):
+            build_file_from_chunk_messages(chunk_messages)
+
+    def test_build_file_from_chunk_messages_throws_on_incomplete_data(self):
+        chunk_messages = get_file_chunk_messages(Path("./tests/test_data/test_file_large.txt").read_bytes())
+
+        with pytest.raises(Exception, match="Compressed payload is incomplete"):
+            build_file_from_chunk_messages(chunk_messages[:2])
+
     def test_build_file_from_chunk_messages_throws_on_invalid_data(self):
         invalid_chunk_messages = [HcsFileChunkMessage(0, "invalid_chunk_data")]
         with pytest.raises(
             Exception,
-            match="Error on building HCS-1 file payload from chunk messages: error determining content size from frame header",
+            match="Error on building HCS-1 file payload from chunk messages: zstd decompressor error: Unknown frame descriptor",
         ):
             build_file_from_chunk_messages(invalid_chunk_messages)
 
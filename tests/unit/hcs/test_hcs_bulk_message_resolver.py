@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from hiero_did_sdk_python.hcs import (
+    HcsBulkMessageResolver,
+    HcsFileChunkMessage,
+    HcsMessageResolver,
+    HcsTopicResolutionJob,
+)
+
+MOCK_MESSAGES = [HcsFileChunkMessage(index, f"chunk-{index}") for index in range(3)]
+
+FAILING_TOPIC_ID = "0.0.2"
+SLOW_TOPIC_ID = "0.0.3"
+
+
+def _mock_hcs_message_resolver(mocker: MockerFixture):
+    state = {"concurrent": 0, "max_concurrent": 0, "cancelled": 0}
+
+    def _create_resolver(topic_id, *args, **kwargs):
+        async def _execute(client):
+            state["concurrent"] += 1
+            state["max_concurrent"] = max(state["max_concurrent"], state["concurrent"])
+
+            try:
+                await asyncio.sleep(1 if topic_id == SLOW_TOPIC_ID else 0.01)
+                if topic_id == FAILING_TOPIC_ID:
+                    raise Exception("Mirror node is unavailable")
+                return MOCK_MESSAGES
+            except asyncio.CancelledError:
+                state["cancelled"] += 1
+                raise
+            finally:
+                state["concurrent"] -= 1
+
+        mock_resolver = mocker.MagicMock()
+        mock_resolver.execute = _execute
+        return mock_resolver
+
+    MockHcsMessageResolver = mocker.patch(
+        "hiero_did_sdk_python.hcs.hcs_bulk_message_resolver.HcsMessageResolver", autospec=HcsMessageResolver
+    )
+    MockHcsMessageResolver.side_effect = _create_resolver
+
+    return MockHcsMessageResolver, state
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsBulkMessageResolver:
+    async def test_resolves_jobs_with_bounded_concurrency(self, mock_client, mocker: MockerFixture):
+        MockHcsMessageResolver, state = _mock_hcs_message_resolver(mocker)
+
+        jobs = [HcsTopicResolutionJob(f"0.0.{100 + index}", HcsFileChunkMessage) for index in range(10)]
+        results = await HcsBulkMessageResolver(jobs, max_concurrency=3).execute(mock_client)
+
+        assert [result.job for result in results] == jobs
+        assert all(result.is_successful and result.messages == MOCK_MESSAGES for result in results)
+        assert state["max_concurrent"] == 3
+        assert MockHcsMessageResolver.call_count == 10
+
+    async def test_returns_partial_results(self, mock_client, mocker: MockerFixture):
+        _, state = _mock_hcs_message_resolver(mocker)
+
+        jobs = [
+            HcsTopicResolutionJob("0.0.1", HcsFileChunkMessage),
+            HcsTopicResolutionJob(FAILING_TOPIC_ID, HcsFileChunkMessage),
+            HcsTopicResolutionJob(SLOW_TOPIC_ID, HcsFileChunkMessage, deadline_seconds=0.1),
+        ]
+        successful_result, failed_result, timed_out_result = await HcsBulkMessageResolver(jobs).execute(mock_client)
+
+        assert successful_result.is_successful
+        assert successful_result.messages == MOCK_MESSAGES
+
+        assert not failed_result.is_successful
+        assert str(failed_result.error) == "Mirror node is unavailable"
+
+        assert not timed_out_result.is_successful
+        assert timed_out_result.messages is None
+        assert str(timed_out_result.error) == f"Deadline of 0.1s exceeded for topic {SLOW_TOPIC_ID}"
+        assert state["cancelled"] == 1
+
+    async def test_applies_default_deadline(self, mock_client, mocker: MockerFixture):
+        _mock_hcs_message_resolver(mocker)
+
+        jobs = [
+            HcsTopicResolutionJob(SLOW_TOPIC_ID, HcsFileChunkMessage),
+            HcsTopicResolutionJob(SLOW_TOPIC_ID, HcsFileChunkMessage, deadline_seconds=5),
+        ]
+        default_deadline_result, job_deadline_result = await HcsBulkMessageResolver(jobs, deadline_seconds=0.1).execute(
+            mock_client
+        )
+
+        assert not default_deadline_result.is_successful
+        assert job_deadline_result.is_successful
@@ -0,0 +1,196 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import aclosing
+
+import pytest
+from hiero_sdk_python import Timestamp
+from hiero_sdk_python.utils.subscription_handle import SubscriptionHandle
+from pytest_mock import MockerFixture
+
+from hiero_did_sdk_python.hcs import HcsFileChunkMessage, HcsMessageResolver, HcsTopicCursor
+
+from .common import MOCK_TOPIC_ID, mock_topic_subscriptions
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsMessageResolver:
+    async def test_completes_on_stream_end(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker)
+
+        start = time.monotonic()
+        messages = await HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage).execute(mock_client)
+
+        assert [message.content for message in messages] == ["chunk-0", "chunk-1", "chunk-2"]
+        assert time.monotonic() - start < 1
+
+    async def test_completes_on_last_sequence_number(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, close_stream=False)
+
+        start = time.monotonic()
+        messages = await HcsMessageResolver(
+            MOCK_TOPIC_ID, HcsFileChunkMessage, include_response_metadata=True, last_sequence_number=3
+        ).execute(mock_client)
+
+        assert [message.sequence_number for message in messages] == [1, 2, 3]
+        assert time.monotonic() - start < 1
+
+    async def test_completes_once_completion_checker_passes(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, close_stream=False)
+
+        start = time.monotonic()
+        messages = await HcsMessageResolver(
+            MOCK_TOPIC_ID, HcsFileChunkMessage, completion_checker=lambda message: message.content == "chunk-1"
+        ).execute(mock_client)
+
+        assert [message.content for message in messages][:2] == ["chunk-0", "chunk-1"]
+        assert time.monotonic() - start < 1
+
+    async def test_falls_back_to_idle_timeout(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, close_stream=False)
+
+        messages = await HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage, timeout_seconds=0.1).execute(
+            mock_client
+        )
+
+        assert len(messages) == 3
+
+    async def test_resumes_after_topic_cursor(self, mock_client, mocker: MockerFixture):
+        # Mirror node query start time is inclusive, so already consumed messages are returned as well
+        mock_topic_subscriptions(mocker)
+        mock_from_payload_bytes = mocker.spy(HcsFileChunkMessage, "from_payload_bytes")
+
+        messages = await HcsMessageResolver(
+            MOCK_TOPIC_ID, HcsFileChunkMessage, resume_after=HcsTopicCursor(Timestamp(2, 0), 2)
+        ).execute(mock_client)
+
+        assert [message.content for message in messages] == ["chunk-2"]
+        # Consumed messages are skipped without parsing
+        assert mock_from_payload_bytes.call_count == 1
+
+    async def test_cancels_subscription_when_cancelled(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, close_stream=False)
+        mock_cancel = mocker.spy(SubscriptionHandle, "cancel")
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.1):
+                await HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage).execute(mock_client)
+
+        mock_cancel.assert_called_once()
+
+    async def test_parses_messages_in_executor(self, mock_client, mocker: MockerFixture):
+        messages = [HcsFileChunkMessage(index, f"chunk-{index}") for index in range(500)]
+        mock_topic_subscriptions(mocker, messages=messages)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            resolved_messages = await HcsMessageResolver(
+                MOCK_TOPIC_ID, HcsFileChunkMessage, include_response_metadata=True, executor=executor
+            ).execute(mock_client)
+
+        # Messages parsed in parallel are delivered in topic order
+        assert [message.sequence_number for message in resolved_messages] == list(range(1, 501))
+        assert [message.message.content for message in resolved_messages] == [message.content for message in messages]
+
+    async def test_parses_messages_in_process_pool(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, replays_count=2)
+
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+            messages = await HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage, executor=executor).execute(
+                mock_client
+            )
+
+        assert [message.content for message in messages] == ["chunk-0", "chunk-1", "chunk-2"]
+
+    async def test_propagates_stream_error(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, error=Exception("Stream failed"))
+
+        with pytest.raises(Exception, match="Stream failed"):
+            await HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage).execute(mock_client)
+
+    async def test_skips_duplicate_messages(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, replays_count=3)
+
+        messages = await HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage).execute(mock_client)
+
+        assert [message.content for message in messages] == ["chunk-0", "chunk-1", "chunk-2"]
+
+    async def test_streams_messages_with_backpressure(self, mock_client, mocker: MockerFixture):
+        messages = [HcsFileChunkMessage(index, f"chunk-{index}") for index in range(50)]
+        mock_topic_subscriptions(mocker, messages=messages)
+
+        resolver = HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage, stream_buffer_size=5)
+
+        streamed_messages = []
+        async for message in resolver.stream(mock_client):
+            # Subscription thread is paused while buffer is full
+            assert resolver._topic_listener._subscription_handle is not None
+            await asyncio.sleep(0.001)
+            streamed_messages.append(message)
+
+        assert [message.content for message in streamed_messages] == [message.content for message in messages]
+
+    async def test_stream_buffer_is_bounded(self, mock_client, mocker: MockerFixture):
+        messages = [HcsFileChunkMessage(index, f"chunk-{index}") for index in range(50)]
+        mock_topic_subscriptions(mocker, messages=messages)
+
+        resolver = HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage, stream_buffer_size=5)
+        stream = resolver.stream(mock_client)
+
+        await anext(stream)
+        await asyncio.sleep(0.05)
+
+        # Producer is blocked once buffer is full (first message is already consumed)
+        assert len(resolver._received_message_hashes) <= 7
+
+        await stream.aclose()
+
+    async def test_stream_resumes_subscription_at_low_watermark(self, mock_client, mocker: MockerFixture):
+        messages = [HcsFileChunkMessage(index, f"chunk-{index}") for index in range(50)]
+        mock_topic_subscriptions(mocker, messages=messages)
+
+        resolver = HcsMessageResolver(
+            MOCK_TOPIC_ID, HcsFileChunkMessage, stream_buffer_size=10, stream_buffer_low_watermark=2
+        )
+
+        streamed_messages = []
+        async for message in resolver.stream(mock_client):
+            await asyncio.sleep(0.001)
+            streamed_messages.append(message)
+
+        stats = resolver.get_stream_stats()
+
+        assert len(streamed_messages) == 50
+        assert stats.size == 0
+        assert stats.max_size == 10
+        # Paused subscription is resumed once 8 messages are consumed, not on each consumed message
+        assert 1 <= stats.pauses <= 7
+        assert stats.paused_time > 0
+        assert stats.dropped == 0
+
+    async def test_validates_stream_buffer_watermarks(self):
+        with pytest.raises(
+            Exception, match="Stream buffer low watermark must be lower than positive stream buffer size"
+        ):
+            HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage, stream_buffer_size=5, stream_buffer_low_watermark=5)
+
+    async def test_stream_cancels_subscription_on_early_exit(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, close_stream=False)
+
+        resolver = HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage)
+
+        async with aclosing(resolver.stream(mock_client)) as stream:
+            async for _ in stream:
+                break
+
+        assert resolver._topic_listener._subscription_handle.is_cancelled()
+
+    async def test_stream_propagates_error(self, mock_client, mocker: MockerFixture):
+        mock_topic_subscriptions(mocker, error=Exception("Stream failed"))
+
+        streamed_messages = []
+        with pytest.raises(Exception, match="Stream failed"):
+            async for message in HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage).stream(mock_client):
+                streamed_messages.append(message)
+
+        assert len(streamed_messages) == 3
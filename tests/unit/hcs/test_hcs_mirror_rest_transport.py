@@ -0,0 +1,134 @@
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import ClientError, web
+from hiero_sdk_python import Timestamp
+
+from hiero_did_sdk_python.hcs import HcsFileChunkMessage, HcsMessageResolver, HcsMirrorRestTransport
+from hiero_did_sdk_python.utils.encoding import bytes_to_b64
+
+MOCK_TOPIC_ID = "0.0.1"
+MOCK_MESSAGES_COUNT = 250
+
+
+def _build_message_payload(sequence_number: int) -> dict:
+    message = HcsFileChunkMessage(sequence_number, f"chunk-{sequence_number}")
+    return {
+        "consensus_timestamp": f"{1000 + sequence_number}.000000001",
+        "message": bytes_to_b64(message.to_json().encode()),
+        "running_hash": bytes_to_b64(b"hash"),
+        "sequence_number": sequence_number,
+        "topic_id": MOCK_TOPIC_ID,
+    }
+
+
+class StubMirrorNode:
+    def __init__(self):
+        self.messages = [
+            _build_message_payload(sequence_number) for sequence_number in range(1, MOCK_MESSAGES_COUNT + 1)
+        ]
+        self.requests = []
+
+    async def handle_topic_messages(self, request: web.Request) -> web.Response:
+        if request.match_info["topic_id"] != MOCK_TOPIC_ID:
+            return web.json_response({"_status": {"messages": [{"message": "Not found"}]}}, status=404)
+
+        self.requests.append(request.query)
+
+        messages = self.messages
+        for timestamp_filter in request.query.getall("timestamp", []):
+            operator, _, value = timestamp_filter.partition(":")
+            if operator == "gte":
+                messages = [message for message in messages if float(message["consensus_timestamp"]) >= float(value)]
+            elif operator == "lt":
+                messages = [message for message in messages if float(message["consensus_timestamp"]) < float(value)]
+
+        if "sequencenumber" in request.query:
+            after = int(request.query["sequencenumber"].removeprefix("gt:"))
+            messages = [message for message in messages if message["sequence_number"] > after]
+
+        return web.json_response({"messages": messages[: int(request.query["limit"])], "links": {"next": None}})
+
+
+@asynccontextmanager
+async def run_stub_mirror_node():
+    stub = StubMirrorNode()
+
+    app = web.Application()
+    app.router.add_get("/api/v1/topics/{topic_id}/messages", stub.handle_topic_messages)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = runner.addresses[0][1]
+    transport = HcsMirrorRestTransport(f"http://127.0.0.1:{port}")
+
+    try:
+        yield stub, transport
+    finally:
+        await transport.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsMirrorRestTransport:
+    async def test_reads_all_pages(self, mock_client):
+        async with run_stub_mirror_node() as (stub_mirror_node, transport):
+            start = time.monotonic()
+            messages = await HcsMessageResolver(
+                MOCK_TOPIC_ID, HcsFileChunkMessage, include_response_metadata=True, transport=transport
+            ).execute(mock_client)
+
+        assert [message.sequence_number for message in messages] == list(range(1, MOCK_MESSAGES_COUNT + 1))
+        assert messages[0].consensus_timestamp.seconds == 1001
+        assert len(stub_mirror_node.requests) == 3
+        assert stub_mirror_node.requests[1]["sequencenumber"] == "gt:100"
+        assert time.monotonic() - start < 1
+
+    async def test_applies_time_range_and_limit(self, mock_client):
+        async with run_stub_mirror_node() as (stub_mirror_node, transport):
+            messages = await HcsMessageResolver(
+                MOCK_TOPIC_ID,
+                HcsFileChunkMessage,
+                timestamp_from=Timestamp(1011, 0),
+                timestamp_to=Timestamp(1200, 0),
+                limit=150,
+                include_response_metadata=True,
+                transport=transport,
+            ).execute(mock_client)
+
+        assert [message.sequence_number for message in messages] == list(range(11, 161))
+        assert stub_mirror_node.requests[-1]["limit"] == "50"
+
+    async def test_streams_messages_with_backpressure(self, mock_client):
+        async with run_stub_mirror_node() as (_, transport):
+            resolver = HcsMessageResolver(
+                MOCK_TOPIC_ID,
+                HcsFileChunkMessage,
+                include_response_metadata=True,
+                transport=transport,
+                stream_buffer_size=10,
+            )
+
+            sequence_numbers = []
+            async for message in resolver.stream(mock_client):
+                sequence_numbers.append(message.sequence_number)
+
+        assert sequence_numbers == list(range(1, MOCK_MESSAGES_COUNT + 1))
+
+    async def test_returns_empty_list_for_unknown_topic(self, mock_client):
+        async with run_stub_mirror_node() as (_, transport):
+            messages = await HcsMessageResolver("0.0.2", HcsFileChunkMessage, transport=transport).execute(mock_client)
+
+        assert messages == []
+
+    async def test_propagates_request_errors(self, mock_client):
+        transport = HcsMirrorRestTransport("http://127.0.0.1:1", max_attempts=1)
+
+        with pytest.raises(ClientError):
+            await HcsMessageResolver(MOCK_TOPIC_ID, HcsFileChunkMessage, transport=transport).execute(mock_client)
+
+        await transport.close()
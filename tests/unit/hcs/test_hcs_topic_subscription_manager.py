@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from contextlib import aclosing
+
+import pytest
+from hiero_sdk_python import Timestamp
+from pytest_mock import MockerFixture
+
+from hiero_did_sdk_python.hcs import HcsFileChunkMessage, HcsMessageResolver, HcsTopicSubscriptionManager
+
+from .common import MOCK_TOPIC_ID, mock_topic_subscriptions
+
+
+def _resolve(manager: HcsTopicSubscriptionManager, client, timestamp_to: int):
+    return asyncio.create_task(
+        HcsMessageResolver(
+            MOCK_TOPIC_ID, HcsFileChunkMessage, timestamp_to=Timestamp(timestamp_to, 0), transport=manager
+        ).execute(client)
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsTopicSubscriptionManager:
+    async def test_shares_subscription_between_concurrent_readers(self, mock_client, mocker: MockerFixture):
+        paused_stream = threading.Event()
+        mock_subscribe, _, first_message_delivered = mock_topic_subscriptions(mocker, paused_stream=paused_stream)
+        manager = HcsTopicSubscriptionManager()
+
+        first_resolution = _resolve(manager, mock_client, 10)
+        await asyncio.to_thread(first_message_delivered.wait, 5)
+
+        # Late joiner receives the first message replayed from the buffer
+        second_resolution = _resolve(manager, mock_client, 10)
+        await asyncio.sleep(0.1)
+        paused_stream.set()
+
+        for messages in await asyncio.gather(first_resolution, second_resolution):
+            assert [message.content for message in messages] == ["chunk-0", "chunk-1", "chunk-2"]
+
+        mock_subscribe.assert_called_once()
+        assert manager.get_active_subscriptions_count() == 0
+
+    async def test_extends_stream_for_later_end_time(self, mock_client, mocker: MockerFixture):
+        paused_stream = threading.Event()
+        mock_subscribe, _, first_message_delivered = mock_topic_subscriptions(mocker, paused_stream=paused_stream)
+        manager = HcsTopicSubscriptionManager()
+
+        first_resolution = _resolve(manager, mock_client, 2)
+        await asyncio.to_thread(first_message_delivered.wait, 5)
+
+        second_resolution = _resolve(manager, mock_client, 10)
+        await asyncio.sleep(0.1)
+        paused_stream.set()
+
+        first_messages, second_messages = await asyncio.gather(first_resolution, second_resolution)
+
+        assert [message.content for message in first_messages] == ["chunk-0"]
+        assert [message.content for message in second_messages] == ["chunk-0", "chunk-1", "chunk-2"]
+
+        # Continuation query starts from the end time of the first stream
+        assert mock_subscribe.call_count == 2
+        continuation_query = mock_subscribe.call_args_list[1].args[0]
+        assert continuation_query._start_time.seconds == 2
+        assert continuation_query._end_time.seconds == 10
+
+    async def test_starts_new_subscription_once_previous_is_released(self, mock_client, mocker: MockerFixture):
+        mock_subscribe, _, _ = mock_topic_subscriptions(mocker)
+        manager = HcsTopicSubscriptionManager()
+
+        await _resolve(manager, mock_client, 10)
+        messages = await _resolve(manager, mock_client, 10)
+
+        assert len(messages) == 3
+        assert mock_subscribe.call_count == 2
+        assert manager.get_active_subscriptions_count() == 0
+
+    async def test_cancels_stream_when_last_reader_leaves(self, mock_client, mocker: MockerFixture):
+        paused_stream = threading.Event()
+        _, handles, _ = mock_topic_subscriptions(mocker, paused_stream=paused_stream)
+        manager = HcsTopicSubscriptionManager()
+
+        resolver = HcsMessageResolver(
+            MOCK_TOPIC_ID, HcsFileChunkMessage, timestamp_to=Timestamp(10, 0), transport=manager
+        )
+
+        async with aclosing(resolver.stream(mock_client)) as messages:
+            async for message in messages:
+                assert message.content == "chunk-0"
+                assert manager.get_active_subscriptions_count() == 1
+                break
+
+        paused_stream.set()
+
+        assert handles[0].is_cancelled()
+        assert manager.get_active_subscriptions_count() == 0
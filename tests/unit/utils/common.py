@@ -0,0 +1,27 @@
+import time
+
+from hiero_did_sdk_python.utils.async_cache import AsyncCache
+
+
+class DictAsyncCache[K, V](AsyncCache[K, V]):
+    def __init__(self):
+        super().__init__()
+        self._mem: dict[K, tuple[V, float]] = {}
+
+    async def data_get(self, key: K) -> V | None:
+        record = self._mem.get(key, None)
+        if record is None or time.time() > record[1]:
+            return None
+        return record[0]
+
+    async def data_set(self, key: K, value: V, ttl):
+        self._mem[key] = (value, time.time() + ttl)
+
+    async def data_remove(self, key: K):
+        self._mem.pop(key, None)
+
+    async def data_size(self) -> int:
+        return len(self._mem)
+
+    async def data_flush(self):
+        self._mem = {}
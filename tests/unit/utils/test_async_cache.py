@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from hiero_did_sdk_python.utils.async_cache import cache_get, cache_remove, cache_set
+from hiero_did_sdk_python.utils.cache import MemoryCache
+
+from .common import DictAsyncCache
+
+
+@pytest.fixture
+def async_cache():
+    return DictAsyncCache[int, str]()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestAsyncCache:
+    async def test_insert_retrieve_remove(self, async_cache: DictAsyncCache[int, str]):
+        await async_cache.set(1, "1")
+        await async_cache.set(2, "2")
+
+        assert await async_cache.size() == 2
+        assert await async_cache.get(1) == "1"
+
+        await async_cache.remove(1)
+
+        assert await async_cache.get(1) is None
+        assert await async_cache.get(2) == "2"
+
+        await async_cache.flush()
+
+        assert await async_cache.size() == 0
+
+    async def test_batch_operations(self, async_cache: DictAsyncCache[int, str]):
+        await async_cache.set_many({n: str(n) for n in range(1, 6)})
+
+        assert await async_cache.get_many([1, 3, 5, 7]) == {1: "1", 3: "3", 5: "5"}
+
+    async def test_short_ttl(self, async_cache: DictAsyncCache[int, str]):
+        await async_cache.set(1, "1", 0.01)
+        time.sleep(0.02)
+
+        assert await async_cache.get(1) is None
+
+    @pytest.mark.parametrize("cache", [MemoryCache[int, str](), DictAsyncCache[int, str]()])
+    async def test_helpers_support_both_cache_types(self, cache):
+        await cache_set(cache, 1, "1")
+        assert await cache_get(cache, 1) == "1"
+
+        await cache_remove(cache, 1)
+        assert await cache_get(cache, 1) is None
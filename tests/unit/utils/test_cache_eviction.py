@@ -0,0 +1,156 @@
+import pytest
+
+from hiero_did_sdk_python.utils.cache import MemoryCache
+from hiero_did_sdk_python.utils.cache_eviction import (
+    LFUEvictionPolicy,
+    LRUEvictionPolicy,
+    TinyLFUEvictionPolicy,
+    estimate_size,
+)
+
+
+class TestCacheEviction:
+    def test_lru_evicts_least_recently_used(self):
+        cache = MemoryCache[int, str](max_entries=3, eviction_policy=LRUEvictionPolicy())
+
+        for n in range(1, 4):
+            cache.set(n, str(n))
+
+        cache.get(1)
+        cache.set(4, "4")
+
+        assert cache.size() == 3
+        assert cache.get(2) is None
+        assert cache.get(1) == "1"
+        assert cache.get(3) == "3"
+        assert cache.get(4) == "4"
+
+    def test_lfu_evicts_least_frequently_used(self):
+        cache = MemoryCache[int, str](max_entries=3, eviction_policy=LFUEvictionPolicy())
+
+        for n in range(1, 4):
+            cache.set(n, str(n))
+
+        for _ in range(3):
+            cache.get(1)
+            cache.get(3)
+
+        cache.get(2)
+        cache.get(2)
+        cache.get(3)
+
+        cache.set(4, "4")
+
+        assert cache.get(2) is None
+        assert cache.get(1) == "1"
+        assert cache.get(3) == "3"
+        assert cache.get(4) == "4"
+
+    def test_lfu_selects_victim_after_removals(self):
+        policy = LFUEvictionPolicy[int]()
+
+        for n in range(1, 4):
+            policy.record_insert(n)
+
+        policy.record_access(1)
+        policy.record_access(2)
+        policy.record_access(2)
+
+        assert policy.select_victim() == 3
+
+        policy.record_remove(3)
+
+        assert policy.select_victim() == 1
+
+        policy.record_access(1)
+        policy.record_access(1)
+
+        assert policy.select_victim() == 2
+
+    def test_tiny_lfu_rejects_one_off_records(self):
+        cache = MemoryCache[int, str](max_entries=2, eviction_policy=TinyLFUEvictionPolicy(sketch_width=64))
+
+        cache.set(1, "1")
+        cache.set(2, "2")
+
+        for _ in range(5):
+            cache.get(1)
+            cache.get(2)
+
+        cache.set(3, "3")
+
+        assert cache.get(3) is None
+        assert cache.get(1) == "1"
+        assert cache.get(2) == "2"
+
+        for _ in range(10):
+            cache.get(4)
+
+        cache.set(4, "4")
+
+        assert cache.get(4) == "4"
+        assert cache.size() == 2
+
+    def test_evicts_by_estimated_size(self):
+        cache = MemoryCache[int, str](max_bytes=1000, size_estimator=len)
+
+        cache.set(1, "a" * 400)
+        cache.set(2, "b" * 400)
+        cache.set(3, "c" * 400)
+
+        assert cache.get(1) is None
+        assert cache.get(2) is not None
+        assert cache.get(3) is not None
+        assert cache.total_size == 800
+
+    def test_does_not_store_oversized_record(self):
+        cache = MemoryCache[int, str](max_bytes=100, size_estimator=len)
+
+        cache.set(1, "a" * 50)
+        cache.set(1, "a" * 500)
+
+        assert cache.get(1) is None
+        assert cache.size() == 0
+        assert cache.total_size == 0
+
+    def test_overwrite_does_not_evict_other_records(self):
+        cache = MemoryCache[int, str](max_entries=2)
+
+        cache.set(1, "1")
+        cache.set(2, "2")
+        cache.set(2, "two")
+
+        assert cache.get(1) == "1"
+        assert cache.get(2) == "two"
+
+    def test_removal_and_flush_release_capacity(self):
+        cache = MemoryCache[int, str](max_entries=2, max_bytes=100, size_estimator=len)
+
+        cache.set(1, "a" * 50)
+        cache.set(2, "b" * 50)
+        cache.remove(1)
+
+        assert cache.total_size == 50
+
+        cache.set(3, "c" * 50)
+        assert cache.get(2) is not None
+        assert cache.get(3) is not None
+
+        cache.flush()
+
+        assert cache.size() == 0
+        assert cache.total_size == 0
+
+    @pytest.mark.parametrize("value", ["", "value", b"value" * 10, [1, 2, 3], {"key": ["value"]}])
+    def test_estimates_size(self, value):
+        assert estimate_size(value) > 0
+
+    def test_estimates_nested_object_size(self):
+        class Nested:
+            def __init__(self, payload: str):
+                self.payload = payload
+
+        small = estimate_size(Nested("a"))
+        large = estimate_size(Nested("a" * 10_000))
+
+        assert large - small > 9_000
@@ -0,0 +1,134 @@
+import time
+
+import pytest
+
+from hiero_did_sdk_python.utils.async_cache import AsyncCache
+from hiero_did_sdk_python.utils.cache import MemoryCache
+from hiero_did_sdk_python.utils.cache_stats import CacheEvent, CacheStats, CacheStatsCollector
+from hiero_did_sdk_python.utils.sqlite_cache import SqliteCache
+
+from .common import DictAsyncCache
+
+
+class TestCacheStatsCollector:
+    def test_records_events(self):
+        collector = CacheStatsCollector("test")
+
+        collector.record(CacheEvent.HIT)
+        collector.record(CacheEvent.HIT)
+        collector.record(CacheEvent.MISS)
+        collector.record(CacheEvent.EVICTION, 3)
+        collector.record(CacheEvent.EXPIRATION, 0)
+
+        stats = collector.snapshot()
+
+        assert stats == CacheStats(hits=2, misses=1, evictions=3)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_measures_loads(self):
+        collector = CacheStatsCollector("test")
+
+        with collector.measure_load():
+            time.sleep(0.01)
+
+        with pytest.raises(Exception, match="Load failed"), collector.measure_load():
+            raise Exception("Load failed")
+
+        stats = collector.snapshot()
+
+        assert stats.loads == 2
+        assert stats.load_time >= 0.01
+        assert stats.average_load_time == stats.load_time / 2
+
+    def test_notifies_listeners(self):
+        events = []
+        collector = CacheStatsCollector("test", [lambda name, event, value: events.append((name, event, value))])
+
+        def failing_listener(*_):
+            raise Exception("Listener failed")
+
+        collector.add_listener(failing_listener)
+
+        collector.record(CacheEvent.MISS)
+        collector.record_load(0.5)
+
+        assert events == [("test", CacheEvent.MISS, 1), ("test", CacheEvent.LOAD, 0.5)]
+
+    def test_resets_counters(self):
+        collector = CacheStatsCollector("test")
+
+        collector.record(CacheEvent.HIT)
+        collector.record_load(1)
+        collector.reset()
+
+        assert collector.snapshot() == CacheStats()
+
+
+class TestCacheStats:
+    def test_tracks_memory_cache_stats(self):
+        cache = MemoryCache[str, str](max_entries=2)
+
+        cache.set("a", "a")
+        cache.set("b", "b", 0.01)
+        cache.get("a")
+        cache.get("missing")
+
+        time.sleep(0.02)
+        cache.set("c", "c")
+        cache.set("d", "d")
+
+        stats = cache.stats()
+
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.expirations == 1
+        assert stats.evictions == 1
+        assert stats.entries == 2
+        assert stats.bytes is None
+
+    def test_tracks_memory_cache_bytes(self):
+        cache = MemoryCache[str, str](max_bytes=1024)
+
+        cache.set("a", "value")
+
+        assert cache.stats().bytes > 0
+
+    def test_tracks_sqlite_cache_stats(self):
+        cache = SqliteCache[str, str](":memory:")
+
+        cache.set("a", "value")
+        cache.set("b", "value", 0.01)
+        cache.get_with_expiration("a")
+
+        time.sleep(0.02)
+        cache.commit()
+
+        stats = cache.stats()
+
+        assert stats.hits == 1
+        assert stats.expirations == 1
+        assert stats.entries == 1
+        assert stats.bytes > 0
+
+    def test_notifies_cache_stats_listeners(self):
+        events = []
+        cache = MemoryCache[str, str]()
+        cache.add_stats_listener(lambda name, event, value: events.append((name, event, value)))
+
+        cache.get("missing")
+
+        assert events == [("MemoryCache", CacheEvent.MISS, 1)]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_tracks_async_cache_stats(self):
+        cache: AsyncCache[str, str] = DictAsyncCache[str, str]()
+
+        await cache.set("a", "a")
+        await cache.get("a")
+        await cache.get_many(["a", "missing"])
+
+        stats = await cache.stats()
+
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert stats.entries == 1
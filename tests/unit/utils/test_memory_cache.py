@@ -144,23 +144,28 @@ class TestMemoryCache:
         for n in range(0, 10000 + 1):
             cache.set(n, str(n))
 
+        # Cache lookups are fast, so flush is synchronized with retrieval progress instead of relying on timing
+        halfway_reached = threading.Event()
+        flushed = threading.Event()
+        counts = {"not_nones": 0, "nones": 0}
+
         def _flush():
-            time.sleep(1)
+            halfway_reached.wait()
             cache.flush()
+            flushed.set()
 
         def _get_if_exists():
-            not_nones_count = 0
-            nones_count = 0
             for n in range(0, 10000 + 1):
+                if n == 5000:
+                    halfway_reached.set()
+                    flushed.wait()
+
                 val = cache.get(n)
 
                 if val is not None:
-                    not_nones_count += 1
+                    counts["not_nones"] += 1
                 else:
-                    nones_count += 1
-
-            assert not_nones_count > 0
-            assert nones_count > 0
+                    counts["nones"] += 1
 
         t1 = threading.Thread(target=_flush, args=())
         t2 = threading.Thread(target=_get_if_exists, args=())
@@ -171,6 +176,9 @@ class TestMemoryCache:
         t1.join()
         t2.join()
 
+        assert counts["not_nones"] > 0
+        assert counts["nones"] > 0
+
     def test_short_ttl(self, cache):
         for n in range(0, 10000 + 1):
             cache.set(n, str(n), 0.01)
@@ -179,3 +187,47 @@ class TestMemoryCache:
             val = cache.get(n)
 
             assert val is None
+
+    def test_expired_items_are_removed_from_storage(self, cache):
+        for n in range(0, 100):
+            cache.set(n, str(n), 0.01)
+
+        cache.set(100, "100")
+
+        time.sleep(0.02)
+
+        assert cache.size() == 1
+        assert cache.get(100) == "100"
+        assert len(cache._mem) == 1
+
+    def test_overwritten_item_keeps_latest_ttl(self, cache):
+        cache.set(1, "short", 0.01)
+        cache.set(1, "long")
+
+        time.sleep(0.02)
+
+        assert cache.get(1) == "long"
+        assert cache.size() == 1
+
+    def test_expiration_index_is_compacted(self, cache):
+        for _ in range(100):
+            for n in range(0, 10):
+                cache.set(n, str(n))
+
+        assert cache.size() == 10
+        assert len(cache._expiration_heap) <= 2 * cache.size() + 64
+
+    def test_lock_table_does_not_grow(self, cache):
+        locks_count = len(cache._locks)
+
+        _insert_upto(cache, 10000)
+
+        for n in range(1, 10000 + 1):
+            cache.remove(n)
+
+        assert len(cache._locks) == locks_count
+        assert cache._get_lock(1) is cache._get_lock(1)
+
+    def test_throws_on_invalid_lock_stripes_count(self):
+        with pytest.raises(ValueError, match="Lock stripes count must be positive"):
+            MemoryCache[int, str](lock_stripes_count=0)
@@ -0,0 +1,43 @@
+import time
+
+from hiero_did_sdk_python.utils.negative_cache import NegativeCache
+
+
+class TestNegativeCache:
+    def test_caches_invalid_results_permanently(self):
+        cache = NegativeCache[str, str](not_found_ttl=0.01)
+
+        cache.set_invalid("invalid", "invalid result")
+
+        time.sleep(0.02)
+
+        assert cache.get("invalid") == "invalid result"
+
+    def test_caches_not_found_results_briefly(self):
+        cache = NegativeCache[str, str](not_found_ttl=0.01)
+
+        cache.set_not_found("missing", "not found result")
+
+        assert cache.get("missing") == "not found result"
+
+        time.sleep(0.02)
+
+        assert cache.get("missing") is None
+
+    def test_not_found_caching_can_be_disabled(self):
+        cache = NegativeCache[str, str](not_found_ttl=0)
+
+        cache.set_not_found("missing", "not found result")
+
+        assert cache.get("missing") is None
+        assert cache.size() == 0
+
+    def test_is_bounded(self):
+        cache = NegativeCache[str, str](max_entries=10)
+
+        for n in range(100):
+            cache.set_invalid(str(n), str(n))
+
+        assert cache.size() == 10
+        assert cache.get("99") == "99"
+        assert cache.get("0") is None
@@ -0,0 +1,160 @@
+import threading
+import time
+
+import pytest
+from hiero_sdk_python import Timestamp
+
+from hiero_did_sdk_python.anoncreds.models import AnonCredsSchema
+from hiero_did_sdk_python.utils.cache import TimestampedRecord
+from hiero_did_sdk_python.utils.cache_codec import decode_cache_value, encode_cache_value
+from hiero_did_sdk_python.utils.sqlite_cache import SqliteCache
+
+
+@pytest.fixture(scope="function")
+def db_path(tmp_path):
+    return tmp_path / "cache.db"
+
+
+@pytest.fixture(scope="function")
+def cache(db_path):
+    cache = SqliteCache[str, object](db_path)
+    yield cache
+    cache.close()
+
+
+class TestCacheCodec:
+    def test_roundtrip_builtin_values(self):
+        value = {
+            "list": [1, 2.5, "3", None, True],
+            "tuple": (1, "2"),
+            "bytes": b"\x00\x01",
+            "int_keys": {1: "one"},
+            "__type__": "user data",
+        }
+
+        assert decode_cache_value(encode_cache_value(value)) == value
+
+    def test_roundtrip_sdk_models(self):
+        schema = AnonCredsSchema(name="Test", issuer_id="did:hedera:testnet:zXXX_0.0.1", attr_names=["a"], version="1")
+        value = TimestampedRecord([schema, Timestamp(1, 2)], 100.0)
+
+        decoded = decode_cache_value(encode_cache_value(value))
+
+        assert isinstance(decoded, TimestampedRecord)
+        assert decoded.timestamp == 100.0
+        assert decoded.data[0].get_json_payload() == schema.get_json_payload()
+        assert decoded.data[1].seconds == 1
+        assert decoded.data[1].nanos == 2
+
+    def test_rejects_non_sdk_types(self):
+        with pytest.raises(ValueError, match="is not allowed for cache value decoding"):
+            decode_cache_value(b'{"__type__":"subprocess:Popen","__state__":{}}')
+
+    @pytest.mark.parametrize(
+        "type_name",
+        [
+            # Module imported by SDK module
+            "hiero_did_sdk_python.utils.sqlite_cache:sqlite3.Connection",
+            # Non-SDK type imported by SDK module
+            "hiero_did_sdk_python.utils.sqlite_cache:Path",
+        ],
+    )
+    def test_rejects_foreign_types_reachable_from_sdk_modules(self, type_name, tmp_path):
+        db_path = tmp_path / "foreign.db"
+
+        with pytest.raises(ValueError, match="is not allowed for cache value decoding"):
+            decode_cache_value(f'{{"__type__":"{type_name}","__value__":"{db_path}"}}'.encode())
+
+        assert not db_path.exists()
+
+    def test_does_not_construct_non_enum_sdk_types(self, tmp_path):
+        db_path = tmp_path / "foreign.db"
+
+        with pytest.raises(ValueError, match="is not an enum"):
+            decode_cache_value(
+                f'{{"__type__":"hiero_did_sdk_python.utils.sqlite_cache:SqliteCache","__value__":"{db_path}"}}'.encode()
+            )
+
+        assert not db_path.exists()
+
+
+class TestSqliteCache:
+    def test_insert_retrieve_remove(self, cache):
+        cache.set("a", {"value": 1})
+        cache.set("b", [1, 2, 3])
+
+        assert cache.size() == 2
+        assert cache.get("a") == {"value": 1}
+        assert cache.get("b") == [1, 2, 3]
+
+        cache.remove("a")
+
+        assert cache.get("a") is None
+        assert cache.size() == 1
+
+    def test_insert_flush(self, cache):
+        for n in range(10):
+            cache.set(str(n), n)
+
+        cache.flush()
+
+        assert cache.size() == 0
+        assert cache.get("1") is None
+
+    def test_persists_across_instances(self, db_path):
+        cache = SqliteCache[str, object](db_path, write_batch_size=1000, write_batch_interval=60)
+
+        cache.set("key", TimestampedRecord("value", 1.0))
+        cache.close()
+
+        restored_cache = SqliteCache[str, object](db_path)
+
+        assert restored_cache.get("key") == TimestampedRecord("value", 1.0)
+
+        restored_cache.close()
+
+    def test_buffers_writes_until_batch_is_full(self, db_path):
+        cache = SqliteCache[str, int](db_path, write_batch_size=5, write_batch_interval=60)
+        reader = SqliteCache[str, int](db_path)
+
+        for n in range(4):
+            cache.set(str(n), n)
+
+        # Buffered writes are visible to the same instance only
+        assert cache.get("0") == 0
+        assert reader.get("0") is None
+
+        cache.set("4", 4)
+
+        assert reader.get("0") == 0
+        assert reader.get("4") == 4
+
+        cache.close()
+        reader.close()
+
+    def test_short_ttl(self, cache):
+        cache.set("key", "value", 0.01)
+
+        time.sleep(0.02)
+
+        assert cache.get("key") is None
+        assert cache.size() == 0
+
+    def test_skips_values_that_cannot_be_encoded(self, cache):
+        cache.set("key", threading.Lock())
+
+        assert cache.get("key") is None
+
+    def test_multithread_insertion(self, cache):
+        def _insert_data(thread_id: int):
+            for n in range(100):
+                cache.set(f"{thread_id}-{n}", n)
+
+        threads = [threading.Thread(target=_insert_data, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert cache.size() == 500
+        assert cache.get("3-42") == 42
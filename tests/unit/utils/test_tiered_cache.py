@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+from hiero_did_sdk_python.utils.cache import MemoryCache
+from hiero_did_sdk_python.utils.sqlite_cache import DEFAULT_PERSISTENT_TTL, SqliteCache
+from hiero_did_sdk_python.utils.tiered_cache import TieredCache
+
+from .common import DictAsyncCache
+
+
+@pytest.fixture
+def l2_cache():
+    return MemoryCache[str, str]()
+
+
+@pytest.fixture
+def tiered_cache(l2_cache):
+    return TieredCache[str, str](l2_cache, l1_ttl=60)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestTieredCache:
+    async def test_write_through(self, tiered_cache, l2_cache):
+        await tiered_cache.set("a", "1")
+
+        assert l2_cache.get("a") == "1"
+        assert tiered_cache._l1_cache.get("a") == "1"
+        assert await tiered_cache.get("a") == "1"
+
+    async def test_read_through_promotion(self, tiered_cache, l2_cache):
+        l2_cache.set("a", "1")
+
+        assert tiered_cache._l1_cache.get("a") is None
+        assert await tiered_cache.get("a") == "1"
+        assert tiered_cache._l1_cache.get("a") == "1"
+
+        # Promoted record is served from L1
+        l2_cache.remove("a")
+
+        assert await tiered_cache.get("a") == "1"
+
+    async def test_l1_ttl_is_capped_by_l2_expiration(self, tiered_cache, l2_cache):
+        l2_cache.set("a", "1", 5)
+
+        await tiered_cache.get("a")
+
+        _, l1_expiration = tiered_cache._l1_cache.get_with_expiration("a")
+        _, l2_expiration = l2_cache.get_with_expiration("a")
+
+        assert l1_expiration <= l2_expiration + 0.01
+        assert l1_expiration < time.time() + 60
+
+    async def test_l1_ttl_is_capped_on_write(self, tiered_cache):
+        await tiered_cache.set("a", "1", 0.01)
+
+        time.sleep(0.02)
+
+        assert tiered_cache._l1_cache.get("a") is None
+        assert await tiered_cache.get("a") is None
+
+    async def test_l2_default_ttl_is_applied(self):
+        l2_cache = SqliteCache[str, str](":memory:", write_batch_size=1)
+        tiered_cache = TieredCache[str, str](l2_cache, l1_ttl=60)
+
+        await tiered_cache.set("a", "1")
+
+        _, l1_expiration = tiered_cache._l1_cache.get_with_expiration("a")
+        _, l2_expiration = l2_cache.get_with_expiration("a")
+
+        assert l1_expiration <= time.time() + 60
+        assert l2_expiration > time.time() + DEFAULT_PERSISTENT_TTL - 60
+
+        l2_cache.close()
+
+    async def test_remove_and_flush(self, tiered_cache, l2_cache):
+        await tiered_cache.set("a", "1")
+        await tiered_cache.set("b", "2")
+
+        await tiered_cache.remove("a")
+
+        assert await tiered_cache.get("a") is None
+        assert l2_cache.get("a") is None
+        assert await tiered_cache.size() == 1
+
+        await tiered_cache.flush()
+
+        assert await tiered_cache.get("b") is None
+        assert await tiered_cache.size() == 0
+
+    async def test_async_l2_cache(self):
+        l2_cache = DictAsyncCache[str, str]()
+        tiered_cache = TieredCache[str, str](l2_cache)
+
+        await l2_cache.set("a", "1")
+
+        assert await tiered_cache.get("a") == "1"
+        assert tiered_cache._l1_cache.get("a") == "1"
+
+        await tiered_cache.set("b", "2")
+
+        assert await l2_cache.get("b") == "2"
+        assert await tiered_cache.size() == 2
+
+    async def test_shared_sqlite_l2_cache(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        l2_writer = SqliteCache[str, str](db_path, write_batch_size=1)
+        l2_reader = SqliteCache[str, str](db_path, write_batch_size=1)
+
+        worker_1 = TieredCache[str, str](l2_writer)
+        worker_2 = TieredCache[str, str](l2_reader)
+
+        await worker_1.set("a", "1", 5)
+
+        assert await worker_2.get("a") == "1"
+
+        _, l1_expiration = worker_2._l1_cache.get_with_expiration("a")
+        assert l1_expiration <= time.time() + 5
+
+        l2_writer.close()
+        l2_reader.close()